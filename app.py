@@ -1,25 +1,92 @@
 import os
-import time
 import re
+import time
+import json
+import hmac
+import shlex
 import uuid
-import pandas as pd
-from flask import Flask, render_template, request, jsonify, send_file, session
+from flask import Flask, render_template, request, jsonify, send_file, session, Response, stream_with_context
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
-from urllib.parse import quote_plus
-import io
+from urllib.parse import quote, urlparse, parse_qs
+import atexit
+import queue
 import threading
+from chromedriver_path import resolve_chromedriver
+from collectors import Source, collect
+from discovery_lanes import DiscoveryLanes, Task
+from driver_pool import DriverPool
+from host_filter import HostFilter
+from http_fetch import FetchError, fetch_html, parse_html, looks_like_js_shell, resolve_redirect
+from page_wait import WaitBudget, wait_for_page, wait_for_settle
+from pagination import PaginationController, expected_emails_cover
+from dom_snapshot import take_snapshot, field_texts, first_field
+from resource_blocking import apply_profile, chrome_prefs
+from result_rows import ResultRows
+from job_store import JobStore, STATE_COMPLETED, STATE_DISCOVERING, STATE_EXTRACTING, STATE_FAILED, STATE_QUEUED, STATE_STOPPED
+from scheduler import JobScheduler, QuotaExceeded, JOB_QUEUED, JOB_RUNNING
+from export import iter_csv, write_xlsx
+from metrics import STAGE_SECONDS, record_detail_page, register_gauge, render as render_metrics, stage_timer
+from extraction import EMAIL_RE, extract_fields, find_emails, is_junk_email
+from ttl_cache import TTLCache
+from url_canon import canonical_url, dedup_key, is_redirect_wrapper, unwrap_redirect_param
 
 app = Flask(__name__)
 app.secret_key = os.environ.get('SECRET_KEY', 'your-secret-key-here-change-in-production')
 
-# 세션별 크롤링 결과 저장 (session_id -> {results, status, stop_flag})
+# 세션별 크롤링 결과 저장 (session_id -> {job_id, results, status, stop_flag, updated})
 user_sessions = {}
 
-# 제외할 사이트 목록 (정확한 도메인 매칭)
+# 작업별 크롤링 결과 저장 (job_id -> user_sessions와 같은 형식, 화면에서 시작한 작업은 같은 객체를 공유)
+job_sessions = {}
+
+# /stream 설정
+STREAM_WAIT = 1.0  # 새 결과가 없을 때 진행 상태를 다시 확인하는 간격(초)
+STREAM_HEARTBEAT = 15  # 보낼 이벤트가 없을 때 연결 유지용 주석을 보내는 간격(초)
+
+# /results?since=N 한 번에 돌려주는 행 수 (기본값 / 최대값)
+RESULTS_PAGE_LIMIT = int(os.environ.get('RESULTS_PAGE_LIMIT', 500))
+RESULTS_MAX_LIMIT = int(os.environ.get('RESULTS_MAX_LIMIT', 2000))
+
+# 작업/URL 목록/결과 영구 저장소 (컨테이너가 재시작되어도 이어서 진행)
+CRAWL_DB_PATH = os.environ.get('CRAWL_DB_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'crawler.db'))
+job_store = JobStore(CRAWL_DB_PATH)
+
+# 회사 정보 추출 결과 캐시 (URL/도메인 기준, 세션 간 공유 - 반복 키워드는 재방문하지 않음)
+CACHE_DB_PATH = os.environ.get('CACHE_DB_PATH', os.path.join(os.path.dirname(CRAWL_DB_PATH), 'cache.db'))
+RESULT_CACHE_TTL = int(os.environ.get('RESULT_CACHE_TTL', 7 * 24 * 3600))  # 이메일을 찾은 결과 보관 시간(초)
+RESULT_CACHE_EMPTY_TTL = int(os.environ.get('RESULT_CACHE_EMPTY_TTL', 24 * 3600))  # 이메일이 없는 결과 보관 시간(초)
+result_cache = TTLCache(
+    "company_info", CACHE_DB_PATH,
+    ttl=RESULT_CACHE_TTL,
+    max_entries=int(os.environ.get('RESULT_CACHE_MAX_ENTRIES', 20000)),
+    max_disk_entries=int(os.environ.get('RESULT_CACHE_MAX_DISK_ENTRIES', 200000)),
+)
+
+# 검색 결과 페이지 캐시 ((검색엔진, 키워드, 페이지) -> 링크 목록, 세션 간 공유 - 같은 키워드 재검색 시 브라우저를 쓰지 않음)
+SERP_CACHE_TTL = int(os.environ.get('SERP_CACHE_TTL', 6 * 3600))  # 검색 결과 보관 시간(초)
+serp_cache = TTLCache(
+    "serp", CACHE_DB_PATH,
+    ttl=SERP_CACHE_TTL,
+    max_entries=int(os.environ.get('SERP_CACHE_MAX_ENTRIES', 2000)),
+    max_disk_entries=int(os.environ.get('SERP_CACHE_MAX_DISK_ENTRIES', 50000)),
+)
+
+# 사람인 회사(csn) -> 회사 상세 페이지에서 찾은 정보와 홈페이지 주소 (다시 나온 회사는 사람인 페이지를 열지 않음)
+SARAMIN_COMPANY_CACHE_TTL = int(os.environ.get('SARAMIN_COMPANY_CACHE_TTL', 30 * 24 * 3600))  # 회사 정보는 잘 바뀌지 않으므로 길게 보관
+saramin_company_cache = TTLCache(
+    "saramin_company", CACHE_DB_PATH,
+    ttl=SARAMIN_COMPANY_CACHE_TTL,
+    max_entries=int(os.environ.get('SARAMIN_COMPANY_CACHE_MAX_ENTRIES', 10000)),
+    max_disk_entries=int(os.environ.get('SARAMIN_COMPANY_CACHE_MAX_DISK_ENTRIES', 200000)),
+)
+
+# 광고 클릭 추적 URL -> 실제 랜딩 URL (한 번 푼 결과는 재사용)
+REDIRECT_CACHE_TTL = int(os.environ.get('REDIRECT_CACHE_TTL', 7 * 24 * 3600))
+redirect_cache = TTLCache("redirect", CACHE_DB_PATH, ttl=REDIRECT_CACHE_TTL, max_entries=5000, max_disk_entries=100000)
+
+# 제외할 사이트 목록 (호스트 접미사 매칭 - "go.kr"은 www.gov.go.kr과 일치, lego.kr과는 불일치)
 EXCLUDE_DOMAINS = [
     # 네이버/다음/카카오
     "naver.com", "naver.me", "daum.net", "kakao.com",
@@ -52,27 +119,49 @@ EXCLUDE_DOMAINS = [
 ]
 
 
+# 회사 사이트가 아닌 페이지의 URL 경로 조각 (블로그/카페/뉴스 기사)
+EXCLUDE_PATHS = ["/blog/", "/cafe/", "/article/", "/news/"]
+
+# 추가 제외 목록 파일 (한 줄에 하나, 형식은 host_filter.parse_rules - 파일을 고치면 실행 중에도 다시 읽음)
+EXCLUDE_DOMAINS_FILE = os.environ.get('EXCLUDE_DOMAINS_FILE') or None
+company_url_filter = HostFilter(EXCLUDE_DOMAINS + EXCLUDE_PATHS, source_file=EXCLUDE_DOMAINS_FILE)
+
+
 def is_valid_company_url(url):
-    """회사 웹사이트로 적합한 URL인지 확인 (더 정교한 필터링)"""
-    url_lower = url.lower()
-    
-    # 정확한 도메인 매칭
-    for domain in EXCLUDE_DOMAINS:
-        # 도메인이 URL에 정확히 포함되어 있는지 확인
-        if domain in url_lower:
-            return False
-    
-    # 블로그 패턴 제외 (blog가 URL 경로에 있는 경우)
-    if "/blog/" in url_lower or "/cafe/" in url_lower:
-        return False
-    
-    # 뉴스 기사 패턴 제외 (article, news 경로)
-    if "/article/" in url_lower or "/news/" in url_lower:
-        return False
-    
-    return True
+    """회사 웹사이트로 적합한 URL인지 확인 (제외 도메인/경로 필터)"""
+    return company_url_filter.is_allowed(url)
+
+
+# Chrome 추가 실행 옵션 (공백으로 구분, 예: "--headless=new --host-resolver-rules='MAP x 127.0.0.1'")
+CHROME_EXTRA_ARGS = shlex.split(os.environ.get('CHROME_EXTRA_ARGS', ''))
+CHROME_LEAN = os.environ.get('CHROME_LEAN', '1') != '0'  # 메모리 절약 옵션 사용 (0이면 기본 Chrome 설정)
+CHROME_RENDERER_LIMIT = int(os.environ.get('CHROME_RENDERER_LIMIT', 2))  # 드라이버당 렌더러 프로세스 수 상한
+CHROME_JS_HEAP_MB = int(os.environ.get('CHROME_JS_HEAP_MB', 0))  # 페이지별 JS 힙 상한(MB, 0이면 Chrome 기본값)
+CHROME_WINDOW_SIZE = os.environ.get('CHROME_WINDOW_SIZE', '1920,1080')
+
+# 크롤링에 필요 없는 백그라운드 작업/캐시/프로세스 분리를 끄는 옵션
+# (사이트 격리를 끄면 사이트마다 렌더러를 새로 띄우지 않으므로 renderer-process-limit이 실제로 적용됨)
+CHROME_LEAN_ARGS = [
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--disk-cache-size=1",
+    "--media-cache-size=1",
+    "--aggressive-cache-discard",
+    "--disable-site-isolation-trials",
+    "--disable-features=Translate,OptimizationHints,MediaRouter,BackForwardCache,site-per-process,IsolateOrigins",
+    f"--renderer-process-limit={CHROME_RENDERER_LIMIT}",
+]
+if CHROME_JS_HEAP_MB:
+    CHROME_LEAN_ARGS.append(f"--js-flags=--max-old-space-size={CHROME_JS_HEAP_MB}")
 
 
+@STAGE_SECONDS.timed(stage="driver_init")
 def setup_driver():
     print("[드라이버 초기화] 시작...")
     chrome_options = Options()
@@ -105,7 +194,6 @@ def setup_driver():
     # 로컬 Windows 환경에서는 headless 비활성화 (브라우저 창이 보이도록)
     if is_railway or is_docker:
         chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--single-process")
         print("[드라이버 초기화] 서버 환경 감지: 헤드리스 모드 활성화")
     else:
         print("[드라이버 초기화] 로컬 환경: 헤드리스 모드 비활성화 (브라우저 창 표시)")
@@ -113,40 +201,34 @@ def setup_driver():
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_argument("--disable-dev-shm-usage")
     chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument(f"--window-size={CHROME_WINDOW_SIZE}")
     chrome_options.add_argument("--disable-extensions")
     chrome_options.add_argument("--disable-infobars")
     chrome_options.add_argument("--disable-setuid-sandbox")
-    chrome_options.add_argument("--remote-debugging-port=9222")  # 디버깅 포트 추가
+    # 디버깅 포트는 지정하지 않음 - ChromeDriver가 드라이버마다 빈 포트를 골라서 연결하므로
+    # 한 컨테이너에서 여러 드라이버를 띄워도 충돌하지 않음
     chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+    if CHROME_LEAN:
+        for argument in CHROME_LEAN_ARGS:
+            chrome_options.add_argument(argument)
+    for argument in CHROME_EXTRA_ARGS:
+        chrome_options.add_argument(argument)
+    # 이미지/알림 등 모든 출처에서 필요 없는 리소스는 브라우저 설정으로 차단 (출처별 차단은 resource_blocking.apply_profile)
+    chrome_options.add_experimental_option("prefs", chrome_prefs())
     
     print("[드라이버 초기화] ChromeDriver 준비 중...")
     
-    service = None
-    
-    # 방법 1: 시스템 PATH에 있는 chromedriver 사용 시도
-    import shutil
-    chromedriver_in_path = shutil.which("chromedriver")
-    if chromedriver_in_path:
-        print(f"[드라이버 초기화] 시스템 PATH에서 ChromeDriver 발견: {chromedriver_in_path}")
-        service = Service(chromedriver_in_path)
-        print("[드라이버 초기화] 시스템 ChromeDriver 사용")
-    else:
-        # 방법 2: ChromeDriverManager 사용 (간단하고 직접적으로)
-        print("[드라이버 초기화] ChromeDriverManager로 드라이버 다운로드 시도...")
-        try:
-            # 직접 호출 (타임아웃은 외부에서 처리)
-            driver_path = ChromeDriverManager().install()
-            print(f"[드라이버 초기화] ChromeDriver 다운로드 완료: {driver_path}")
-            service = Service(driver_path)
-        except Exception as e:
-            print(f"[드라이버 초기화] ChromeDriverManager 실패: {e}")
-            import traceback
-            print(traceback.format_exc())
-            raise Exception(f"ChromeDriver 준비 실패: {e}\n해결 방법: ChromeDriver를 수동으로 설치하거나 시스템 PATH에 추가해주세요.\n다운로드: https://chromedriver.chromium.org/")
-    
-    if service is None:
-        raise Exception("ChromeDriver 서비스를 초기화할 수 없습니다.")
+    # 경로는 프로세스당 한 번만 찾음 (캐시 파일/시스템 PATH, 둘 다 없을 때만 ChromeDriverManager 다운로드)
+    try:
+        chromedriver = resolve_chromedriver(chrome_options.binary_location or None)
+        driver_path = chromedriver["path"]
+        service = Service(driver_path)
+        print(f"[드라이버 초기화] ChromeDriver 사용: {driver_path} (버전 {chromedriver['version']}, {chromedriver['source']})")
+    except Exception as e:
+        print(f"[드라이버 초기화] ChromeDriver 준비 실패: {e}")
+        import traceback
+        print(traceback.format_exc())
+        raise Exception(f"ChromeDriver 준비 실패: {e}\n해결 방법: ChromeDriver를 수동으로 설치하거나 시스템 PATH에 추가해주세요.\n다운로드: https://chromedriver.chromium.org/")
     
     print("[드라이버 초기화] 브라우저 시작 중...")
     
@@ -185,700 +267,758 @@ def setup_driver():
         raise Exception(f"Chrome 브라우저 시작 실패: {error_msg}")
 
 
-def get_naver_links(driver, keyword, pages=5, max_urls=0):
-    """네이버 웹 검색에서 링크 수집 (목표 개수에 도달할 때까지 페이지 확장)"""
-    links = []
-    current_page = 1
-    max_pages = pages * 3  # 최대 3배까지 확장 가능
-    
-    while current_page <= max_pages:
-        # 네이버 검색 URL 형식 (사용자가 제공한 형식 사용)
-        if current_page == 1:
-            url = f"https://search.naver.com/search.naver?where=nexearch&sm=top_hty&fbm=0&ie=utf8&query={quote_plus(keyword)}"
-        else:
-            start = (current_page - 1) * 10 + 1
-            url = f"https://search.naver.com/search.naver?nso=&page={current_page}&query={quote_plus(keyword)}&sm=tab_pge&ssc=tab.ur.all&start={start}"
-        
-        print(f"[네이버] 페이지 {current_page} 크롤링 중: {url}")
-        driver.get(url)
-        time.sleep(3)  # 페이지 로딩 대기
-        
-        page_links_count = len(links)
-        
-        # 1. 파워링크 광고에서 링크 추출 (가장 중요!)
-        print(f"[네이버] 파워링크 광고 링크 추출 시작...")
-        powerlink_selectors = [
-            ".powerlink_area a",
-            ".ad_powerlink a",
-            ".power_link a",
-            "[class*='powerlink'] a",
-            "[class*='power_link'] a",
-            "[id*='powerlink'] a",
-            "[id*='power_link'] a",
-            ".ad_area a",
-            ".ad_section a",
-        ]
-        
-        for selector in powerlink_selectors:
-            try:
-                powerlink_ads = driver.find_elements(By.CSS_SELECTOR, selector)
-                print(f"[네이버] 파워링크 선택자 ({selector}): {len(powerlink_ads)}개 발견")
-                for ad in powerlink_ads:
-                    try:
-                        href = ad.get_attribute("href")
-                        if href and href.startswith("http"):
-                            # 네이버 링크 제외
-                            if "naver.com" not in href.lower() and "search.naver" not in href.lower():
-                                if is_valid_company_url(href):
-                                    if href not in links:
-                                        links.append(href)
-                                        print(f"[네이버] 파워링크 링크 추가: {href}")
-                    except:
-                        pass
-            except:
-                pass
-        
-        # 2. 파워링크 영역에서 URL 텍스트 직접 추출
-        try:
-            powerlink_areas = driver.find_elements(By.CSS_SELECTOR, ".powerlink_area, .ad_powerlink, [class*='powerlink'], [class*='power_link']")
-            print(f"[네이버] 파워링크 영역 {len(powerlink_areas)}개 발견")
-            for area in powerlink_areas:
-                try:
-                    # 영역 내의 모든 텍스트에서 URL 패턴 찾기
-                    area_text = area.text
-                    area_html = area.get_attribute("innerHTML") or ""
-                    
-                    # URL 패턴 찾기 (http:// 또는 https://로 시작)
-                    url_pattern = r'https?://[^\s<>"\']+[^\s<>"\'.,;!?]'
-                    found_urls = re.findall(url_pattern, area_text + " " + area_html)
-                    
-                    for found_url in found_urls:
-                        # 네이버 링크 제외
-                        if "naver.com" not in found_url.lower() and "search.naver" not in found_url.lower():
-                            if is_valid_company_url(found_url):
-                                if found_url not in links:
-                                    links.append(found_url)
-                                    print(f"[네이버] 파워링크 텍스트에서 URL 추출: {found_url}")
-                except:
-                    pass
-        except:
-            pass
-        
-        # 3. 네이버 웹 검색 결과의 다양한 선택자
-        print(f"[네이버] 일반 검색 결과 링크 추출 시작...")
-        selectors = [
+# 검색 URL 템플릿 ({query}: URL 인코딩한 검색어, {page}: 페이지 번호, {start}: 네이버 결과 시작 순번)
+# 벤치마크(bench/bench_crawl.py)는 로컬 코퍼스 서버 주소로 바꿔서 실행
+NAVER_SEARCH_URL = os.environ.get('NAVER_SEARCH_URL', "https://search.naver.com/search.naver?where=nexearch&sm=top_hty&fbm=0&ie=utf8&query={query}")
+NAVER_SEARCH_PAGE_URL = os.environ.get('NAVER_SEARCH_PAGE_URL', "https://search.naver.com/search.naver?nso=&page={page}&query={query}&sm=tab_pge&ssc=tab.ur.all&start={start}")
+DAUM_SEARCH_URL = os.environ.get('DAUM_SEARCH_URL', "https://search.daum.net/search?w=web&q={query}&p={page}")
+SARAMIN_SEARCH_URL = os.environ.get('SARAMIN_SEARCH_URL', "https://www.saramin.co.kr/zf_user/search?search_area=main&search_done=y&search_optional_item=n&searchType=search&searchword={query}&recruitPage={page}")
+JOBKOREA_SEARCH_URL = os.environ.get('JOBKOREA_SEARCH_URL', "https://www.jobkorea.co.kr/Search/?stext={query}&tabType=recruit&Page_No={page}")
+ALBAMON_SEARCH_URL = os.environ.get('ALBAMON_SEARCH_URL', "https://www.albamon.com/list/gi/mon_list.asp?keyword={query}&page={page}")
+
+# 페이지 준비 판단용 선택자 (하나라도 나타나면 로딩 완료로 간주)
+NAVER_READY_SELECTORS = ["#main_pack", ".powerlink_area", "a.link_tit", "div.total_wrap"]
+DAUM_READY_SELECTORS = ["#daumContent", "div.c-item", "a.f_link_b"]
+SARAMIN_READY_SELECTORS = ["a[href*='/zf_user/company']", ".item_recruit", ".content_none"]
+SARAMIN_DETAIL_READY_SELECTORS = [".company_name", ".company_info", "dl.info_list", "h1"]
+# csn으로 바로 연 회사 상세 페이지가 제대로 떴는지 확인하는 선택자 (h1은 오류 페이지에도 있어서 제외)
+SARAMIN_DIRECT_READY_SELECTORS = [".company_name", ".company_info", "dl.info_list"]
+JOBKOREA_READY_SELECTORS = [".list-post", ".list-default", "a[href*='/company']"]
+ALBAMON_READY_SELECTORS = [".gListWrap", ".company_name", "a[href*='gi_view']"]
+
+# 상세 페이지 추출용 선택자
+SARAMIN_COMPANY_SELECTORS = [
+    "h1.company_name", "div.company_name", ".company_name", "h2.company_name",
+    "span.company_name", "strong.company_name", ".company_info h1", ".company_info .company_name",
+    ".company_header h1", ".company_header .company_name", "h1[class*='company']",
+    ".item_company h1", ".item_company .company_name", "div[class*='company_name']",
+]
+SARAMIN_INFO_SECTION = ".company_info, .company-detail, .company_detail, .info_list, dl.info_list, .company-detail-info"
+JOBKOREA_COMPANY_SELECTORS = ["h1.company_name", ".company_name", "div.company_info h2", ".company_title", "h2.company_title"]
+ALBAMON_COMPANY_SELECTORS = ["h1.company_name", ".company_name", ".company_title", "div.company_info h2", "h2.company_name"]
+HOMEPAGE_COMPANY_SELECTORS = [
+    "h1", "h2", ".company_name", ".corp_name", ".site-title", ".logo",
+    "[class*='company']", "[class*='corp']", ".brand", ".site-name",
+]
+# 홈페이지 후보에서 제외할 호스트
+HOMEPAGE_EXCLUDE_HOSTS = ['saramin', 'jobkorea', 'albamon', 'facebook', 'twitter', 'instagram', 'linkedin', 'youtube']
+
+# 채용 사이트 자체 이메일 (회사 연락처가 아님)
+PORTAL_EMAIL_EXCLUDE = ('jobkorea', 'saramin', 'albamon')
+# filter_emails 에서 추가로 제외할 예시/테스트용 이메일
+PLACEHOLDER_EMAIL_EXCLUDE = ('example.com', 'test.com', 'sample.com', 'placeholder')
+
+# 사람인 상세 페이지 텍스트에서 홈페이지 주소 찾기 (앞의 패턴이 우선)
+SARAMIN_HOMEPAGE_PATTERNS = [
+    re.compile(r'홈페이지\s*[:\s]\s*(https?://[^\s\n\r]+)'),
+    re.compile(r'홈페이지\s*[:\s]\s*(www\.[^\s\n\r]+)'),
+    re.compile(r'홈페이지[^\n]*?(https?://[^\s\n\r]+)'),
+]
+
+URL_IN_TEXT_RE = re.compile(r'https?://[^\s<>"\']+[^\s<>"\'.,;!?]')
+SARAMIN_ONCLICK_COMPANY_RE = re.compile(r'/zf_user/company/[^\s\'"]+')
+
+# 세션 간 공유하는 브라우저 풀 (동시에 뜨는 Chrome 개수 제한)
+DRIVER_POOL_SIZE = int(os.environ.get('DRIVER_POOL_SIZE', 2))
+DRIVER_MAX_PAGES = int(os.environ.get('DRIVER_MAX_PAGES', 300))  # N페이지 방문 후 드라이버 재생성
+DRIVER_ACQUIRE_TIMEOUT = int(os.environ.get('DRIVER_ACQUIRE_TIMEOUT', 300))  # 풀이 가득 찼을 때 최대 대기 시간(초)
+DRIVER_MAX_RSS_MB = int(os.environ.get('DRIVER_MAX_RSS_MB', 1024))  # 드라이버(Chrome 전체) 메모리가 이보다 크면 재생성 (0이면 감시 안 함)
+DRIVER_RSS_CHECK_INTERVAL = float(os.environ.get('DRIVER_RSS_CHECK_INTERVAL', 10))  # 드라이버 메모리 측정 간격(초)
+DRIVER_BLANK_EVERY = int(os.environ.get('DRIVER_BLANK_EVERY', 0))  # N페이지마다 about:blank로 비움 (0이면 안 함)
+
+EXTRA_WORKER_ACQUIRE_TIMEOUT = int(os.environ.get('EXTRA_WORKER_ACQUIRE_TIMEOUT', 30))  # 추가 작업자용 드라이버 대기 시간(초)
+MAX_WORKERS = int(os.environ.get('MAX_WORKERS', DRIVER_POOL_SIZE))  # 요청당 최대 병렬 작업자 수
+URL_QUEUE_SIZE = int(os.environ.get('URL_QUEUE_SIZE', 50))  # 처리 대기 URL이 이만큼 쌓이면 다음 검색 페이지를 미룸
+SCHEDULER_MAX_RUNNING = int(os.environ.get('SCHEDULER_MAX_RUNNING', DRIVER_POOL_SIZE))  # 동시에 실행할 작업 수 (작업마다 브라우저 최소 1개)
+SCHEDULER_USER_QUOTA = int(os.environ.get('SCHEDULER_USER_QUOTA', 5))  # 사용자별 대기/실행 작업 수 제한 (0이면 제한 없음)
+SCHEDULER_MAX_QUEUED = int(os.environ.get('SCHEDULER_MAX_QUEUED', 100))  # 전체 대기 작업 수 제한
+API_SHARED_SECRET = os.environ.get('API_SHARED_SECRET', '')  # 대시보드 등이 X-Api-Key로 이 값을 보내면 X-User-Id 헤더를 사용자로 인정 (비어 있으면 헤더 무시)
+
+HTTP_FIRST = os.environ.get('HTTP_FIRST', '1') != '0'  # 일반 홈페이지는 HTTP로 먼저 시도 (0이면 항상 브라우저)
+
+driver_pool = DriverPool(setup_driver, max_size=DRIVER_POOL_SIZE, max_pages=DRIVER_MAX_PAGES,
+                         max_rss=DRIVER_MAX_RSS_MB * 1024 * 1024, rss_interval=DRIVER_RSS_CHECK_INTERVAL,
+                         blank_every=DRIVER_BLANK_EVERY)
+atexit.register(driver_pool.shutdown)
+
+
+SARAMIN_BASE_URL = "https://www.saramin.co.kr"
+SARAMIN_COMPANY_DETAIL_PATH = "/zf_user/company/view"  # csn으로 바로 여는 회사 상세 페이지
+SARAMIN_DIRECT_MAX_MISSES = int(os.environ.get('SARAMIN_DIRECT_MAX_MISSES', 3))  # 회사 상세 페이지를 바로 열지 못한 횟수가 연속으로 이만큼이면 잠시 바로 열지 않음 (0이면 계속 시도)
+SARAMIN_DIRECT_RETRY = int(os.environ.get('SARAMIN_DIRECT_RETRY', 3600))  # 바로 열기를 멈춘 뒤 다시 시도하기까지 (초)
+SOURCE_CONCURRENCY = int(os.environ.get('SOURCE_CONCURRENCY', 2))  # 출처별로 동시에 여는 검색 페이지 수 (모든 작업 합계, 0이면 제한 없음)
+
+
+def search_result_link(href, onclick=""):
+    """웹 검색(네이버/다음) 결과 링크 - 광고 추적 URL은 그대로 두고(canonicalize_links에서 풂) 회사 사이트만"""
+    if not href.startswith("http"):
+        return None
+    if is_redirect_wrapper(href) or is_valid_company_url(href):
+        return href
+    return None
+
+
+def saramin_company_link(href, onclick=""):
+    """사람인 회사 정보 링크 (company-info/view 또는 company/...) - onclick("기업정보" 버튼)에 있는 주소도 사용"""
+    if not href or "/zf_user/company" not in href:
+        match = SARAMIN_ONCLICK_COMPANY_RE.search(onclick) if "/zf_user/company" in onclick else None
+        if not match:
+            return None
+        href = SARAMIN_BASE_URL + match.group(0)
+    if href.startswith("/"):
+        href = SARAMIN_BASE_URL + href
+    # 쿼리 파라미터는 유지 (csn 파라미터가 중요함)
+    href = href.split("#")[0].rstrip("/")
+    parsed = urlparse(href)
+    if "saramin.co.kr" not in parsed.netloc:
+        return None
+    if parsed.path.startswith("/zf_user/company-info/view"):
+        return href
+    # company-review, jobs 등은 제외하고 /zf_user/company/ 아래 회사 상세 페이지만
+    if parsed.path.startswith("/zf_user/company/"):
+        return href
+    return None
+
+
+def job_site_company_link(domain, markers):
+    """채용 사이트(잡코리아/알바몬) 회사 링크 판별 함수 - 도메인 안의 주소 중 markers 중 하나가 들어 있는 것만"""
+    def normalize(href, onclick=""):
+        if href.startswith("/"):
+            href = f"https://www.{domain}{href}"
+        if domain not in href:
+            return None
+        href_lower = href.lower()
+        return href if any(marker in href_lower for marker in markers) else None
+    return normalize
+
+
+# 검색 출처 정의 (수집 루프는 collectors.collect 공용 - 출처를 추가/조정할 때는 여기만 수정)
+SOURCES = {
+    "naver": Source(
+        "naver", "네이버", NAVER_SEARCH_PAGE_URL, NAVER_READY_SELECTORS,
+        link_selectors=[
+            # 1. 파워링크 광고 (가장 중요!)
+            ".powerlink_area a", ".ad_powerlink a", ".power_link a",
+            "[class*='powerlink'] a", "[class*='power_link'] a",
+            "[id*='powerlink'] a", "[id*='power_link'] a",
+            ".ad_area a", ".ad_section a",
+            # 2. 웹 검색 결과
             "a.link_tit", "div.total_tit a", "a.total_tit", "a.title_link",
             "div.web_item a.link", "div.lst_view a", "div.api_txt_lines a",
             "div.total_wrap a", "li.bx a",
             "a[href^='http']:not([href*='naver.com']):not([href*='search.naver'])",
-        ]
-        
-        for selector in selectors:
-            try:
-                results = driver.find_elements(By.CSS_SELECTOR, selector)
-                for res in results:
-                    href = res.get_attribute("href")
-                    if href and href.startswith("http") and is_valid_company_url(href):
-                        if "naver.com" not in href and "search.naver" not in href:
-                            if href not in links:
-                                links.append(href)
-            except:
-                pass
-        
-        print(f"[네이버] 페이지 {current_page}에서 {len(links) - page_links_count}개 링크 발견 (총 {len(links)}개)")
-        
-        # 목표 개수에 도달했거나, 기본 페이지 범위를 넘었는데 새 링크가 없으면 중단
-        if max_urls > 0 and len(links) >= max_urls:
-            break
-        
-        # 기본 페이지 범위를 넘었는데 새 링크가 없으면 중단
-        if current_page > pages and len(links) == page_links_count:
-            break
-        
-        try:
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
-        except:
-            pass
-        
-        current_page += 1
+        ],
+        normalize=search_result_link,
+        first_page_url=NAVER_SEARCH_URL,
+        # 파워링크 영역에 링크 없이 표시된 URL 텍스트
+        text_selectors=[".powerlink_area, .ad_powerlink, [class*='powerlink'], [class*='power_link']"],
+        text_url_re=URL_IN_TEXT_RE,
+        cache=serp_cache,
+        max_concurrency=SOURCE_CONCURRENCY,
+    ),
+    "daum": Source(
+        "daum", "다음", DAUM_SEARCH_URL, DAUM_READY_SELECTORS,
+        link_selectors=[
+            "a.f_link_b", "div.wrap_tit a", "a.link_txt", "div.c-tit a", "div.c-item a",
+            "a[href^='http']:not([href*='daum.net']):not([href*='kakao'])",
+        ],
+        normalize=search_result_link,
+        cache=serp_cache,
+        max_concurrency=SOURCE_CONCURRENCY,
+    ),
+    "saramin": Source(
+        "saramin", "사람인", SARAMIN_SEARCH_URL, SARAMIN_READY_SELECTORS,
+        link_selectors=["a[href*='/zf_user/company']", "a[onclick*='/zf_user/company']", "button[onclick*='/zf_user/company']"],
+        normalize=saramin_company_link,
+        cache=serp_cache,
+        max_concurrency=SOURCE_CONCURRENCY,
+        http=True,
+    ),
+    "jobkorea": Source(
+        "jobkorea", "잡코리아", JOBKOREA_SEARCH_URL, JOBKOREA_READY_SELECTORS,
+        link_selectors=[
+            "a[href*='/company']", "a.company_name", ".company_name a", "div.company_name a",
+            "a[href*='company_view']", "a[href*='Company']",
+        ],
+        normalize=job_site_company_link("jobkorea.co.kr", ("company",)),
+        next_selector=".paging a.next, .paging .next",
+        cache=serp_cache,
+        max_concurrency=SOURCE_CONCURRENCY,
+        http=True,
+    ),
+    "albamon": Source(
+        "albamon", "알바몬", ALBAMON_SEARCH_URL, ALBAMON_READY_SELECTORS,
+        link_selectors=[
+            "a[href*='company']", "a.company_name", ".company_name a", "div.company_name a", "a[href*='gi_view']",
+        ],
+        normalize=job_site_company_link("albamon.com", ("company", "gi_view")),
+        next_selector=".paging a.next, .paging .next",
+        cache=serp_cache,
+        max_concurrency=SOURCE_CONCURRENCY,
+        http=True,
+    ),
+}
+
+DISCOVERY_SOURCES = [name.strip() for name in os.environ.get('DISCOVERY_SOURCES', 'naver,daum,saramin,jobkorea,albamon').split(',')
+                     if name.strip() in SOURCES]  # 키워드마다 검색할 출처 (앞의 출처부터 시작)
+DISCOVERY_BROWSER_LANES = int(os.environ.get('DISCOVERY_BROWSER_LANES', max(1, DRIVER_POOL_SIZE - 1)))  # 검색에 쓰는 최대 브라우저 수 (작업 드라이버 포함, 기본값은 상세 페이지 작업자용으로 풀에 하나를 남김)
+DISCOVERY_HTTP_LANES = int(os.environ.get('DISCOVERY_HTTP_LANES', 3))  # 브라우저 없이 HTTP로 검색하는 동시 작업 수 (0이면 모두 브라우저)
+DISCOVERY_LANE_ACQUIRE_TIMEOUT = int(os.environ.get('DISCOVERY_LANE_ACQUIRE_TIMEOUT', 5))  # 추가 브라우저 레인용 드라이버 대기 시간(초)
+
+
+def get_naver_links(driver, keyword, pages=5, max_urls=0, on_links=None, should_stop=None, controller=None):
+    """네이버 웹 검색에서 링크 수집 (파워링크 포함, 목표 개수에 도달할 때까지 페이지 확장)
     
-    return list(set(links))
+    on_links: 페이지마다 새로 찾은 링크 목록을 바로 넘겨받는 콜백 (다른 수집 함수도 동일)
+    should_stop: 참을 반환하면 다음 페이지로 넘어가지 않고 중단
+    controller: 여러 출처가 페이지 예산을 나눠 쓸 때의 PaginationController
+    """
+    return collect(driver, SOURCES["naver"], keyword, pages, max_urls, on_links, should_stop, controller)
+
 
+def get_daum_links(driver, keyword, pages=5, max_urls=0, on_links=None, should_stop=None, controller=None):
+    """다음 웹 검색에서 링크 수집"""
+    return collect(driver, SOURCES["daum"], keyword, pages, max_urls, on_links, should_stop, controller)
 
-def get_daum_links(driver, keyword, pages=5, max_urls=0):
-    """다음 웹 검색에서 링크 수집 (목표 개수에 도달할 때까지 페이지 확장)"""
-    links = []
-    current_page = 1
-    max_pages = pages * 3  # 최대 3배까지 확장 가능
+
+def get_saramin_company_links(driver, keyword, pages=10, max_urls=0, on_links=None, should_stop=None, controller=None):
+    """사람인 사이트에서 회사 검색하여 회사 상세 페이지 링크 수집"""
+    return collect(driver, SOURCES["saramin"], keyword, pages, max_urls, on_links, should_stop, controller)
+
+
+def get_jobkorea_company_links(driver, keyword, pages=10, max_urls=0, on_links=None, should_stop=None, controller=None):
+    """잡코리아 사이트에서 회사 검색하여 회사 상세 페이지 링크 수집"""
+    return collect(driver, SOURCES["jobkorea"], keyword, pages, max_urls, on_links, should_stop, controller)
+
+
+def get_albamon_company_links(driver, keyword, pages=10, max_urls=0, on_links=None, should_stop=None, controller=None):
+    """알바몬 사이트에서 회사 검색하여 회사 상세 페이지 링크 수집"""
+    return collect(driver, SOURCES["albamon"], keyword, pages, max_urls, on_links, should_stop, controller)
+
+
+def parse_company_fields(info, body_text, body_html=""):
+    """페이지 텍스트에서 이메일/회사명/대표자명/주소 추출 (브라우저/HTTP 경로 공용)"""
+    with stage_timer("extraction"):
+        fields = extract_fields(body_text, body_html, email_exclude=PORTAL_EMAIL_EXCLUDE)
+    # 이메일/회사명은 이미 찾은 경우 유지, 대표자명/주소는 찾은 값으로 갱신
+    for key in ("이메일", "회사명"):
+        if not info[key] and fields[key]:
+            info[key] = fields[key]
+    for key in ("대표자명", "회사주소"):
+        if fields[key]:
+            info[key] = fields[key]
+    return info
+
+
+def needs_browser(url):
+    """브라우저 렌더링이 반드시 필요한 URL인지 (채용 사이트 상세 페이지는 여러 단계 이동이 필요)"""
+    return detail_source(url) != "web"
+
+
+def detail_source(url):
+    """상세 페이지 출처 (saramin / jobkorea / albamon / web) - 지표 레이블용"""
+    url_lower = url.lower()
+    for site, source in (("saramin.co.kr", "saramin"), ("jobkorea.co.kr", "jobkorea"), ("albamon.com", "albamon")):
+        if site in url_lower:
+            return source
+    return "web"
+
+
+@STAGE_SECONDS.timed(stage="detail_http", source="web")
+def extract_company_info_http(url):
+    """HTTP로 정적 HTML만 받아서 회사 정보 추출 (브라우저 없이)
     
-    while current_page <= max_pages:
-        url = f"https://search.daum.net/search?w=web&q={quote_plus(keyword)}&p={current_page}"
-        driver.get(url)
-        time.sleep(2)
-        
-        page_links_count = len(links)
-        
-        # 다음 웹 검색 결과 선택자
-        selectors = [
-            "a.f_link_b",           # 웹문서 제목 링크
-            "div.wrap_tit a",       # 제목 링크
-            "a.link_txt",           # 텍스트 링크
-            "div.c-tit a",          # 컨텐츠 제목
-            "div.c-item a",         # 아이템 링크
-            "a[href^='http']:not([href*='daum.net']):not([href*='kakao'])",
-        ]
-        
-        for selector in selectors:
-            try:
-                results = driver.find_elements(By.CSS_SELECTOR, selector)
-                for res in results:
-                    href = res.get_attribute("href")
-                    if href and href.startswith("http") and is_valid_company_url(href):
-                        if "daum.net" not in href and "kakao.com" not in href:
-                            if href not in links:
-                                links.append(href)
-            except:
-                pass
-        
-        # 목표 개수에 도달했거나, 기본 페이지 범위를 넘었는데 새 링크가 없으면 중단
-        if max_urls > 0 and len(links) >= max_urls:
-            break
-        
-        # 기본 페이지 범위를 넘었는데 새 링크가 없으면 중단
-        if current_page > pages and len(links) == page_links_count:
-            break
-        
-        try:
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
-        except:
-            pass
-        
-        current_page += 1
+    JS로 그려지는 페이지이거나 아무 정보도 찾지 못하면 None을 반환 → 브라우저 경로로 재시도
+    """
+    try:
+        final_url, html = fetch_html(url)
+    except FetchError as e:
+        print(f"[HTTP] 가져오기 실패, 브라우저로 전환: {url} ({e})")
+        return None
+    
+    title, body_text, script_count = parse_html(html)
+    info = empty_company_info(url)
+    info["사이트명"] = title
+    parse_company_fields(info, body_text, html)
     
-    return list(set(links))
+    # 이메일을 찾았으면 그대로 사용, 아니면 JS 렌더링 여부/추출 결과를 보고 브라우저로 넘김
+    if not info["이메일"]:
+        if looks_like_js_shell(html, body_text, script_count):
+            print(f"[HTTP] JS 렌더링 페이지로 판단, 브라우저로 전환: {url}")
+            return None
+        if not any(info[key] for key in ("회사명", "대표자명", "회사주소")):
+            print(f"[HTTP] 정적 HTML에서 정보 없음, 브라우저로 전환: {url}")
+            return None
+    
+    print(f"[HTTP] 정적 HTML에서 추출 완료: {url}")
+    return info
 
 
-def get_saramin_company_links(driver, keyword, pages=10, max_urls=0):
-    """사람인 사이트에서 회사 검색하여 회사 상세 페이지 링크 수집 (목표 개수에 도달할 때까지 페이지 확장)"""
-    links = []
-    current_page = 1
-    max_pages = pages * 3  # 최대 3배까지 확장 가능
+def collect_company_info(driver, url):
+    """HTTP 우선 추출, 실패 시 브라우저(extract_company_info)로 처리
     
+    반환값: (info, 브라우저 사용 여부)
+    """
+    if HTTP_FIRST and not needs_browser(url):
+        info = extract_company_info_http(url)
+        if info is not None:
+            return info, False
+    csn = saramin_csn(url)
+    if csn:
+        profile = saramin_company_cache.get(csn)
+        if profile is not None:
+            return extract_saramin_cached(driver, url, profile)
+    return extract_company_info(driver, url), True
+
+
+def saramin_csn(url):
+    """사람인 회사 링크(company-info/view, company/view 등)의 csn 파라미터 (없으면 None)"""
+    parsed = urlparse(url)
+    if "saramin.co.kr" not in parsed.netloc.lower() or not parsed.path.startswith("/zf_user/company"):
+        return None
+    csn = parse_qs(parsed.query).get("csn")
+    return csn[0].strip() if csn and csn[0].strip() else None
+
+
+def saramin_detail_url(url):
+    """csn으로 만든 회사 상세 페이지 주소 (company-info/view를 거치지 않음, csn이 없으면 None)"""
+    csn = saramin_csn(url)
+    if not csn:
+        return None
+    parsed = urlparse(url)
+    return f"{parsed.scheme or 'https'}://{parsed.netloc}{SARAMIN_COMPANY_DETAIL_PATH}?csn={quote(csn, safe='')}"
+
+
+# csn으로 바로 열기 연속 실패 횟수 / 다시 시도할 시각 (모든 작업 공용)
+saramin_direct_state = {"misses": 0, "paused_until": 0.0}
+saramin_direct_lock = threading.Lock()
+
+
+def saramin_direct_url(url):
+    """바로 열 회사 상세 페이지 주소 (csn이 없거나 연속 실패로 잠시 멈춘 동안은 None - 원래 주소를 엶)"""
+    with saramin_direct_lock:
+        if time.monotonic() < saramin_direct_state["paused_until"]:
+            return None
+    return saramin_detail_url(url)
+
+
+def record_saramin_direct(opened):
+    """바로 열기 결과 기록 (연속 SARAMIN_DIRECT_MAX_MISSES번 실패하면 SARAMIN_DIRECT_RETRY초 동안 멈춤)"""
+    with saramin_direct_lock:
+        if opened:
+            saramin_direct_state["misses"] = 0
+            return
+        saramin_direct_state["misses"] += 1
+        if SARAMIN_DIRECT_MAX_MISSES and saramin_direct_state["misses"] >= SARAMIN_DIRECT_MAX_MISSES:
+            saramin_direct_state["misses"] = 0
+            saramin_direct_state["paused_until"] = time.monotonic() + SARAMIN_DIRECT_RETRY
+            print(f"[사람인] 회사 상세 페이지를 바로 열지 못하는 상태가 계속됨 - {SARAMIN_DIRECT_RETRY}초 동안 원래 주소로 처리")
+
+
+def store_saramin_profile(url, info, homepage_url):
+    """사람인 회사 상세 페이지에서 찾은 정보를 csn 기준으로 저장 (회사명도 홈페이지도 못 찾은 페이지는 저장하지 않음)
+
+    홈페이지가 없는 회사는 사람인 페이지에서 찾은 이메일/대표자명/주소까지 저장한다.
+    """
+    csn = saramin_csn(url)
+    if not csn or not (info["회사명"] or homepage_url):
+        return
+    saramin_company_cache.set(csn, {
+        "사이트명": info["사이트명"],
+        "회사명": info["회사명"],
+        "대표자명": info["대표자명"],
+        "회사주소": info["회사주소"],
+        "homepage": homepage_url or "",
+        "email": info["이메일"] if not homepage_url else "",
+    })
+
+
+def extract_saramin_cached(driver, url, profile):
+    """저장해 둔 사람인 회사 정보로 처리 - 사람인 페이지는 열지 않고 홈페이지만 방문 (HTTP 우선)
+
+    반환값: (info, 브라우저 사용 여부)
+    """
+    info = empty_company_info(url)
+    info["사이트명"] = profile["사이트명"]
+    info["회사명"] = profile["회사명"]
+    info["대표자명"] = profile.get("대표자명", "")  # 이전 형식의 항목에는 없음
+    info["회사주소"] = profile.get("회사주소", "")
+    homepage_url = profile["homepage"]
+    print(f"[사람인] 저장된 회사 정보 사용 (csn={saramin_csn(url)}): {info['회사명']} / 홈페이지: {homepage_url or '없음'}")
+    if not homepage_url:
+        info["이메일"] = profile["email"]
+        return info, False
+    
+    if HTTP_FIRST and not needs_browser(homepage_url):
+        page = extract_company_info_http(homepage_url)
+        if page is not None:
+            info["URL"] = homepage_url
+            info["이메일"] = page["이메일"]
+            if not info["회사명"]:
+                info["회사명"] = page["회사명"]
+            for key in ("대표자명", "회사주소"):
+                if page[key]:
+                    info[key] = page[key]
+            return info, False
+    
+    body_text = ""
     try:
-        while current_page <= max_pages:
-            # 사람인 검색 URL (사용자가 제공한 형식 사용)
-            url = f"https://www.saramin.co.kr/zf_user/search?search_area=main&search_done=y&search_optional_item=n&searchType=search&searchword={quote_plus(keyword)}&recruitPage={current_page}"
-            print(f"[사람인] 페이지 {current_page} 크롤링 중: {url}")
-            driver.get(url)
-            time.sleep(3)  # 페이지 로딩 대기
-            
-            page_links_count = len(links)
-            
-            # 사람인 검색 결과에서 회사 상세 페이지 링크 찾기
-            # 모든 방법을 병렬로 시도하여 최대한 많이 수집
-            try:
-                # 페이지가 완전히 로드될 때까지 대기
-                time.sleep(3)
-                
-                # 페이지 소스 확인 (디버깅용)
-                page_source_snippet = driver.page_source[:2000] if len(driver.page_source) > 2000 else driver.page_source
-                print(f"[사람인] 페이지 소스 일부: {page_source_snippet[:500]}...")
-                
-                # 페이지에 "/zf_user/company"가 있는지 확인
-                if "/zf_user/company" not in driver.page_source:
-                    print(f"[사람인] 경고: 페이지에 '/zf_user/company' 링크가 없습니다!")
-                else:
-                    print(f"[사람인] 페이지에 '/zf_user/company' 링크가 있습니다.")
-                
-                # 방법 1: 모든 회사 관련 링크 찾기 (company-info/view 포함)
-                # /zf_user/company-info/view 링크도 수집 (이 링크를 따라가면 회사 상세 페이지로 갈 수 있음)
-                all_company_links = driver.find_elements(By.CSS_SELECTOR, "a[href*='/zf_user/company']")
-                print(f"[사람인] 방법1: {len(all_company_links)}개 링크 발견")
-                for link in all_company_links:
-                    try:
-                        href = link.get_attribute("href")
-                        if href:
-                            if href.startswith("/"):
-                                href = "https://www.saramin.co.kr" + href
-                            # 쿼리 파라미터는 유지 (csn 파라미터가 중요할 수 있음)
-                            href_clean = href.split("#")[0].rstrip("/")
-                            
-                            # /zf_user/company-info/view 링크 수집 (이 링크를 따라가면 회사 상세 페이지로 갈 수 있음)
-                            if "/zf_user/company-info/view" in href_clean:
-                                if href_clean not in links:
-                                    links.append(href_clean)
-                                    print(f"[사람인] 링크 추가 (company-info/view): {href_clean}")
-                            # 정확히 /zf_user/company/로 시작하는 링크도 수집
-                            elif (href_clean.startswith("https://www.saramin.co.kr/zf_user/company/") or 
-                                  href_clean.startswith("/zf_user/company/")):
-                                # company-review, jobs는 제외하지만 company-info/view는 포함
-                                if ("/zf_user/company-review" not in href_clean and
-                                    "/zf_user/jobs" not in href_clean and
-                                    "/zf_user/company/" in href_clean and
-                                    href_clean not in links):
-                                    links.append(href_clean)
-                                    print(f"[사람인] 링크 추가: {href_clean}")
-                                else:
-                                    print(f"[사람인] 링크 제외 (잘못된 경로): {href_clean}")
-                            else:
-                                print(f"[사람인] 링크 제외 (형식 불일치): {href_clean}")
-                    except Exception as e:
-                        print(f"[사람인] 링크 처리 오류: {e}")
-                        pass
-                
-                # 방법 2: "기업정보" 텍스트가 있는 링크 찾기 (전체 페이지에서) - 가장 중요!
-                # 다양한 XPath 시도 (company-info/view 링크 포함)
-                xpath_selectors = [
-                    "//a[contains(text(), '기업정보')]",
-                    "//a[text()='기업정보']",
-                    "//button[contains(text(), '기업정보')]",
-                    "//a[@title='기업정보']",
-                    "//a[contains(@class, 'company_info')]",
-                    "//a[contains(@class, 'btn_info')]",
-                    "//a[contains(@class, 'company_popup')]",
-                    "//a[contains(@href, '/zf_user/company-info/view')]",
-                    "//a[contains(@href, '/zf_user/company/')]",
-                ]
-                
-                all_company_info_links = []
-                for xpath in xpath_selectors:
-                    try:
-                        found_links = driver.find_elements(By.XPATH, xpath)
-                        print(f"[사람인] 방법2 ({xpath}): {len(found_links)}개 발견")
-                        all_company_info_links.extend(found_links)
-                    except Exception as e:
-                        print(f"[사람인] 방법2 XPath 오류 ({xpath}): {e}")
-                        pass
-                
-                # 중복 제거
-                seen_elements = set()
-                unique_company_info_links = []
-                for link in all_company_info_links:
-                    try:
-                        elem_id = link.id
-                        if elem_id not in seen_elements:
-                            seen_elements.add(elem_id)
-                            unique_company_info_links.append(link)
-                    except:
-                        unique_company_info_links.append(link)
-                
-                print(f"[사람인] 방법2: 총 {len(unique_company_info_links)}개 '기업정보' 링크 발견 (중복 제거 후)")
-                
-                for link in unique_company_info_links:
-                    try:
-                        href = link.get_attribute("href")
-                        if not href:
-                            # onclick 속성 확인
-                            onclick = link.get_attribute("onclick")
-                            if onclick and "/zf_user/company" in onclick:
-                                url_match = re.search(r'/zf_user/company/[^\s\'"]+', onclick)
-                                if url_match:
-                                    href = "https://www.saramin.co.kr" + url_match.group(0)
-                        
-                        if href:
-                            if href.startswith("/"):
-                                href = "https://www.saramin.co.kr" + href
-                            # 쿼리 파라미터는 유지
-                            href_clean = href.split("#")[0].rstrip("/")
-                            
-                            # /zf_user/company-info/view 링크 수집
-                            if "/zf_user/company-info/view" in href_clean:
-                                if href_clean not in links:
-                                    links.append(href_clean)
-                                    print(f"[사람인] 링크 추가 (기업정보 - company-info/view): {href_clean}")
-                            # 정확히 /zf_user/company/로 시작하는 링크도 수집
-                            elif (href_clean.startswith("https://www.saramin.co.kr/zf_user/company/") or 
-                                  href_clean.startswith("/zf_user/company/")):
-                                if ("/zf_user/company-review" not in href_clean and
-                                    "/zf_user/jobs" not in href_clean and
-                                    "/zf_user/company/" in href_clean and
-                                    href_clean not in links):
-                                    links.append(href_clean)
-                                    print(f"[사람인] 링크 추가 (기업정보): {href_clean}")
-                                else:
-                                    print(f"[사람인] 링크 제외 (잘못된 경로): {href_clean}")
-                            else:
-                                print(f"[사람인] 링크 제외 (형식 불일치): {href_clean}")
-                    except Exception as e:
-                        print(f"[사람인] 방법2 링크 처리 오류: {e}")
-                        pass
-                
-                # 방법 3: 기업정보 버튼/링크 찾기 (다양한 선택자)
-                company_info_selectors = [
-                    "a[href*='/zf_user/company']",
-                    "a.company_info",
-                    ".company_info a",
-                    "a[title*='기업정보']",
-                    "a[aria-label*='기업정보']",
-                    ".btn_company_info",
-                    ".company_info_btn",
-                ]
-                for selector in company_info_selectors:
-                    try:
-                        elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                        for elem in elements:
-                            href = elem.get_attribute("href")
-                            if href:
-                                if href.startswith("/"):
-                                    href = "https://www.saramin.co.kr" + href
-                                href_clean = href.split("?")[0].split("#")[0].rstrip("/")
-                                # 정확히 /zf_user/company/로 시작하는 링크만 수집
-                                if (href_clean.startswith("https://www.saramin.co.kr/zf_user/company/") or 
-                                    href_clean.startswith("/zf_user/company/")):
-                                    if ("/zf_user/company-info" not in href_clean and 
-                                        "/zf_user/company-review" not in href_clean and
-                                        "/zf_user/jobs" not in href_clean and
-                                        "/zf_user/company/" in href_clean and
-                                        href_clean not in links):
-                                        links.append(href_clean)
-                                        print(f"[사람인] 링크 추가 (선택자 {selector}): {href_clean}")
-                                    else:
-                                        print(f"[사람인] 링크 제외 (잘못된 경로): {href_clean}")
-                    except:
-                        pass
-                
-                # 방법 4: 각 채용 공고 항목에서 "기업정보" 버튼 찾기 (가장 중요!)
-                try:
-                    # 사람인 검색 결과의 채용 공고 항목 찾기 (더 많은 선택자 시도)
-                    job_item_selectors = [
-                        ".item_recruit",
-                        ".recruit_item", 
-                        ".job_item", 
-                        ".list_item",
-                        "[class*='item_recruit']",
-                        "[class*='recruit_item']",
-                        "[class*='list_item']",
-                        "div[class*='item']",
-                        "li[class*='item']",
-                    ]
-                    
-                    all_job_items = []
-                    for selector in job_item_selectors:
-                        try:
-                            items = driver.find_elements(By.CSS_SELECTOR, selector)
-                            all_job_items.extend(items)
-                        except:
-                            pass
-                    
-                    # 중복 제거
-                    seen_items = set()
-                    unique_job_items = []
-                    for item in all_job_items:
-                        try:
-                            item_id = item.id
-                            if item_id not in seen_items:
-                                seen_items.add(item_id)
-                                unique_job_items.append(item)
-                        except:
-                            unique_job_items.append(item)
-                    
-                    print(f"[사람인] 방법4: {len(unique_job_items)}개 채용 공고 항목 발견")
-                    
-                    for idx, item in enumerate(unique_job_items):
-                        try:
-                            # 각 항목에서 "기업정보" 버튼/링크 찾기
-                            # 방법 4-1: "기업정보" 텍스트가 있는 링크 찾기
-                            company_info_buttons = item.find_elements(By.XPATH, ".//a[contains(text(), '기업정보')]")
-                            
-                            # 방법 4-2: href에 /zf_user/company 또는 /zf_user/company-info/view가 있는 링크 찾기
-                            if not company_info_buttons:
-                                company_info_buttons = item.find_elements(By.CSS_SELECTOR, "a[href*='/zf_user/company'], a[href*='/zf_user/company-info/view']")
-                            
-                            # 방법 4-2-1: btn_info 클래스가 있는 링크 찾기 (사용자가 제공한 HTML 구조)
-                            if not company_info_buttons:
-                                company_info_buttons = item.find_elements(By.CSS_SELECTOR, "a.btn_info, a.company_popup, .area_corp_info a")
-                            
-                            # 방법 4-3: 버튼 클래스가 있는 링크 찾기
-                            if not company_info_buttons:
-                                company_info_buttons = item.find_elements(By.CSS_SELECTOR, "a.btn, button, .btn_company_info, .company_info_btn")
-                            
-                            print(f"[사람인] 항목 {idx+1}: {len(company_info_buttons)}개 '기업정보' 버튼 발견")
-                            
-                            for button in company_info_buttons:
-                                try:
-                                    href = button.get_attribute("href")
-                                    if not href:
-                                        # onclick 속성에서 링크 추출 시도
-                                        onclick = button.get_attribute("onclick")
-                                        if onclick and "/zf_user/company" in onclick:
-                                            # onclick에서 URL 추출
-                                            import re
-                                            url_match = re.search(r'/zf_user/company/[^\s\'"]+', onclick)
-                                            if url_match:
-                                                href = "https://www.saramin.co.kr" + url_match.group(0)
-                                    
-                                    if href:
-                                        if href.startswith("/"):
-                                            href = "https://www.saramin.co.kr" + href
-                                        # 쿼리 파라미터는 유지
-                                        href_clean = href.split("#")[0].rstrip("/")
-                                        
-                                        # /zf_user/company-info/view 링크 수집
-                                        if "/zf_user/company-info/view" in href_clean:
-                                            if href_clean not in links:
-                                                links.append(href_clean)
-                                                print(f"[사람인] 링크 추가 (항목 {idx+1} '기업정보' 버튼 - company-info/view): {href_clean}")
-                                        # 정확히 /zf_user/company/로 시작하는 링크도 수집
-                                        elif (href_clean.startswith("https://www.saramin.co.kr/zf_user/company/") or 
-                                              href_clean.startswith("/zf_user/company/")):
-                                            if ("/zf_user/company-review" not in href_clean and
-                                                "/zf_user/jobs" not in href_clean and
-                                                "/zf_user/company/" in href_clean and
-                                                href_clean not in links):
-                                                links.append(href_clean)
-                                                print(f"[사람인] 링크 추가 (항목 {idx+1} '기업정보' 버튼): {href_clean}")
-                                            else:
-                                                print(f"[사람인] 링크 제외 (잘못된 경로): {href_clean}")
-                                        else:
-                                            print(f"[사람인] 링크 제외 (형식 불일치): {href_clean}")
-                                except Exception as e:
-                                    print(f"[사람인] 항목 {idx+1} 버튼 처리 오류: {e}")
-                                    pass
-                        except Exception as e:
-                            print(f"[사람인] 항목 {idx+1} 처리 오류: {e}")
-                            pass
-                except Exception as e:
-                    print(f"[사람인] 방법4 오류: {e}")
-                    import traceback
-                    print(traceback.format_exc())
-                    pass
-                
-                # 방법 5: 사람인 검색 결과의 실제 구조에 맞는 선택자 추가
-                try:
-                    # 사람인 검색 결과 페이지의 실제 구조 확인
-                    page_html = driver.page_source
-                    if "/zf_user/company" in page_html:
-                        # 더 구체적인 선택자로 시도 (채용 공고 링크 제외)
-                        additional_selectors = [
-                            "a[href*='/zf_user/company']:not([href*='/zf_user/jobs'])",
-                            ".item_recruit a[href*='/zf_user/company']",
-                            ".list_item a[href*='/zf_user/company']",
-                            "[class*='item'] a[href*='/zf_user/company']",
-                        ]
-                        for selector in additional_selectors:
-                            try:
-                                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                                print(f"[사람인] 방법5 ({selector}): {len(elements)}개 요소 발견")
-                                for elem in elements:
-                                    href = elem.get_attribute("href")
-                                    if href and "/zf_user/company" in href:
-                                        if href.startswith("/"):
-                                            href = "https://www.saramin.co.kr" + href
-                                        href_clean = href.split("?")[0].split("#")[0].rstrip("/")
-                                        # 정확히 /zf_user/company/로 시작하는 링크만 수집
-                                        if (href_clean.startswith("https://www.saramin.co.kr/zf_user/company/") or 
-                                            href_clean.startswith("/zf_user/company/")):
-                                            if ("/zf_user/company-info" not in href_clean and 
-                                                "/zf_user/company-review" not in href_clean and
-                                                "/zf_user/jobs" not in href_clean and
-                                                "/zf_user/company/" in href_clean and
-                                                href_clean not in links):
-                                                links.append(href_clean)
-                                                print(f"[사람인] 링크 추가 (추가선택자 {selector}): {href_clean}")
-                                            else:
-                                                print(f"[사람인] 링크 제외 (잘못된 경로): {href_clean}")
-                                        else:
-                                            print(f"[사람인] 링크 제외 (형식 불일치): {href_clean}")
-                            except Exception as e:
-                                print(f"[사람인] 방법5 선택자 오류 ({selector}): {e}")
-                                pass
-                except Exception as e:
-                    print(f"[사람인] 방법5 오류: {e}")
-                    pass
-                
-                # 방법 6: 사람인 검색 결과에서 회사명 클릭 영역 찾기
-                try:
-                    # 각 채용 공고 항목에서 회사명 영역 찾기
-                    recruit_items = driver.find_elements(By.CSS_SELECTOR, ".item_recruit, .list_item, [class*='item_recruit'], [class*='list_item']")
-                    print(f"[사람인] 방법6: {len(recruit_items)}개 채용 공고 항목 발견")
-                    for item in recruit_items:
-                        try:
-                            # 회사명 영역에서 회사 상세 페이지 링크 찾기
-                            # 회사명은 보통 h2, h3, strong, a 태그에 있음
-                            company_name_elements = item.find_elements(By.CSS_SELECTOR, "h2 a, h3 a, strong a, .company_name a, a.company_name")
-                            for elem in company_name_elements:
-                                href = elem.get_attribute("href")
-                                if href and "/zf_user/company" in href:
-                                    if href.startswith("/"):
-                                        href = "https://www.saramin.co.kr" + href
-                                    href_clean = href.split("?")[0].split("#")[0].rstrip("/")
-                                    # 정확히 /zf_user/company/로 시작하는 링크만 수집
-                                    if (href_clean.startswith("https://www.saramin.co.kr/zf_user/company/") or 
-                                        href_clean.startswith("/zf_user/company/")):
-                                        if ("/zf_user/company-info" not in href_clean and 
-                                            "/zf_user/company-review" not in href_clean and
-                                            "/zf_user/jobs" not in href_clean and
-                                            "/zf_user/company/" in href_clean and
-                                            href_clean not in links):
-                                            links.append(href_clean)
-                                            print(f"[사람인] 링크 추가 (회사명 영역): {href_clean}")
-                                        else:
-                                            print(f"[사람인] 링크 제외 (잘못된 경로): {href_clean}")
-                                    else:
-                                        print(f"[사람인] 링크 제외 (형식 불일치): {href_clean}")
-                        except Exception as e:
-                            print(f"[사람인] 방법6 항목 처리 오류: {e}")
-                            pass
-                except Exception as e:
-                    print(f"[사람인] 방법6 오류: {e}")
-                    pass
-            except Exception as e:
-                print(f"[사람인] 링크 추출 오류: {e}")
-            
-            print(f"[사람인] 페이지 {current_page}에서 {len(links) - page_links_count}개 링크 발견 (총 {len(links)}개)")
-            
-            # 목표 개수에 도달했거나, 기본 페이지 범위를 넘었는데 새 링크가 없으면 중단
-            if max_urls > 0 and len(links) >= max_urls:
-                break
-            
-            # 기본 페이지 범위를 넘었는데 새 링크가 없으면 중단
-            if current_page > pages and len(links) == page_links_count:
-                break
-            
-            try:
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(1)
-            except:
-                pass
-            
-            current_page += 1
-        
+        body_text = extract_homepage_info(driver, homepage_url, info)
     except Exception as e:
-        print(f"[사람인] 크롤링 오류: {e}")
+        print(f"[사람인 상세페이지] 홈페이지 처리 오류: {e}")
+    parse_company_fields(info, body_text)
+    return info, True
+
+
+def filter_emails(found_emails, limit=3):
+    """이미지 파일명, noreply, 예시 주소 등 불필요한 이메일 제외 (중복 제거 후 최대 limit개, 시스템 이메일 admin@, webmaster@ 등은 포함)"""
+    real_emails = [email for email in dict.fromkeys(found_emails) if not is_junk_email(email, PLACEHOLDER_EMAIL_EXCLUDE)]
+    return real_emails[:limit]
+
+
+def find_emails_in_snapshot(snapshot):
+    """홈페이지 스냅샷에서 이메일 찾기 (footer → footer mailto → 이메일 라벨 주변 → 전체 페이지 순서)"""
+    # 1. footer HTML과 텍스트 (HTML에서 먼저 찾는 것이 더 정확함)
+    if snapshot["footer_html"] or snapshot["footer_text"]:
+        found = find_emails(snapshot["footer_html"], snapshot["footer_text"])
+        emails = filter_emails(found)
+        if emails:
+            print(f"[사람인 상세페이지] footer에서 이메일 발견: {', '.join(emails)}")
+            return ", ".join(emails)
+        print(f"[사람인 상세페이지] footer에서 이메일을 찾지 못함")
+    
+    # 2. footer 안의 mailto 링크
+    for mailto in snapshot["mailto"]:
+        href = mailto["href"]
+        if mailto["footer"] and "mailto:" in href:
+            email = href.split("mailto:")[1].split("?")[0].split("&")[0].strip()
+            if email and "@" in email and "." in email:
+                return email
     
-    print(f"[사람인] 총 {len(links)}개 회사 링크 수집 완료")
-    return list(set(links))
+    # 3. "E-Mail", "이메일" 등의 텍스트 주변에서 찾기
+    for context in snapshot["email_contexts"]:
+        emails = find_emails(context["text"], context["html"])
+        if emails:
+            email = emails[0]
+            # noreply, example, test만 제외 (시스템 이메일은 포함)
+            if not any(x in email.lower() for x in ['noreply', 'no-reply', 'example', 'test']):
+                return email
+    
+    # 4. 전체 페이지 HTML과 텍스트
+    print(f"[사람인 상세페이지] 전체 페이지에서 이메일 추출 시도...")
+    found = find_emails(snapshot["html"], snapshot["text"])
+    emails = filter_emails(found)
+    if emails:
+        print(f"[사람인 상세페이지] 전체 페이지에서 이메일 발견: {', '.join(emails)}")
+        return ", ".join(emails)
+    return ""
 
 
-def get_jobkorea_company_links(driver, keyword, pages=10, max_urls=0):
-    """잡코리아 사이트에서 회사 검색하여 회사 상세 페이지 링크 수집 (목표 개수에 도달할 때까지 페이지 확장)"""
-    links = []
-    current_page = 1
-    max_pages = pages * 3  # 최대 3배까지 확장 가능
+def find_saramin_homepage(snapshot):
+    """사람인 회사 상세 페이지 스냅샷에서 회사 홈페이지 URL 찾기"""
+    def is_external(href):
+        return (href and href.startswith("http") and "saramin.co.kr" not in href
+                and not any(x in href.lower() for x in HOMEPAGE_EXCLUDE_HOSTS))
+    
+    # 방법 1: dt/dd 구조에서 찾기 (가장 정확)
+    for item in snapshot["labelled"]:
+        if "홈페이지" not in item["label"]:
+            continue
+        if item["href"].startswith("http"):
+            print(f"[사람인 상세페이지] 방법1 성공: {item['href']}")
+            return item["href"]
+        value = item["value"].strip()
+        if value.startswith("http"):
+            print(f"[사람인 상세페이지] 방법1 성공 (텍스트): {value.split()[0]}")
+            return value.split()[0]  # 첫 번째 단어가 URL일 가능성
+    
+    # 방법 2: 페이지 텍스트에서 정규식으로 찾기
+    for pattern in SARAMIN_HOMEPAGE_PATTERNS:
+        match = pattern.search(snapshot["text"])
+        if match:
+            homepage_url = match.group(1).strip()
+            # URL이 잘린 경우 처리
+            if homepage_url.endswith('...'):
+                homepage_url = homepage_url[:-3]
+            if not homepage_url.startswith("http"):
+                homepage_url = "http://" + homepage_url
+            return homepage_url
+    
+    # 방법 3: "홈페이지" 텍스트 옆에 있는 외부 링크
+    for anchor in snapshot["anchors"]:
+        if is_external(anchor["href"]) and "홈페이지" in anchor["ctx"]:
+            return anchor["href"]
     
+    # 방법 4: 기업정보 섹션 안의 외부 링크
+    for anchor in snapshot["anchors"]:
+        href = anchor["href"]
+        if anchor["section"] and is_external(href) and "." in href.split("//")[1].split("/")[0]:
+            return href
+    
+    return None
+
+
+def extract_homepage_info(driver, homepage_url, info):
+    """회사 홈페이지로 이동해서 footer 이메일, 회사명 추출. 반환값: 홈페이지 본문 텍스트"""
+    print(f"[사람인 상세페이지] 홈페이지로 이동 중: {homepage_url}")
+    apply_profile(driver, "web")  # 사람인 페이지가 아니므로 일반 홈페이지 차단 목록으로 전환
+    with stage_timer("homepage_load", "saramin"):
+        driver.get(homepage_url)
+        budget = WaitBudget()
+        wait_for_page(driver, budget=budget)
+    
+    # 페이지 하단으로 스크롤하여 footer 로드 (일부 사이트는 동적 로딩) 후 내용 변화가 멈출 때까지 대기
     try:
-        while current_page <= max_pages:
-            url = f"https://www.jobkorea.co.kr/Search/?stext={quote_plus(keyword)}&tabType=recruit&Page_No={current_page}"
+        with stage_timer("footer_scroll", "saramin"):
+            driver.execute_script("window.scrollTo(0, document.documentElement.scrollHeight);")
+            wait_for_settle(driver, budget)
+            # footer 요소가 보이도록 스크롤
+            has_footer = driver.execute_script(
+                "var f = document.querySelector('footer, #footer, .footer');"
+                "if (f) { f.scrollIntoView(true); } return !!f;"
+            )
+            if has_footer:
+                wait_for_settle(driver, budget, max_wait=1.0)
+    except Exception:
+        pass
+    
+    # 페이지 정보는 스냅샷 한 번으로 가져옴
+    snapshot = take_snapshot(driver, html=True, fields={"company": HOMEPAGE_COMPANY_SELECTORS})
+    print(f"[사람인 상세페이지] 홈페이지 접근 완료: {snapshot['title']}")
+    
+    print(f"[사람인 상세페이지] footer에서 이메일 추출 시작...")
+    info["이메일"] = find_emails_in_snapshot(snapshot)
+    
+    # URL을 홈페이지로 업데이트
+    info["URL"] = homepage_url
+    
+    # 회사명 추출 (홈페이지 제목/로고 영역)
+    if not info["회사명"]:
+        for selector, text in field_texts(snapshot, "company"):
+            if text and 2 < len(text) < 50:
+                # 이상한 텍스트 필터링
+                if not any(x in text for x in ['에 대해', '많은 사람', '궁금해', '검색', '사람인', 'HOME', 'MENU']):
+                    info["회사명"] = text
+                    print(f"[사람인 상세페이지] 회사명 추출 (홈페이지): {text}")
+                    break
+    
+    return snapshot["text"]
+
+
+def extract_saramin_info(driver, url, info, budget, direct_url=None):
+    """사람인 회사 상세 페이지 처리 (회사 상세 → 홈페이지). 반환값: 마지막 페이지 본문 텍스트
+    
+    csn이 있는 링크는 extract_company_info가 회사 상세 페이지(direct_url)를 바로 열어 둔다.
+    """
+    print(f"[사람인 상세페이지] 접근 중: {url}")
+    is_info_view = "/zf_user/company-info/view" in url.lower()
+    
+    # 바로 연 회사 상세 페이지가 뜨지 않으면 원래 company-info/view 주소를 열고 아래에서 링크를 따라감
+    if direct_url and is_info_view:
+        opened = wait_for_page(driver, SARAMIN_DIRECT_READY_SELECTORS, budget)
+        record_saramin_direct(opened)
+        if not opened:
+            print(f"[사람인] 회사 상세 페이지를 바로 열지 못함 - 원래 주소로 다시 시도: {url}")
             driver.get(url)
-            time.sleep(2)
-            
-            page_links_count = len(links)
-            
-            # 잡코리아 검색 결과에서 회사 상세 페이지 링크 찾기
-            selectors = [
-                "a[href*='/company']",      # 회사 상세 페이지 링크
-                "a.company_name",
-                ".company_name a",
-                "div.company_name a",
-                "a[href*='company_view']",
-                "a[href*='Company']",
-            ]
-            
-            for selector in selectors:
-                try:
-                    results = driver.find_elements(By.CSS_SELECTOR, selector)
-                    for res in results:
-                        href = res.get_attribute("href")
-                        if href and ("jobkorea.co.kr" in href or href.startswith("/")):
-                            # 상대 경로를 절대 경로로 변환
-                            if href.startswith("/"):
-                                href = "https://www.jobkorea.co.kr" + href
-                            if "company" in href.lower() and href not in links:
-                                links.append(href)
-                except:
-                    pass
-            
-            # 목표 개수에 도달했으면 중단
-            if max_urls > 0 and len(links) >= max_urls:
-                break
-            
-            # 기본 페이지 범위를 넘었는데 새 링크가 없으면 중단
-            if current_page > pages and len(links) == page_links_count:
-                break
-            
-            # 다음 페이지 체크
-            try:
-                next_button = driver.find_element(By.CSS_SELECTOR, ".paging a.next, .paging .next")
-                if "disabled" in next_button.get_attribute("class") or not next_button.is_enabled():
-                    if current_page > pages:  # 기본 페이지 범위를 넘었으면 중단
-                        break
-            except:
-                if current_page > pages:  # 기본 페이지 범위를 넘었으면 중단
+            budget = WaitBudget()
+            direct_url = None
+    
+    # company-info/view 페이지를 연 경우, 회사 상세 페이지로 이동하는 링크 찾기
+    if is_info_view and not direct_url:
+        print(f"[사람인] company-info/view 페이지에서 회사 상세 페이지 링크 찾기...")
+        with stage_timer("saramin_company_hop", "saramin"):
+            wait_for_page(driver, "a[href*='/zf_user/company/']", budget)
+            for anchor in take_snapshot(driver)["anchors"]:
+                href = anchor["href"]
+                if href and "/zf_user/company/" in href and "/zf_user/company-info" not in href:
+                    if href.startswith("/"):
+                        href = "https://www.saramin.co.kr" + href
+                    print(f"[사람인] 회사 상세 페이지로 이동: {href}")
+                    driver.get(href)
+                    budget = WaitBudget()
                     break
-            
-            current_page += 1
-    except Exception as e:
-        pass
     
-    return list(set(links))
+    # 회사 정보 영역이 나타날 때까지 대기 후 스냅샷 한 번으로 필요한 정보를 모두 가져옴
+    with stage_timer("saramin_detail", "saramin"):
+        wait_for_page(driver, SARAMIN_DETAIL_READY_SELECTORS, budget)
+        snapshot = take_snapshot(
+            driver,
+            fields={"company": SARAMIN_COMPANY_SELECTORS, "email": [".email", ".contact_email"]},
+            section=SARAMIN_INFO_SECTION,
+        )
+    print(f"[사람인 상세페이지] 페이지 제목: {snapshot['title']}")
+    
+    # 회사명 추출 (사람인 구조)
+    for selector, company_text in first_field(snapshot, "company"):
+        # 이상한 텍스트 필터링 (너무 짧거나 일반적인 문구 제외)
+        if company_text and len(company_text) > 2 and not any(x in company_text for x in ['에 대해', '많은 사람', '궁금해', '검색', '사람인']):
+            info["회사명"] = company_text
+            print(f"[사람인] 회사명 추출 성공 (선택자: {selector}): {company_text}")
+            break
+    
+    # 선택자로 못 찾았으면 페이지 제목에서 추출 시도 (예: "회사명 | 사람인" 형식)
+    if not info["회사명"]:
+        page_title = snapshot["title"].strip()
+        if "|" in page_title:
+            company_name = page_title.split("|")[0].strip()
+            if company_name and len(company_name) > 2:
+                info["회사명"] = company_name
+                print(f"[사람인] 회사명 추출 성공 (제목): {company_name}")
+    
+    # 홈페이지 URL 추출 (기업정보 섹션에서)
+    print(f"[사람인 상세페이지] 홈페이지 URL 추출 시작...")
+    homepage_url = find_saramin_homepage(snapshot)
+    
+    # 홈페이지가 있으면 홈페이지로 이동해서 footer에서 이메일 추출
+    if homepage_url:
+        print(f"[사람인 상세페이지] 홈페이지 URL 발견: {homepage_url}")
+        store_saramin_profile(url, info, homepage_url)
+        try:
+            return extract_homepage_info(driver, homepage_url, info)
+        except Exception as e:
+            print(f"[사람인 상세페이지] 홈페이지 처리 오류: {e}")
+            import traceback
+            print(traceback.format_exc())
+            return snapshot["text"]
+    
+    # 홈페이지를 못 찾았으면 사람인 페이지에서 직접 이메일 추출 시도
+    print(f"[사람인 상세페이지] 홈페이지 URL을 찾지 못함 - 사람인 페이지에서 직접 이메일 추출 시도")
+    info["이메일"] = find_contact_email(snapshot)
+    if info["이메일"]:
+        print(f"[사람인 상세페이지] 사람인 페이지에서 이메일 발견: {info['이메일']}")
+    # 대표자명/주소 등은 사람인 페이지 본문에서 채운 뒤 저장 (다시 나온 회사도 같은 결과가 되도록)
+    parse_company_fields(info, snapshot["text"])
+    store_saramin_profile(url, info, None)
+    return snapshot["text"]
+
+
+def find_contact_email(snapshot):
+    """mailto 링크 또는 이메일 표시 영역(fields["email"])에서 첫 번째 이메일"""
+    candidates = [mailto["href"] for mailto in snapshot["mailto"] if mailto["href"].startswith("mailto:")]
+    candidates += [text for _, text in field_texts(snapshot, "email")]
+    for candidate in candidates:
+        if "@" in candidate:
+            email_match = EMAIL_RE.search(candidate)
+            if email_match:
+                return email_match.group(0)
+    return ""
 
 
-def get_albamon_company_links(driver, keyword, pages=10, max_urls=0):
-    """알바몬 사이트에서 회사 검색하여 회사 상세 페이지 링크 수집 (목표 개수에 도달할 때까지 페이지 확장)"""
-    links = []
-    current_page = 1
-    max_pages = pages * 3  # 최대 3배까지 확장 가능
+def extract_company_info(driver, url):
+    """브라우저로 상세 페이지 처리 (오류는 그대로 올림 - 호출하는 쪽에서 실패로 처리하고 캐시하지 않음)"""
+    info = empty_company_info(url)
+    source = detail_source(url)
     
     try:
-        while current_page <= max_pages:
-            url = f"https://www.albamon.com/list/gi/mon_list.asp?keyword={quote_plus(keyword)}&page={current_page}"
-            driver.get(url)
-            time.sleep(2)
-            
-            page_links_count = len(links)
-            
-            # 알바몬 검색 결과에서 회사 상세 페이지 링크 찾기
-            selectors = [
-                "a[href*='company']",       # 회사 상세 페이지 링크
-                "a.company_name",
-                ".company_name a",
-                "div.company_name a",
-                "a[href*='gi_view']",
-            ]
-            
-            for selector in selectors:
-                try:
-                    results = driver.find_elements(By.CSS_SELECTOR, selector)
-                    for res in results:
-                        href = res.get_attribute("href")
-                        if href and ("albamon.com" in href or href.startswith("/")):
-                            # 상대 경로를 절대 경로로 변환
-                            if href.startswith("/"):
-                                href = "https://www.albamon.com" + href
-                            if ("company" in href.lower() or "gi_view" in href.lower()) and href not in links:
-                                links.append(href)
-                except:
-                    pass
-            
-            # 목표 개수에 도달했으면 중단
-            if max_urls > 0 and len(links) >= max_urls:
-                break
+        apply_profile(driver, source)
+        with stage_timer("detail_load", source):
+            driver.set_page_load_timeout(10)
+            # 사람인 회사 링크는 csn으로 회사 상세 페이지를 바로 염 (company-info/view를 거치지 않음)
+            direct_url = saramin_direct_url(url)
+            driver.get(direct_url or url)
+        budget = WaitBudget()  # 페이지 이동마다 새 대기 예산
+        url_lower = url.lower()
+        
+        # 사람인 (saramin.co.kr) - 회사 상세 페이지 또는 company-info/view 페이지인 경우
+        if "saramin.co.kr" in url_lower and "/zf_user/company" in url_lower:
+            info["사이트명"] = (driver.title or "").strip()
+            body_text = extract_saramin_info(driver, url, info, budget, direct_url)
+        
+        else:
+            fields = {}
+            if "jobkorea.co.kr" in url_lower:
+                fields = {"company": JOBKOREA_COMPANY_SELECTORS, "email": [".email", ".contact"]}
+            elif "albamon.com" in url_lower:
+                fields = {"company": ALBAMON_COMPANY_SELECTORS, "email": [".email", ".contact_email"]}
             
-            # 기본 페이지 범위를 넘었는데 새 링크가 없으면 중단
-            if current_page > pages and len(links) == page_links_count:
-                break
+            # 페이지 정보는 스냅샷 한 번으로 가져옴
+            with stage_timer("detail_render", source):
+                wait_for_page(driver, budget=budget)
+                snapshot = take_snapshot(driver, fields=fields)
+            info["사이트명"] = snapshot["title"].strip()
+            body_text = snapshot["text"]
             
-            # 다음 페이지 체크
-            try:
-                next_button = driver.find_element(By.CSS_SELECTOR, ".paging a.next, .paging .next")
-                if "disabled" in next_button.get_attribute("class") or not next_button.is_enabled():
-                    if current_page > pages:  # 기본 페이지 범위를 넘었으면 중단
+            # 잡코리아 / 알바몬: 회사명과 이메일 영역 선택자
+            if fields:
+                for _, company_text in first_field(snapshot, "company"):
+                    if company_text:
+                        info["회사명"] = company_text
                         break
-            except:
-                if current_page > pages:  # 기본 페이지 범위를 넘었으면 중단
-                    break
-            
-            current_page += 1
+                info["이메일"] = find_contact_email(snapshot)
+        
+        # 일반 정보 추출 (채용 사이트에서 못 찾은 경우 또는 일반 사이트)
+        parse_company_fields(info, body_text)
+        
+        return info
     except Exception as e:
-        pass
-    
-    return list(set(links))
+        print(f"[상세 페이지] 처리 오류 ({url}): {e}")
+        raise
 
 
-def extract_company_info(driver, url):
-    info = {
+def company_cache_key(url):
+    """결과 캐시 키 (canonical_url 기준 - 작업 안의 URL 정규화와 같은 규칙, http/https 차이만 무시. 사람인은 csn 기준)"""
+    canonical = canonical_url(url)
+    parsed = urlparse(canonical)
+    if "saramin.co.kr" in parsed.netloc:
+        csn = parse_qs(parsed.query).get("csn")
+        if csn:
+            return f"saramin:{csn[0]}"
+    return canonical.split("://", 1)[-1]
+
+
+def resolve_ad_url(url):
+    """광고/리다이렉트 래퍼 URL을 실제 랜딩 URL로 변환 (래퍼가 아니면 그대로, 풀지 못하면 None)
+
+    같은 래퍼는 한 번만 풀고 결과를 캐시에 보관한다.
+    """
+    if not is_redirect_wrapper(url):
+        return url
+    cached = redirect_cache.get(url)
+    if cached is not None:
+        return cached or None
+    target = unwrap_redirect_param(url)
+    if target is None:
+        try:
+            target = resolve_redirect(url, until=lambda current: not is_redirect_wrapper(current))
+        except FetchError as e:
+            print(f"[리다이렉트] 풀기 실패: {url[:80]} ({e})")
+            return None  # 일시적인 실패일 수 있으므로 캐시하지 않음
+    if is_redirect_wrapper(target):
+        target = ""  # 래퍼 밖으로 나가지 못함
+    redirect_cache.set(url, target)
+    if target:
+        print(f"[리다이렉트] {url[:60]} -> {target[:80]}")
+    return target or None
+
+
+def canonicalize_links(urls):
+    """수집한 링크 정리 (광고 래퍼 풀기 -> 회사 사이트 필터 -> URL 정규화)"""
+    result = []
+    for url in urls:
+        target = resolve_ad_url(url)
+        if not target:
+            continue
+        if target != url and not is_valid_company_url(target):
+            continue
+        result.append(canonical_url(target))
+    return result
+
+
+def get_cached_company_info(url):
+    """캐시된 추출 결과 (없거나 만료되었으면 None)"""
+    cached = result_cache.get(company_cache_key(url))
+    return dict(cached) if cached is not None else None
+
+
+def store_company_info(url, info):
+    """추출 결과를 캐시에 저장 (이메일을 못 찾은 결과는 더 짧게 보관)"""
+    ttl = RESULT_CACHE_TTL if info.get("이메일") else RESULT_CACHE_EMPTY_TTL
+    result_cache.set(company_cache_key(url), info, ttl=ttl)
+
+
+def empty_company_info(url):
+    """추출 실패 시 사용하는 기본 정보"""
+    return {
         "URL": url,
         "사이트명": "",
         "회사명": "",
@@ -886,966 +1026,578 @@ def extract_company_info(driver, url):
         "회사주소": "",
         "이메일": ""
     }
+
+
+def extract_with_workers(driver, session_data, discover, max_count=0, workers=1, job_id=None):
+    """URL 수집과 상세 페이지 정보 수집을 동시에 진행 (생산자/소비자 파이프라인)
     
-    try:
-        driver.set_page_load_timeout(10)
-        driver.get(url)
-        time.sleep(1.5)
-        
-        info["사이트명"] = driver.title.strip() if driver.title else ""
-        body_text = driver.find_element(By.TAG_NAME, "body").text
-        
-        # 채용 사이트별 특별 처리
-        url_lower = url.lower()
-        
-        # 사람인 (saramin.co.kr) - 회사 상세 페이지 또는 company-info/view 페이지인 경우
-        if "saramin.co.kr" in url_lower and ("/zf_user/company" in url_lower or "/zf_user/company-info/view" in url_lower):
-            print(f"[사람인 상세페이지] 접근 중: {url}")
+    discover(driver, feed, should_stop, covered)는 driver로 검색하면서 찾은 URL을 feed(urls)로 바로 넘기고,
+    driver로 방문한 페이지 수를 반환한다. feed는 그중 처음 본 회사 사이트 수를 반환하고,
+    covered()는 대기 중인 URL만으로 남은 이메일 목표를 채울 수 있을 것으로 보이면 참이다 (더 검색할 필요 없음).
+    상세 페이지 작업자는 드라이버 풀에서 체크아웃해서 곧바로 시작하고, 검색이 끝나면
+    driver도 작업자로 합류한다 (풀에서 받은 작업자가 workers개보다 적을 때만).
+    목표 개수에 도달하거나 정지 버튼을 누르면 검색도 즉시 중단된다.
+    job_id가 있으면 찾은 URL과 URL별 결과를 저장소에 체크포인트로 기록한다.
+    반환값: (중복 제외 개수, driver로 방문한 페이지 수)
+    """
+    target_text = f"/{max_count}" if max_count > 0 else ""
+    
+    url_queue = queue.Queue()
+    domain_index = {}  # dedup_key -> 처음 본 URL (같은 회사 사이트는 작업 안에서 한 번만 방문)
+    resumed_keys = set()  # 재개 전 실행에서 찾은 dedup_key 중 이번 실행에서 아직 다시 찾지 않은 것
+    lock = threading.Lock()
+    done = threading.Event()  # 정지 버튼 또는 목표 개수 도달
+    discovery_done = threading.Event()
+    state = {
+        "queued": 0,
+        "processed": 0,
+        "duplicate_count": 0,
+        "email_count": 0,
+        "seen_emails": set(),
+        "extractors": 0,  # 드라이버를 받아서 일하고 있는 작업자 수
+        "merged": 0,  # 이미 본 회사 사이트라서 합친 URL 수
+    }
+    # 재개한 작업이면 이전 결과로 중복 체크/목표 개수 상태 복원
+    for previous in session_data["results"]:
+        if previous.get("이메일"):
+            state["seen_emails"].add(previous["이메일"].lower().strip())
+            if previous["이메일"] != "-":
+                state["email_count"] += 1
+    
+    def should_stop():
+        if session_data["stop_flag"]:
+            done.set()
+        return done.is_set()
+    
+    def record(url, info):
+        """추출 결과 저장 (작업자 간 공유 상태는 lock으로 보호)"""
+        email_key = info["이메일"].lower().strip() if info["이메일"] else ""
+        url_base = url.split('?')[0].rstrip('/')  # 쿼리 파라미터 제거
+        company_name = info["회사명"].strip() if info["회사명"] else ""
+        
+        with lock:
+            state["processed"] += 1
+            processed = state["processed"]
+            
+            # 중복 체크: 이메일 중복만 체크 (모든 방문 사이트 표시)
+            if email_key and email_key in state["seen_emails"]:
+                state["duplicate_count"] += 1
+                print(f"[디버깅] 중복 제외됨: 이메일 중복 (총 중복: {state['duplicate_count']}개) - URL: {url_base[:80]}")
+                if job_id:
+                    job_store.mark_done(job_id, url)
+            else:
+                if email_key:
+                    state["seen_emails"].add(email_key)
+                if info.get("이메일") and info.get("이메일") != "-":
+                    state["email_count"] += 1
+                # 이메일이 없어도 모든 사이트 추가
+                row_count = session_data["results"].append(info)
+                if job_id:
+                    job_store.add_result(job_id, row_count - 1, info, url)
+                print(f"[디버깅] 추가됨 (총 {len(session_data['results'])}개) - URL: {url_base[:80]}, 회사명: {company_name[:30]}, 이메일: {email_key[:30]}")
+                notify_session(session_data)
+            
+            collected = len(session_data["results"])
+            suffix = ""
+            if not info["이메일"]:
+                if "saramin.co.kr" in url.lower() and "/zf_user/company" in url.lower():
+                    # 홈페이지를 못 찾은 경우 / 홈페이지로 이동했지만 이메일을 못 찾은 경우
+                    suffix = " [홈페이지 미발견]" if info["URL"] == url else " [이메일 미발견]"
+            searching = "" if discovery_done.is_set() else " (검색 진행 중)"
+            session_data["status"]["progress"] = f"정보 수집 중... ({processed}/{state['queued']}{searching}) - 수집: {collected}{target_text}개{suffix}"
+            
+            # 목표 개수 체크는 이메일이 있는 경우만
+            if max_count > 0 and state["email_count"] >= max_count and not done.is_set():
+                done.set()
+                session_data["status"]["progress"] = f"완료! 이메일 {max_count}개 도달 (목표 달성, 총 {collected}개 사이트 수집)"
+                print(f"[디버깅] 목표 개수 도달! 이메일 {state['email_count']}개 >= 목표 {max_count}개")
+    
+    def enqueue(urls):
+        """처리할 URL 추가 (캐시에 있는 URL은 브라우저 없이 바로 결과로 사용)"""
+        cached_count = 0
+        for url in urls:
+            if should_stop():
+                break
+            with lock:
+                state["queued"] += 1
+            cached = get_cached_company_info(url)
+            if cached is not None:
+                cached_count += 1
+                record(url, cached)
+            else:
+                url_queue.put(url)
+        if cached_count:
+            print(f"[캐시] {cached_count}/{len(urls)}개 URL을 캐시에서 처리")
+    
+    def covered():
+        with lock:
+            return expected_emails_cover(max_count, state["email_count"], state["processed"],
+                                         state["queued"] - state["processed"])
+    
+    def feed(urls):
+        """검색에서 찾은 URL을 정규화해서 바로 작업 큐에 넣음 (이미 본 회사 사이트는 무시)
+        
+        반환값: 새 URL 수 - 재개한 작업이면 이전 실행에서 찾았던 사이트를 다시 찾은 것도 처음 한 번은 새 URL로 셈
+        (재개 후 다시 보는 검색 페이지의 수율이 0으로 잡혀서 방문하지 않은 페이지 전에 검색이 멈추지 않도록)
+        """
+        urls = canonicalize_links(urls)
+        with lock:
+            new_urls = []
+            refound = 0
+            for url in urls:
+                key = dedup_key(url)
+                if key in domain_index:
+                    if key in resumed_keys:
+                        resumed_keys.discard(key)
+                        refound += 1
+                    else:
+                        state["merged"] += 1
+                    continue
+                domain_index[key] = url
+                new_urls.append(url)
+        if not new_urls:
+            return refound
+        if job_id:
+            job_store.add_urls(job_id, new_urls)
+        enqueue(new_urls)
+        # 대기 URL이 많이 쌓였으면 작업자가 따라올 때까지 다음 검색 페이지를 미룸
+        # (일하는 작업자가 없으면 기다려도 줄지 않으므로 대기하지 않음)
+        while url_queue.qsize() >= URL_QUEUE_SIZE and state["extractors"] > 0 and not should_stop():
+            done.wait(0.2)
+        return len(new_urls) + refound
+    
+    def work(worker_driver, worker_no):
+        """큐가 빌 때까지 상세 페이지 처리. 반환값: (브라우저로 방문한 페이지 수, 메모리 초과로 멈췄는지)"""
+        pages = 0
+        while not should_stop():
             try:
-                # /zf_user/company-info/view 페이지인 경우, 회사 상세 페이지로 이동하는 링크 찾기
-                if "/zf_user/company-info/view" in url_lower:
-                    print(f"[사람인] company-info/view 페이지에서 회사 상세 페이지 링크 찾기...")
-                    time.sleep(2)
-                    
-                    # 회사 상세 페이지로 가는 링크 찾기
-                    company_detail_links = driver.find_elements(By.CSS_SELECTOR, "a[href*='/zf_user/company/']")
-                    for link in company_detail_links:
-                        try:
-                            href = link.get_attribute("href")
-                            if href and "/zf_user/company/" in href and "/zf_user/company-info" not in href:
-                                if href.startswith("/"):
-                                    href = "https://www.saramin.co.kr" + href
-                                print(f"[사람인] 회사 상세 페이지로 이동: {href}")
-                                driver.get(href)
-                                time.sleep(2)
-                                break
-                        except:
-                            pass
-                
-                # 페이지가 완전히 로드될 때까지 대기
-                time.sleep(2)
-                print(f"[사람인 상세페이지] 페이지 제목: {driver.title}")
-                
-                # 회사명 추출 (사람인 구조) - 더 많은 선택자 시도
-                company_selectors = [
-                    "h1.company_name", 
-                    "div.company_name", 
-                    ".company_name",
-                    "h2.company_name", 
-                    "span.company_name", 
-                    "strong.company_name",
-                    ".company_info h1", 
-                    ".company_info .company_name",
-                    ".company_header h1",
-                    ".company_header .company_name",
-                    "h1[class*='company']",
-                    ".item_company h1",
-                    ".item_company .company_name",
-                    "div[class*='company_name']",
-                    # 페이지 제목에서 회사명 추출 시도
-                ]
-                for selector in company_selectors:
-                    try:
-                        elem = driver.find_element(By.CSS_SELECTOR, selector)
-                        company_text = elem.text.strip()
-                        # 이상한 텍스트 필터링 (너무 짧거나 일반적인 문구 제외)
-                        if company_text and len(company_text) > 2 and not any(x in company_text for x in ['에 대해', '많은 사람', '궁금해', '검색', '사람인']):
-                            info["회사명"] = company_text
-                            print(f"[사람인] 회사명 추출 성공 (선택자: {selector}): {company_text}")
-                            break
-                    except:
-                        pass
-                
-                # 선택자로 못 찾았으면 페이지 제목에서 추출 시도
-                if not info["회사명"]:
-                    try:
-                        page_title = driver.title.strip()
-                        # 제목에서 회사명 추출 (예: "회사명 | 사람인" 형식)
-                        if "|" in page_title:
-                            company_name = page_title.split("|")[0].strip()
-                            if company_name and len(company_name) > 2:
-                                info["회사명"] = company_name
-                                print(f"[사람인] 회사명 추출 성공 (제목): {company_name}")
-                    except:
-                        pass
-                
-                # 홈페이지 URL 추출 (기업정보 섹션에서)
-                homepage_url = None
-                print(f"[사람인 상세페이지] 홈페이지 URL 추출 시작...")
-                
-                # 방법 1: dt/dd 구조에서 찾기 (가장 정확)
+                url = url_queue.get(timeout=0.2)
+            except queue.Empty:
+                if discovery_done.is_set():
+                    break
+                continue
+            print(f"[디버깅] [작업자 {worker_no}] 상세 페이지 접근 시도: {url}")
+            try:
+                info, used_browser = collect_company_info(worker_driver, url)
+                if used_browser:
+                    pages += 1
+                    over_memory = not driver_pool.checkpoint(worker_driver)
+                else:
+                    over_memory = False
+                record_detail_page(detail_source(url), len(info["이메일"].split(",")) if info["이메일"] else 0)
+                print(f"[디버깅] 추출된 정보 - 회사명: '{info['회사명']}', 이메일: '{info['이메일']}'")
+            except Exception as e:
+                record_detail_page(detail_source(url), 0)
+                print(f"[오류] 상세 페이지 처리 중 오류 발생: {e}")
+                import traceback
+                print(traceback.format_exc())
+                # 오류가 발생해도 기본 정보는 저장
+                info = empty_company_info(url)
+            else:
+                store_company_info(url, info)
+            if done.is_set():
+                # 다른 작업자가 목표를 달성한 뒤 끝난 페이지는 버림
+                break
+            record(url, info)
+            # 메모리 상한을 넘은 풀 드라이버는 반납하고 새 드라이버로 계속 (검색용 드라이버는 작업이 끝날 때 교체)
+            if over_memory and worker_no > 0:
+                return pages, True
+        return pages, False
+    
+    def pool_worker(worker_no):
+        recycle = True
+        while recycle:
+            # 1초씩 나눠서 기다림 (기다리는 동안 검색과 처리가 모두 끝나면 바로 포기)
+            # 검색이 진행 중이면 검색 레인이 드라이버를 반납할 때까지 계속 기다리고, 제한 시간은 검색이 끝난 뒤부터 셈
+            waited = 0
+            while True:
+                if should_stop() or (discovery_done.is_set() and url_queue.empty()):
+                    return
                 try:
-                    # "홈페이지" 텍스트가 있는 dt 요소 찾기
-                    dt_elements = driver.find_elements(By.XPATH, "//dt[contains(text(), '홈페이지')]")
-                    print(f"[사람인 상세페이지] 방법1: dt 요소 {len(dt_elements)}개 발견")
-                    for dt in dt_elements:
-                        try:
-                            # 다음 형제 dd 요소 찾기
-                            dd = dt.find_element(By.XPATH, "./following-sibling::dd[1]")
-                            # dd 안의 링크 찾기
-                            link = dd.find_element(By.CSS_SELECTOR, "a[href^='http']")
-                            homepage_url = link.get_attribute("href")
-                            if homepage_url:
-                                print(f"[사람인 상세페이지] 방법1 성공: {homepage_url}")
-                                break
-                        except:
-                            try:
-                                # dd 안에 직접 텍스트로 URL이 있을 수도 있음
-                                dd = dt.find_element(By.XPATH, "./following-sibling::dd[1]")
-                                dd_text = dd.text.strip()
-                                if dd_text.startswith("http"):
-                                    homepage_url = dd_text.split()[0]  # 첫 번째 단어가 URL일 가능성
-                                    print(f"[사람인 상세페이지] 방법1 성공 (텍스트): {homepage_url}")
-                                    break
-                            except:
-                                pass
+                    worker_driver = driver_pool.acquire(timeout=1)
+                    break
+                except TimeoutError:
+                    if not discovery_done.is_set():
+                        continue
+                    waited += 1
+                    if waited >= EXTRA_WORKER_ACQUIRE_TIMEOUT:
+                        print(f"[디버깅] [작업자 {worker_no}] 드라이버를 받지 못해 종료 ({EXTRA_WORKER_ACQUIRE_TIMEOUT}초 대기)")
+                        return
                 except Exception as e:
-                    print(f"[사람인 상세페이지] 방법1 오류: {e}")
-                    pass
-                
-                # 방법 2: 페이지 텍스트에서 정규식으로 찾기
-                if not homepage_url:
-                    try:
-                        body_text = driver.find_element(By.TAG_NAME, "body").text
-                        homepage_patterns = [
-                            r'홈페이지\s*[:\s]\s*(https?://[^\s\n\r]+)',
-                            r'홈페이지\s*[:\s]\s*(www\.[^\s\n\r]+)',
-                            r'홈페이지[^\n]*?(https?://[^\s\n\r]+)',
-                        ]
-                        for pattern in homepage_patterns:
-                            match = re.search(pattern, body_text)
-                            if match:
-                                homepage_url = match.group(1).strip()
-                                # URL이 잘린 경우 처리
-                                if homepage_url.endswith('...'):
-                                    homepage_url = homepage_url[:-3]
-                                if not homepage_url.startswith("http"):
-                                    homepage_url = "http://" + homepage_url
-                                break
-                    except:
-                        pass
-                
-                # 방법 3: 모든 외부 링크를 검사하여 홈페이지 찾기
-                if not homepage_url:
-                    try:
-                        all_links = driver.find_elements(By.CSS_SELECTOR, "a[href^='http']:not([href*='saramin.co.kr'])")
-                        for link in all_links:
-                            href = link.get_attribute("href")
-                            if href and not any(x in href.lower() for x in ['saramin', 'jobkorea', 'albamon', 'facebook', 'twitter', 'instagram', 'linkedin', 'youtube']):
-                                # 링크의 부모 요소나 형제 요소에서 "홈페이지" 텍스트 확인
-                                try:
-                                    # 링크의 부모 요소들 확인
-                                    parent = link.find_element(By.XPATH, "./ancestor::*[contains(text(), '홈페이지')]")
-                                    if parent:
-                                        homepage_url = href
-                                        break
-                                except:
-                                    try:
-                                        # 링크의 이전 형제 요소 확인
-                                        prev_sibling = link.find_element(By.XPATH, "./preceding-sibling::*[contains(text(), '홈페이지')]")
-                                        if prev_sibling:
-                                            homepage_url = href
-                                            break
-                                    except:
-                                        pass
-                    except:
-                        pass
-                
-                # 방법 4: 기업정보 섹션에서 직접 찾기
-                if not homepage_url:
-                    try:
-                        company_info_section = driver.find_elements(By.CSS_SELECTOR, ".company_info, .company-detail, .company_detail, .info_list, dl.info_list, .company-detail-info")
-                        for section in company_info_section:
-                            try:
-                                links = section.find_elements(By.CSS_SELECTOR, "a[href^='http']:not([href*='saramin'])")
-                                for link in links:
-                                    href = link.get_attribute("href")
-                                    if href and not any(x in href.lower() for x in ['saramin', 'jobkorea', 'albamon', 'facebook', 'twitter', 'instagram', 'linkedin', 'youtube']):
-                                        # 링크 주변 텍스트 확인
-                                        try:
-                                            link_text = link.text.strip()
-                                            parent = link.find_element(By.XPATH, "./..")
-                                            parent_text = parent.text
-                                            # "홈페이지" 텍스트가 있거나, 링크가 외부 도메인인 경우
-                                            if "홈페이지" in parent_text or "홈페이지" in link_text or (href.startswith("http") and "." in href.split("//")[1].split("/")[0]):
-                                                homepage_url = href
-                                                break
-                                        except:
-                                            # 링크만으로 판단 (외부 도메인)
-                                            if href.startswith("http") and "." in href.split("//")[1].split("/")[0]:
-                                                homepage_url = href
-                                                break
-                                if homepage_url:
-                                    break
-                            except:
-                                pass
-                    except:
-                        pass
-                
-                # 방법 5: 페이지에서 "홈페이지" 텍스트 옆의 모든 외부 링크 확인
-                if not homepage_url:
-                    try:
-                        # "홈페이지" 텍스트가 있는 모든 요소 찾기
-                        homepage_labels = driver.find_elements(By.XPATH, "//*[contains(text(), '홈페이지')]")
-                        for label in homepage_labels:
-                            try:
-                                # 부모 요소에서 링크 찾기
-                                parent = label.find_element(By.XPATH, "./ancestor::*[contains(@class, 'info') or contains(@class, 'detail') or contains(@class, 'company')][1]")
-                                links = parent.find_elements(By.CSS_SELECTOR, "a[href^='http']:not([href*='saramin'])")
-                                for link in links:
-                                    href = link.get_attribute("href")
-                                    if href and not any(x in href.lower() for x in ['saramin', 'jobkorea', 'albamon', 'facebook', 'twitter', 'instagram']):
-                                        homepage_url = href
-                                        break
-                                if homepage_url:
-                                    break
-                            except:
-                                pass
-                    except:
-                        pass
-                
-                # 홈페이지가 있으면 홈페이지로 이동해서 footer에서 이메일 추출
-                if homepage_url:
-                    print(f"[사람인 상세페이지] 홈페이지 URL 발견: {homepage_url}")
-                    try:
-                        print(f"[사람인 상세페이지] 홈페이지로 이동 중: {homepage_url}")
-                        driver.get(homepage_url)
-                        time.sleep(2)
-                        print(f"[사람인 상세페이지] 홈페이지 접근 완료: {driver.title}")
-                        
-                        # 페이지 하단으로 스크롤하여 footer 로드
-                        try:
-                            # 페이지 끝까지 스크롤
-                            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                            time.sleep(1)
-                            # 추가로 스크롤 (일부 사이트는 동적 로딩)
-                            driver.execute_script("window.scrollTo(0, document.documentElement.scrollHeight);")
-                            time.sleep(1)
-                            # footer 요소가 보이도록 스크롤
-                            try:
-                                footer_elem = driver.find_element(By.CSS_SELECTOR, "footer, #footer, .footer")
-                                driver.execute_script("arguments[0].scrollIntoView(true);", footer_elem)
-                                time.sleep(1)
-                            except:
-                                pass
-                        except:
-                            pass
-                        
-                        # footer에서 이메일 추출 (더 정확하게)
-                        print(f"[사람인 상세페이지] footer에서 이메일 추출 시작...")
-                        footer_selectors = [
-                            "footer",
-                            "#footer",
-                            ".footer",
-                            "div[class*='footer']",
-                            "div[id*='footer']",
-                            "div[class*='Footer']",
-                            "div[id*='Footer']",
-                            ".site-footer",
-                            "#site-footer",
-                            "footer *",
-                            ".footer *",
-                            "#footer *",
-                        ]
-                        
-                        footer_elements = []
-                        footer_htmls = []
-                        
-                        # 모든 footer 요소 찾기
-                        for selector in footer_selectors:
-                            try:
-                                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                                for elem in elements:
-                                    try:
-                                        # footer 요소 자체와 그 하위 요소들 모두 수집
-                                        if elem.tag_name.lower() in ['footer', 'div', 'section']:
-                                            footer_elements.append(elem)
-                                    except:
-                                        pass
-                            except:
-                                pass
-                        
-                        print(f"[사람인 상세페이지] footer 요소 {len(footer_elements)}개 발견")
-                        
-                        # 중복 제거 (같은 요소는 한 번만)
-                        seen_elements = set()
-                        unique_footer_elements = []
-                        for elem in footer_elements:
-                            try:
-                                elem_id = elem.id
-                                if elem_id not in seen_elements:
-                                    seen_elements.add(elem_id)
-                                    unique_footer_elements.append(elem)
-                            except:
-                                unique_footer_elements.append(elem)
-                        
-                        # footer 요소들의 HTML과 텍스트 수집
-                        all_footer_text = ""
-                        all_footer_html = ""
-                        for footer_elem in unique_footer_elements:
-                            try:
-                                text = footer_elem.text
-                                html = footer_elem.get_attribute("innerHTML") or footer_elem.get_attribute("outerHTML") or ""
-                                if text:
-                                    all_footer_text += "\n" + text
-                                if html:
-                                    all_footer_html += "\n" + html
-                            except:
-                                pass
-                        
-                        # footer HTML에서 이메일 추출 (정규식으로)
-                        if all_footer_html or all_footer_text:
-                            email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-                            found_emails = []
-                            
-                            # HTML에서 먼저 찾기 (더 정확함)
-                            if all_footer_html:
-                                found_emails.extend(re.findall(email_pattern, all_footer_html))
-                            
-                            # 텍스트에서도 찾기
-                            if all_footer_text:
-                                found_emails.extend(re.findall(email_pattern, all_footer_text))
-                            
-                            # 불필요한 이메일 제외
-                            real_emails = []
-                            for email in found_emails:
-                                email_lower = email.lower()
-                                # 이미지 파일명 제외
-                                if email_lower.endswith(('.png', '.jpg', '.gif', '.svg', '.jpeg', '.webp', '.ico', '.css', '.js')):
-                                    continue
-                                # noreply 등 제외
-                                if any(x in email_lower for x in ['noreply', 'no-reply', 'donotreply', 'example.com', 'test.com', 'sample.com', 'placeholder']):
-                                    continue
-                                # 시스템 이메일은 포함 (admin@, webmaster@ 등)
-                                real_emails.append(email)
-                            
-                            if real_emails:
-                                # 중복 제거하고 최대 3개
-                                unique_emails = list(set(real_emails))[:3]
-                                info["이메일"] = ", ".join(unique_emails)
-                                print(f"[사람인 상세페이지] 이메일 발견: {info['이메일']}")
-                            else:
-                                print(f"[사람인 상세페이지] footer에서 이메일을 찾지 못함")
-                        
-                        # footer에서 mailto 링크 찾기 (더 정확하게)
-                        if not info["이메일"]:
-                            mailto_selectors = [
-                                "footer a[href^='mailto:']",
-                                "#footer a[href^='mailto:']",
-                                ".footer a[href^='mailto:']",
-                                "footer a[href*='mailto']",
-                                "#footer a[href*='mailto']",
-                                ".footer a[href*='mailto']",
-                            ]
-                            for selector in mailto_selectors:
-                                try:
-                                    mailto_links = driver.find_elements(By.CSS_SELECTOR, selector)
-                                    for link in mailto_links:
-                                        try:
-                                            href = link.get_attribute("href")
-                                            if href and "mailto:" in href:
-                                                email = href.split("mailto:")[1].split("?")[0].split("&")[0].strip()
-                                                if email and "@" in email and "." in email:
-                                                    info["이메일"] = email
-                                                    break
-                                        except:
-                                            pass
-                                    if info["이메일"]:
-                                        break
-                                except:
-                                    pass
-                        
-                        # footer에서 "E-Mail", "이메일", "Email" 등의 텍스트 옆에 있는 이메일 찾기
-                        if not info["이메일"]:
-                            try:
-                                # "E-Mail", "이메일", "Email" 등의 텍스트가 있는 요소 찾기
-                                email_label_patterns = [
-                                    "//*[contains(text(), 'E-Mail')]",
-                                    "//*[contains(text(), '이메일')]",
-                                    "//*[contains(text(), 'Email')]",
-                                    "//*[contains(text(), 'e-mail')]",
-                                    "//*[contains(text(), 'E-mail')]",
-                                ]
-                                
-                                for pattern in email_label_patterns:
-                                    try:
-                                        labels = driver.find_elements(By.XPATH, pattern)
-                                        for label in labels:
-                                            try:
-                                                # 형제 요소나 부모 요소에서 이메일 찾기
-                                                parent = label.find_element(By.XPATH, "./..")
-                                                parent_text = parent.text
-                                                parent_html = parent.get_attribute("innerHTML") or ""
-                                                
-                                                email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-                                                emails = re.findall(email_pattern, parent_text + " " + parent_html)
-                                                
-                                                if emails:
-                                                    email = emails[0]
-                                                    email_lower = email.lower()
-                                                    # noreply, example, test만 제외 (시스템 이메일은 포함)
-                                                    if not any(x in email_lower for x in ['noreply', 'no-reply', 'example', 'test']):
-                                                        info["이메일"] = email
-                                                        break
-                                            except:
-                                                pass
-                                        if info["이메일"]:
-                                            break
-                                    except:
-                                        pass
-                            except:
-                                pass
-                        
-                        # footer에서 이메일을 못 찾았으면 전체 페이지에서 찾기 (더 강화)
-                        if not info["이메일"]:
-                            try:
-                                # 전체 페이지 HTML과 텍스트 모두 검사
-                                body_elem = driver.find_element(By.TAG_NAME, "body")
-                                body_text = body_elem.text
-                                body_html = body_elem.get_attribute("innerHTML") or body_elem.get_attribute("outerHTML") or ""
-                                
-                                email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-                                found_emails = []
-                                
-                                # HTML에서 먼저 찾기 (더 정확함)
-                                if body_html:
-                                    found_emails.extend(re.findall(email_pattern, body_html))
-                                
-                                # 텍스트에서도 찾기
-                                if body_text:
-                                    found_emails.extend(re.findall(email_pattern, body_text))
-                                
-                                # 불필요한 이메일 제외
-                                real_emails = []
-                                for email in found_emails:
-                                    email_lower = email.lower()
-                                    # 이미지 파일명 제외
-                                    if email_lower.endswith(('.png', '.jpg', '.gif', '.svg', '.jpeg', '.webp', '.ico', '.css', '.js')):
-                                        continue
-                                    # noreply 등 제외
-                                    if any(x in email_lower for x in ['noreply', 'no-reply', 'donotreply', 'example.com', 'test.com', 'sample.com', 'placeholder']):
-                                        continue
-                                    real_emails.append(email)
-                                
-                                if real_emails:
-                                    # 중복 제거하고 최대 3개
-                                    unique_emails = list(set(real_emails))[:3]
-                                    info["이메일"] = ", ".join(unique_emails)
-                            except:
-                                pass
-                        
-                        # 여전히 이메일을 못 찾았으면 전체 페이지에서 찾기 (더 강화)
-                        if not info["이메일"]:
-                            try:
-                                print(f"[사람인 상세페이지] 전체 페이지에서 이메일 추출 시도...")
-                                # 페이지 전체 HTML과 텍스트 모두 검사
-                                body_elem = driver.find_element(By.TAG_NAME, "body")
-                                body_text = body_elem.text
-                                body_html = body_elem.get_attribute("innerHTML") or body_elem.get_attribute("outerHTML") or ""
-                                
-                                email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-                                found_emails = []
-                                
-                                # HTML에서 먼저 찾기 (더 정확함)
-                                if body_html:
-                                    found_emails.extend(re.findall(email_pattern, body_html))
-                                
-                                # 텍스트에서도 찾기
-                                if body_text:
-                                    found_emails.extend(re.findall(email_pattern, body_text))
-                                
-                                # 불필요한 이메일 제외
-                                real_emails = []
-                                for email in found_emails:
-                                    email_lower = email.lower()
-                                    # 이미지 파일명 제외
-                                    if email_lower.endswith(('.png', '.jpg', '.gif', '.svg', '.jpeg', '.webp', '.ico', '.css', '.js')):
-                                        continue
-                                    # noreply 등 제외
-                                    if any(x in email_lower for x in ['noreply', 'no-reply', 'donotreply', 'example.com', 'test.com', 'sample.com', 'placeholder']):
-                                        continue
-                                    real_emails.append(email)
-                                
-                                if real_emails:
-                                    # 중복 제거하고 최대 3개
-                                    unique_emails = list(set(real_emails))[:3]
-                                    info["이메일"] = ", ".join(unique_emails)
-                                    print(f"[사람인 상세페이지] 전체 페이지에서 이메일 발견: {info['이메일']}")
-                            except Exception as e:
-                                print(f"[사람인 상세페이지] 전체 페이지 이메일 추출 오류: {e}")
-                                pass
-                        
-                        # URL을 홈페이지로 업데이트
-                        info["URL"] = homepage_url
-                        
-                        # 홈페이지에서 회사 정보 추출 강화
-                        print(f"[사람인 상세페이지] 홈페이지에서 회사 정보 추출 시작...")
-                        try:
-                            body_elem = driver.find_element(By.TAG_NAME, "body")
-                            body_text = body_elem.text
-                            body_html = body_elem.get_attribute("innerHTML") or ""
-                            
-                            # 회사명 추출 (홈페이지에서)
-                            if not info["회사명"]:
-                                company_selectors_homepage = [
-                                    "h1", "h2", ".company_name", ".corp_name", 
-                                    ".site-title", ".logo", "[class*='company']",
-                                    "[class*='corp']", ".brand", ".site-name"
-                                ]
-                                for selector in company_selectors_homepage:
-                                    try:
-                                        elems = driver.find_elements(By.CSS_SELECTOR, selector)
-                                        for elem in elems:
-                                            text = elem.text.strip()
-                                            if text and len(text) > 2 and len(text) < 50:
-                                                # 이상한 텍스트 필터링
-                                                if not any(x in text for x in ['에 대해', '많은 사람', '궁금해', '검색', '사람인', 'HOME', 'MENU']):
-                                                    info["회사명"] = text
-                                                    print(f"[사람인 상세페이지] 회사명 추출 (홈페이지): {text}")
-                                                    break
-                                        if info["회사명"]:
-                                            break
-                                    except:
-                                        pass
-                                
-                                # 정규식으로 회사명 추출
-                                if not info["회사명"]:
-                                    company_patterns = [
-                                        r'(?:회사명|상호|법인명|업체명|기업명)\s*[:\s]\s*([^\n\r,|(]{2,30})',
-                                        r'\(주\)\s*([가-힣a-zA-Z0-9\s]{2,20})',
-                                        r'([가-힣]{2,15}(?:주식회사|㈜|\(주\)))',
-                                        r'((?:주식회사|㈜)\s*[가-힣a-zA-Z0-9]{2,15})',
-                                    ]
-                                    for pattern in company_patterns:
-                                        match = re.search(pattern, body_text)
-                                        if match:
-                                            company_name = match.group(1).strip()
-                                            if len(company_name) > 2:
-                                                info["회사명"] = company_name
-                                                print(f"[사람인 상세페이지] 회사명 추출 (정규식): {company_name}")
-                                                break
-                            
-                            # 대표자명 추출 (홈페이지에서)
-                            if not info["대표자명"]:
-                                ceo_patterns = [
-                                    r'(?:대표자?|대표이사|CEO|대표자명)\s*[:\s]\s*([가-힣]{2,5})',
-                                    r'대표이사\s*([가-힣]{2,5})',
-                                    r'CEO\s*[:\s]\s*([가-힣]{2,5})',
-                                ]
-                                for pattern in ceo_patterns:
-                                    match = re.search(pattern, body_text, re.IGNORECASE)
-                                    if match:
-                                        ceo_name = match.group(1).strip()
-                                        if len(ceo_name) >= 2:
-                                            info["대표자명"] = ceo_name
-                                            print(f"[사람인 상세페이지] 대표자명 추출: {ceo_name}")
-                                            break
-                            
-                            # 회사 주소 추출 (홈페이지에서)
-                            if not info["회사주소"]:
-                                address_patterns = [
-                                    r'(?:주소|소재지|사업장\s*소재지|본사)\s*[:\s]\s*([^\n\r]{10,80})',
-                                    r'((?:서울|부산|대구|인천|광주|대전|울산|세종|경기|강원|충북|충남|전북|전남|경북|경남|제주)[^\n\r]{10,70})',
-                                ]
-                                for pattern in address_patterns:
-                                    match = re.search(pattern, body_text)
-                                    if match:
-                                        addr = match.group(1).strip()[:80]
-                                        info["회사주소"] = addr
-                                        print(f"[사람인 상세페이지] 회사주소 추출: {addr}")
-                                        break
-                        except Exception as e:
-                            print(f"[사람인 상세페이지] 회사 정보 추출 오류: {e}")
-                            pass
-                    except Exception as e:
-                        print(f"[사람인 상세페이지] 홈페이지 처리 오류: {e}")
-                        import traceback
-                        print(traceback.format_exc())
-                        pass
-                else:
-                    # 홈페이지를 못 찾았으면 사람인 페이지에서 직접 이메일 추출 시도
-                    print(f"[사람인 상세페이지] 홈페이지 URL을 찾지 못함 - 사람인 페이지에서 직접 이메일 추출 시도")
-                    try:
-                        email_elements = driver.find_elements(By.CSS_SELECTOR, "a[href^='mailto:'], .email, .contact_email")
-                        print(f"[사람인 상세페이지] 사람인 페이지에서 이메일 요소 {len(email_elements)}개 발견")
-                        for elem in email_elements:
-                            email_text = elem.get_attribute("href") or elem.text
-                            if "@" in email_text:
-                                email_match = re.search(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', email_text)
-                                if email_match:
-                                    info["이메일"] = email_match.group(0)
-                                    print(f"[사람인 상세페이지] 사람인 페이지에서 이메일 발견: {info['이메일']}")
-                                    break
-                    except Exception as e:
-                        print(f"[사람인 상세페이지] 사람인 페이지에서 이메일 추출 오류: {e}")
-                        pass
-            except:
-                pass
-        
-        # 잡코리아 (jobkorea.co.kr)
-        elif "jobkorea.co.kr" in url_lower:
+                    print(f"[디버깅] [작업자 {worker_no}] 드라이버를 받지 못해 종료: {e}")
+                    return
+            with lock:
+                state["extractors"] += 1
+            pages = 0
+            broken = False
+            recycle = False
             try:
-                # 회사명 추출
-                company_selectors = [
-                    "h1.company_name", ".company_name", "div.company_info h2",
-                    ".company_title", "h2.company_title"
-                ]
-                for selector in company_selectors:
-                    try:
-                        elem = driver.find_element(By.CSS_SELECTOR, selector)
-                        if elem.text.strip():
-                            info["회사명"] = elem.text.strip()
-                            break
-                    except:
-                        pass
-                
-                # 이메일 추출
-                email_elements = driver.find_elements(By.CSS_SELECTOR, "a[href^='mailto:'], .email, .contact")
-                for elem in email_elements:
-                    email_text = elem.get_attribute("href") or elem.text
-                    if "@" in email_text:
-                        email_match = re.search(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', email_text)
-                        if email_match:
-                            info["이메일"] = email_match.group(0)
-                            break
-            except:
-                pass
-        
-        # 알바몬 (albamon.com)
-        elif "albamon.com" in url_lower:
-            try:
-                # 회사명 추출
-                company_selectors = [
-                    "h1.company_name", ".company_name", ".company_title",
-                    "div.company_info h2", "h2.company_name"
-                ]
-                for selector in company_selectors:
-                    try:
-                        elem = driver.find_element(By.CSS_SELECTOR, selector)
-                        if elem.text.strip():
-                            info["회사명"] = elem.text.strip()
-                            break
-                    except:
-                        pass
-                
-                # 이메일 추출
-                email_elements = driver.find_elements(By.CSS_SELECTOR, "a[href^='mailto:'], .email, .contact_email")
-                for elem in email_elements:
-                    email_text = elem.get_attribute("href") or elem.text
-                    if "@" in email_text:
-                        email_match = re.search(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', email_text)
-                        if email_match:
-                            info["이메일"] = email_match.group(0)
-                            break
-            except:
-                pass
-        
-        # 일반 이메일 추출 (채용 사이트에서 이메일을 못 찾은 경우 또는 일반 사이트)
-        if not info["이메일"]:
-            email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-            found_emails = re.findall(email_pattern, body_text)
-            real_emails = [e for e in found_emails if not e.lower().endswith(('.png', '.jpg', '.gif', '.svg', '.jpeg', '.webp'))]
-            # 채용 사이트 관련 이메일 제외 (noreply, no-reply 등)
-            real_emails = [e for e in real_emails if not any(x in e.lower() for x in ['noreply', 'no-reply', 'donotreply', 'jobkorea', 'saramin', 'albamon'])]
-            if real_emails:
-                info["이메일"] = ", ".join(set(real_emails[:3]))  # 최대 3개만
-        
-        # 회사명 추출 (채용 사이트에서 못 찾은 경우 또는 일반 사이트)
-        if not info["회사명"]:
-            company_patterns = [
-                r'(?:회사명|상호|법인명|업체명|기업명)\s*[:\s]\s*([^\n\r,|(]{2,30})',
-                r'\(주\)\s*([가-힣a-zA-Z0-9\s]{2,20})',
-                r'([가-힣]{2,15}(?:주식회사|㈜|\(주\)))',
-                r'((?:주식회사|㈜)\s*[가-힣a-zA-Z0-9]{2,15})',
-            ]
-            for pattern in company_patterns:
-                match = re.search(pattern, body_text)
-                if match:
-                    info["회사명"] = match.group(1).strip()
-                    break
-        
-        # 대표자명 추출
-        ceo_patterns = [
-            r'(?:대표자?|대표이사|CEO|대표자명)\s*[:\s]\s*([가-힣]{2,5})',
-            r'대표이사\s*([가-힣]{2,5})',
-        ]
-        for pattern in ceo_patterns:
-            match = re.search(pattern, body_text, re.IGNORECASE)
-            if match:
-                info["대표자명"] = match.group(1).strip()
-                break
-        
-        # 회사 주소 추출
-        address_patterns = [
-            r'(?:주소|소재지|사업장\s*소재지|본사)\s*[:\s]\s*([^\n\r]{10,80})',
-            r'((?:서울|부산|대구|인천|광주|대전|울산|세종|경기|강원|충북|충남|전북|전남|경북|경남|제주)[^\n\r]{10,70})',
-        ]
-        for pattern in address_patterns:
-            match = re.search(pattern, body_text)
-            if match:
-                addr = match.group(1).strip()[:80]
-                info["회사주소"] = addr
-                break
-        
-        return info
-    except:
-        return info
+                pages, recycle = work(worker_driver, worker_no)
+            except Exception:
+                broken = True
+            finally:
+                with lock:
+                    state["extractors"] -= 1
+                driver_pool.release(worker_driver, pages=pages, broken=broken)
+            if recycle:
+                print(f"[디버깅] [작업자 {worker_no}] 메모리 상한 초과로 드라이버 교체")
+    
+    # 재개한 작업이면 저장된 URL 중 아직 방문하지 않은 URL부터 처리
+    if job_id:
+        for url in job_store.all_urls(job_id):
+            domain_index.setdefault(dedup_key(url), url)
+        resumed_keys.update(domain_index)
+        pending = job_store.pending_urls(job_id)
+        if pending:
+            print(f"[디버깅] 이전에 수집한 URL {len(pending)}개부터 처리")
+            enqueue(pending)
+    
+    workers = max(1, min(workers, DRIVER_POOL_SIZE))
+    threads = []
+    for worker_no in range(1, workers + 1):
+        thread = threading.Thread(target=pool_worker, args=(worker_no,), daemon=True)
+        thread.start()
+        threads.append(thread)
+    print(f"[디버깅] 상세 페이지 수집 작업자 {workers}개 시작 (검색과 동시에 진행)")
+    
+    main_pages = 0
+    try:
+        main_pages = discover(driver, feed, should_stop, covered)
+        discovery_done.set()
+        print(f"[디버깅] 검색 완료: 총 {state['queued']}개 URL (같은 사이트로 합친 URL {state['merged']}개)")
+        # 검색이 끝난 드라이버도 상세 페이지 수집에 합류 (풀에서 드라이버를 못 받은 작업자 대신)
+        if state["extractors"] < workers:
+            main_pages += work(driver, 0)[0]
+    except Exception:
+        done.set()
+        raise
+    finally:
+        discovery_done.set()
+        for thread in threads:
+            thread.join()
+    
+    if session_data["stop_flag"]:
+        session_data["status"]["progress"] = f"정지됨! {len(session_data['results'])}개 회사 정보 수집"
+    
+    return state["duplicate_count"], main_pages
 
 
-def run_crawling(keywords, session_id, max_count=0, search_pages=10):
-    global user_sessions
+def run_crawling(keywords, session_id, max_count=0, search_pages=10, workers=1, job_id=None):
+    """크롤링 실행 (job_id를 주면 저장된 작업을 마지막 체크포인트부터 이어서 진행)"""
+    job = job_store.get_job(job_id) if job_id else None
+    if job is None:
+        job_id = str(uuid.uuid4())
+        job_store.create_job(job_id, session_id, {
+            "keywords": keywords,
+            "max_count": max_count,
+            "search_pages": search_pages,
+            "workers": workers,
+        })
+        results = []
+        discovered = 0
+    else:
+        results = job_store.load_results(job_id)
+        discovered = job["discovered"]
+        if job["state"] == STATE_QUEUED:
+            job_store.update_job(job_id, state=STATE_DISCOVERING)
+        elif discovered or results:
+            print(f"[세션 {session_id}] 작업 {job_id} 재개 (키워드 {discovered}/{len(keywords)}개 수집 완료, 결과 {len(results)}개)")
     
-    user_sessions[session_id] = {
-        "results": [],
-        "status": {"running": True, "progress": "크롤링 준비 중...", "completed": False},
-        "stop_flag": False
-    }
+    # 대기열에 넣을 때 만든 세션 데이터가 있으면 그대로 사용 (/stream, /jobs에서 보고 있음)
+    session_data = job_sessions.get(job_id)
+    if session_data is None:
+        session_data = new_session_data(job_id)
+        job_sessions[job_id] = session_data
+    session_data["results"] = ResultRows(results)
     
     try:
-        user_sessions[session_id]["status"]["progress"] = "브라우저 드라이버 초기화 중... (ChromeDriver 다운로드 중일 수 있습니다)"
-        print(f"[세션 {session_id}] 드라이버 초기화 시작")
-        
-        # 타임아웃을 위한 스레드 처리
-        import threading
-        import queue
-        driver_queue = queue.Queue()
-        error_queue = queue.Queue()
-        
-        def init_driver():
-            try:
-                driver = setup_driver()
-                driver_queue.put(driver)
-            except Exception as e:
-                error_queue.put(e)
-        
-        init_thread = threading.Thread(target=init_driver)
-        init_thread.daemon = True
-        init_thread.start()
-        
-        # 최대 60초 대기
-        init_thread.join(timeout=60)
-        
-        if init_thread.is_alive():
-            error_msg = "드라이버 초기화 타임아웃 (60초 초과). ChromeDriver 다운로드가 너무 오래 걸립니다."
-            print(f"[세션 {session_id}] {error_msg}")
-            user_sessions[session_id]["status"]["progress"] = error_msg
-            user_sessions[session_id]["status"]["running"] = False
-            user_sessions[session_id]["status"]["completed"] = True
-            return
-        
-        if not error_queue.empty():
-            e = error_queue.get()
-            raise e
-        
-        if driver_queue.empty():
-            raise Exception("드라이버 초기화 실패: 결과를 받지 못했습니다.")
-        
-        driver = driver_queue.get()
-        print(f"[세션 {session_id}] 드라이버 초기화 완료")
-        user_sessions[session_id]["status"]["progress"] = "드라이버 초기화 완료. 크롤링 시작..."
+        session_data["status"]["progress"] = "브라우저 드라이버 대기 중..."
+        print(f"[세션 {session_id}] 드라이버 체크아웃 시작 (풀 상태: {driver_pool.stats()})")
+        
+        # 풀에서 미리 띄워둔 드라이버를 가져옴 (풀이 가득 차 있으면 반납될 때까지 대기)
+        driver = driver_pool.acquire(timeout=DRIVER_ACQUIRE_TIMEOUT)
+        print(f"[세션 {session_id}] 드라이버 체크아웃 완료")
+        session_data["status"]["progress"] = "드라이버 준비 완료. 크롤링 시작..."
+    except TimeoutError:
+        error_msg = f"브라우저 대기 타임아웃 ({DRIVER_ACQUIRE_TIMEOUT}초 초과). 다른 크롤링이 끝난 후 다시 시도해주세요."
+        print(f"[세션 {session_id}] {error_msg}")
+        session_data["status"]["progress"] = error_msg
+        session_data["status"]["running"] = False
+        session_data["status"]["completed"] = True
+        job_store.update_job(job_id, state=STATE_FAILED, progress=error_msg)
+        notify_session(session_data)
+        return
     except Exception as e:
         error_msg = f"드라이버 초기화 실패: {str(e)[:100]}"
         print(f"[세션 {session_id}] {error_msg}")
         print(f"[세션 {session_id}] 전체 에러: {str(e)}")
         import traceback
         print(traceback.format_exc())
-        user_sessions[session_id]["status"]["progress"] = error_msg
-        user_sessions[session_id]["status"]["running"] = False
-        user_sessions[session_id]["status"]["completed"] = True
+        session_data["status"]["progress"] = error_msg
+        session_data["status"]["running"] = False
+        session_data["status"]["completed"] = True
+        job_store.update_job(job_id, state=STATE_FAILED, progress=error_msg)
+        notify_session(session_data)
         return
     
-    try:
-        # URL 수집 (네이버 + 다음 + 사람인 + 잡코리아 + 알바몬)
-        # URL은 충분히 많이 수집해야 함 (이메일이 없는 회사도 많으므로)
-        # 목표 개수는 회사 정보 수집 단계에서만 체크
-        all_urls = []
+    pages_visited = 0
+    driver_broken = False
+    
+    def discover(discover_driver, feed, should_stop, covered):
+        """키워드별 URL 수집 (DISCOVERY_SOURCES - 기본은 네이버 + 다음 + 사람인 + 잡코리아 + 알바몬)
+        
+        (키워드 x 출처) 작업을 브라우저/HTTP 레인에서 동시에 실행하고, 페이지마다 찾은 URL을 feed로 바로 넘겨서
+        상세 페이지 수집과 동시에 진행한다.
+        키워드마다 출처들이 search_pages x 출처 수 만큼의 페이지 예산을 나눠 쓰고, 새 링크가 잘 나오지 않는 출처는
+        일찍 멈춰서 남은 예산을 다른 출처가 쓴다. 대기 중인 URL로 목표 개수를 채울 수 있을 것 같으면 검색을 멈춘다.
+        앞의 키워드까지 검색이 모두 끝날 때마다 체크포인트를 기록한다 (재시작 시 끝난 키워드는 건너뜀).
+        """
+        controllers = {}
+        left = {}  # 키워드 순번 -> 남은 작업 수
+        tasks = []
         for i, keyword in enumerate(keywords):
-            # 정지 버튼 체크
-            if user_sessions[session_id]["stop_flag"]:
-                break
-                
-            if keyword.strip():
-                # 네이버 검색 (파워링크 포함)
-                user_sessions[session_id]["status"]["progress"] = f"'{keyword}' 네이버 검색 중... ({i+1}/{len(keywords)}) [파워링크 포함]"
-                naver_urls = get_naver_links(driver, keyword.strip(), pages=search_pages, max_urls=0)
-                all_urls.extend(naver_urls)
-                user_sessions[session_id]["status"]["progress"] = f"'{keyword}' 네이버 검색 완료: {len(naver_urls)}개 링크 발견"
-                
-                # 정지 버튼 체크
-                if user_sessions[session_id]["stop_flag"]:
-                    break
-                
-                # 사람인 검색 (테스트용 1페이지만)
-                user_sessions[session_id]["status"]["progress"] = f"'{keyword}' 사람인 검색 중... ({i+1}/{len(keywords)}) [1페이지]"
-                saramin_urls = get_saramin_company_links(driver, keyword.strip(), pages=1, max_urls=0)
-                all_urls.extend(saramin_urls)
-                user_sessions[session_id]["status"]["progress"] = f"'{keyword}' 사람인 검색 완료: {len(saramin_urls)}개 링크 발견"
-                # 
-                # # 정지 버튼 체크
-                # if user_sessions[session_id]["stop_flag"]:
-                #     break
-                # 
-                # # 다음 검색 (주석처리 - 디버깅용)
-                # user_sessions[session_id]["status"]["progress"] = f"'{keyword}' 다음 검색 중... ({i+1}/{len(keywords)})"
-                # daum_urls = get_daum_links(driver, keyword.strip(), pages=search_pages, max_urls=0)
-                # all_urls.extend(daum_urls)
-                # 
-                # # 정지 버튼 체크
-                # if user_sessions[session_id]["stop_flag"]:
-                #     break
-                # 
-                # # 잡코리아 검색 (주석처리 - 디버깅용)
-                # user_sessions[session_id]["status"]["progress"] = f"'{keyword}' 잡코리아 검색 중... ({i+1}/{len(keywords)})"
-                # jobkorea_urls = get_jobkorea_company_links(driver, keyword.strip(), pages=search_pages, max_urls=0)
-                # all_urls.extend(jobkorea_urls)
-                # 
-                # # 정지 버튼 체크
-                # if user_sessions[session_id]["stop_flag"]:
-                #     break
-                # 
-                # # 알바몬 검색 (주석처리 - 디버깅용)
-                # user_sessions[session_id]["status"]["progress"] = f"'{keyword}' 알바몬 검색 중... ({i+1}/{len(keywords)})"
-                # albamon_urls = get_albamon_company_links(driver, keyword.strip(), pages=search_pages, max_urls=0)
-                # all_urls.extend(albamon_urls)
+            if i < discovered or not keyword.strip():
+                continue
+            controllers[i] = PaginationController(DISCOVERY_SOURCES, budget=search_pages * len(DISCOVERY_SOURCES),
+                                                  max_pages=search_pages * 3, covered=covered)
+            left[i] = len(DISCOVERY_SOURCES)
+            tasks.extend(Task(i, keyword.strip(), SOURCES[name]) for name in DISCOVERY_SOURCES)
+        checkpoint = {"next": discovered}
+        checkpoint_lock = threading.Lock()
+        
+        def run(lane_driver, task):
+            session_data["status"]["progress"] = f"'{task.keyword}' {task.source.label} 검색 중... ({task.index + 1}/{len(keywords)})"
+            controller = controllers[task.index]
+            found = collect(lane_driver, task.source, task.keyword, pages=search_pages, max_urls=0,
+                            on_links=feed, should_stop=should_stop, controller=controller)
+            print(f"[디버깅] '{task.keyword}' {task.source.label} 검색 완료: {len(found)}개 링크 발견")
+            # 드라이버 재생성 기준(max_pages)에는 이 레인의 브라우저로 연 페이지만 셈 (캐시/HTTP 제외)
+            return controller.summary()[task.source.name]["browser_pages"] if lane_driver is not None else 0
+        
+        def on_done(task):
+            # 앞의 키워드가 모두 끝난 데까지만 체크포인트 기록 (중간에 끊긴 키워드는 재개 시 다시 수집)
+            with checkpoint_lock:
+                left[task.index] -= 1
+                if left[task.index] == 0:
+                    summary = ", ".join(f"{SOURCES[name].label} {stats['pages']}페이지/새 링크 {stats['links']}개"
+                                        for name, stats in controllers[task.index].summary().items())
+                    print(f"[디버깅] '{task.keyword}' 검색 페이지 사용: {summary}")
+                advanced = checkpoint["next"]
+                while advanced < len(keywords) and left.get(advanced, 0) == 0:
+                    advanced += 1
+                if advanced != checkpoint["next"]:
+                    checkpoint["next"] = advanced
+                    job_store.update_job(job_id, discovered=advanced)
+        
+        lanes = DiscoveryLanes(
+            run,
+            acquire=lambda: driver_pool.acquire(timeout=DISCOVERY_LANE_ACQUIRE_TIMEOUT),
+            release=driver_pool.release,
+            browser_lanes=DISCOVERY_BROWSER_LANES,
+            http_lanes=DISCOVERY_HTTP_LANES,
+            should_stop=should_stop,
+            on_done=on_done,
+        )
+        pages = lanes.execute(discover_driver, tasks)
+        
+        if not should_stop():
+            job_store.update_job(job_id, discovered=len(keywords), state=STATE_EXTRACTING)
+        return pages
+    
+    try:
+        session_data["status"]["progress"] = f"검색 시작... (목표: {max_count if max_count > 0 else '무제한'}개)"
         
-        target_urls = list(set(all_urls))
-        total_sites = len(target_urls)
-        print(f"[디버깅] 총 수집된 URL: {len(all_urls)}개, 중복 제거 후: {total_sites}개")
+        # URL 수집과 회사 정보 수집을 동시에 진행 - 목표 개수에 도달하면 검색도 중단 (여러 브라우저로 병렬 처리)
+        duplicate_count, driver_pages = extract_with_workers(driver, session_data, discover, max_count, workers, job_id)
+        pages_visited += driver_pages
         
         # 링크가 없으면 에러 메시지 출력하고 종료
-        if total_sites == 0:
+        if not session_data["stop_flag"] and not job_store.all_urls(job_id):
             error_msg = "회사 상세 페이지 링크를 찾지 못했습니다. 사람인 검색 결과 페이지 구조가 변경되었을 수 있습니다."
             print(f"[오류] {error_msg}")
-            user_sessions[session_id]["status"]["progress"] = error_msg
-            user_sessions[session_id]["status"]["completed"] = True
-            user_sessions[session_id]["status"]["running"] = False
-            try:
-                driver.quit()
-            except:
-                pass
+            session_data["status"]["progress"] = error_msg
+            session_data["status"]["completed"] = True
+            job_store.update_job(job_id, state=STATE_COMPLETED, progress=error_msg)
             return
         
-        # 수집된 링크 목록 출력
-        print(f"[디버깅] 수집된 링크 목록 (총 {len(target_urls)}개):")
-        for idx, url in enumerate(target_urls[:20]):  # 최대 20개까지 출력
-            print(f"  {idx+1}. {url}")
-        if len(target_urls) > 20:
-            print(f"  ... 외 {len(target_urls) - 20}개")
-        
-        user_sessions[session_id]["status"]["progress"] = f"총 {total_sites}개 사이트 발견. 정보 수집 중... (목표: {max_count if max_count > 0 else '무제한'}개)"
-        
-        # 중복 체크용 세트
-        seen_urls = set()
-        seen_companies = set()
-        seen_emails = set()
-        
-        duplicate_count = 0
-        
-        # 회사 정보 수집 - 목표 개수에 도달할 때까지 계속
-        for i, url in enumerate(target_urls):
-            print(f"[디버깅] ({i+1}/{total_sites}) 상세 페이지 접근 시도: {url}")
-            # 정지 버튼 체크
-            if user_sessions[session_id]["stop_flag"]:
-                user_sessions[session_id]["status"]["progress"] = f"정지됨! {len(user_sessions[session_id]['results'])}개 회사 정보 수집"
-                break
-            
-            target_text = f"/{max_count}" if max_count > 0 else ""
-            current_count = len(user_sessions[session_id]["results"])
-            user_sessions[session_id]["status"]["progress"] = f"정보 수집 중... ({i+1}/{total_sites}) - 수집: {current_count}{target_text}개"
-            
-            print(f"[디버깅] ({i+1}/{total_sites}) 처리 중: {url}")
-            try:
-                info = extract_company_info(driver, url)
-                print(f"[디버깅] 추출된 정보 - 회사명: '{info['회사명']}', 이메일: '{info['이메일']}'")
-            except Exception as e:
-                print(f"[오류] 상세 페이지 처리 중 오류 발생: {e}")
-                import traceback
-                print(traceback.format_exc())
-                # 오류가 발생해도 기본 정보는 저장
-                info = {
-                    "URL": url,
-                    "사이트명": "",
-                    "회사명": "",
-                    "대표자명": "",
-                    "회사주소": "",
-                    "이메일": ""
-                }
-                info["URL"] = url
-            
-            # 이메일이 없어도 모든 사이트를 결과에 추가 (확인용)
-            # 중복 체크: 이메일 중복만 체크 (URL과 회사명은 완전히 제거 - 모든 방문 사이트 표시)
-            url_base = url.split('?')[0].rstrip('/')  # 쿼리 파라미터 제거
-            company_name = info["회사명"].strip() if info["회사명"] else ""
-            email_key = info["이메일"].lower().strip() if info["이메일"] else ""
-            
-            is_duplicate = False
-            duplicate_reason = ""
-            
-            # 이메일이 있는 경우에만 이메일 중복 체크 (가장 중요)
-            # 같은 이메일이면 중복으로 처리
-            if email_key and email_key in seen_emails:
-                is_duplicate = True
-                duplicate_reason = "이메일 중복"
-            
-            # URL 중복 체크 완전히 제거 - 모든 방문한 사이트를 표시
-            # 회사명 중복 체크도 완전히 제거 - 모든 방문한 사이트를 표시
-            
-            if not is_duplicate:
-                seen_urls.add(url_base)
-                if company_name:
-                    seen_companies.add(company_name)
-                if email_key:
-                    seen_emails.add(email_key)
-                
-                # 이메일이 없어도 모든 사이트 추가
-                user_sessions[session_id]["results"].append(info)
-                print(f"[디버깅] 추가됨 (총 {len(user_sessions[session_id]['results'])}개) - URL: {url_base[:80]}, 회사명: {company_name[:30]}, 이메일: {email_key[:30]}")
-            else:
-                duplicate_count += 1
-                print(f"[디버깅] 중복 제외됨: {duplicate_reason} (총 중복: {duplicate_count}개) - URL: {url_base[:80]}")
-            
-            # 상태 업데이트 (중복 여부와 관계없이 항상 실행)
-            if not info["이메일"]:
-                if "saramin.co.kr" in url.lower() and "/zf_user/company" in url.lower():
-                    if info["URL"] == url:
-                        # 홈페이지를 못 찾은 경우
-                        user_sessions[session_id]["status"]["progress"] = f"정보 수집 중... ({i+1}/{total_sites}) - 수집: {len(user_sessions[session_id]['results'])}{target_text}개 [홈페이지 미발견]"
-                    else:
-                        # 홈페이지로 이동했지만 이메일을 못 찾은 경우
-                        user_sessions[session_id]["status"]["progress"] = f"정보 수집 중... ({i+1}/{total_sites}) - 수집: {len(user_sessions[session_id]['results'])}{target_text}개 [이메일 미발견]"
-                else:
-                    user_sessions[session_id]["status"]["progress"] = f"정보 수집 중... ({i+1}/{total_sites}) - 수집: {len(user_sessions[session_id]['results'])}{target_text}개"
-            
-            # 목표 개수 체크는 이메일이 있는 경우만 (중복 여부와 관계없이 항상 체크)
-            if max_count > 0:
-                # 이메일이 있는 항목만 카운트
-                email_count = sum(1 for r in user_sessions[session_id]["results"] if r.get("이메일") and r.get("이메일") != "-")
-                if email_count >= max_count:
-                    user_sessions[session_id]["status"]["progress"] = f"완료! 이메일 {max_count}개 도달 (목표 달성, 총 {len(user_sessions[session_id]['results'])}개 사이트 수집)"
-                    print(f"[디버깅] 목표 개수 도달! 이메일 {email_count}개 >= 목표 {max_count}개")
-                    break
-        
-        if not user_sessions[session_id]["stop_flag"]:
-            collected_count = len(user_sessions[session_id]['results'])
-            email_collected_count = sum(1 for r in user_sessions[session_id]["results"] if r.get("이메일"))
-            user_sessions[session_id]["status"]["progress"] = f"완료! 총 {collected_count}개 사이트 정보 수집 (이메일 {email_collected_count}개, 중복 제외 {duplicate_count}개)"
+        if not session_data["stop_flag"]:
+            collected_count = len(session_data['results'])
+            email_collected_count = session_data["results"].email_count
+            session_data["status"]["progress"] = f"완료! 총 {collected_count}개 사이트 정보 수집 (이메일 {email_collected_count}개, 중복 제외 {duplicate_count}개)"
             print(f"[디버깅] 최종 결과: 총 {collected_count}개 수집, 이메일 {email_collected_count}개, 중복 제외 {duplicate_count}개")
         
-        user_sessions[session_id]["status"]["completed"] = True
+        session_data["status"]["completed"] = True
+        final_state = STATE_STOPPED if session_data["stop_flag"] else STATE_COMPLETED
+        job_store.update_job(job_id, state=final_state, progress=session_data["status"]["progress"])
         
     except Exception as e:
         # 에러 발생 시 상태 업데이트
         error_msg = str(e)
-        user_sessions[session_id]["status"]["progress"] = f"오류 발생: {error_msg[:100]}"
-        user_sessions[session_id]["status"]["completed"] = True
+        session_data["status"]["progress"] = f"오류 발생: {error_msg[:100]}"
+        session_data["status"]["completed"] = True
+        job_store.update_job(job_id, state=STATE_FAILED, progress=session_data["status"]["progress"])
+        driver_broken = True
         import traceback
         print(f"크롤링 오류: {traceback.format_exc()}")
     finally:
+        # 드라이버는 종료하지 않고 풀에 반납 (다음 세션에서 재사용)
+        driver_pool.release(driver, pages=pages_visited, broken=driver_broken)
+        session_data["status"]["running"] = False
+        notify_session(session_data)
+
+
+def new_session_data(job_id, results=None, running=True, progress="크롤링 준비 중...", completed=False):
+    """세션 데이터 생성 (updated: 결과/상태가 바뀌면 notify_session으로 /stream 대기를 깨움)"""
+    return {
+        "job_id": job_id,
+        "results": ResultRows(results),
+        "status": {"running": running, "progress": progress, "completed": completed},
+        "stop_flag": False,
+        "updated": threading.Condition(),
+    }
+
+
+def notify_session(session_data):
+    with session_data["updated"]:
+        session_data["updated"].notify_all()
+
+
+def get_user_session(session_id):
+    """세션 데이터 조회 (메모리에 없으면 저장소에서 마지막 작업을 불러옴 - 재시작 후 결과 확인용)"""
+    if not session_id:
+        return None
+    if session_id in user_sessions:
+        return user_sessions[session_id]
+    
+    job = job_store.latest_job_for_session(session_id)
+    if job is None:
+        return None
+    user_sessions[session_id] = get_job_session(job["job_id"])
+    return user_sessions[session_id]
+
+
+def get_job_session(job_id):
+    """작업 데이터 조회 (메모리에 없으면 저장소에서 불러옴, 없는 작업이면 None)
+    
+    스케줄러 목록에 없는 끝난 작업은 불러온 데이터를 보관하지 않음 (조회할 때마다 저장소에서 읽음)
+    """
+    if job_id in job_sessions:
+        return job_sessions[job_id]
+    
+    job = job_store.get_job(job_id)
+    if job is None:
+        return None
+    session_data = new_session_data(
+        job_id, job_store.load_results(job_id),
+        running=False, progress=job["progress"], completed=True,
+    )
+    if scheduler.get(job_id) is not None:
+        job_sessions[job_id] = session_data
+    return session_data
+
+
+def submit_crawl_job(owner, keywords, max_count=0, search_pages=10, workers=1, priority=0, job_id=None):
+    """크롤링 작업을 스케줄러 대기열에 추가 (job_id를 주면 저장된 작업을 이어서 진행)
+    
+    반환값: (job_id, 대기 순번, 바로 실행되는지), 제한 초과 시 QuotaExceeded
+    """
+    if job_id is None:
+        scheduler.check_quota(owner)
+        job_id = str(uuid.uuid4())
+        job_store.create_job(job_id, owner, {
+            "keywords": keywords,
+            "max_count": max_count,
+            "search_pages": search_pages,
+            "workers": workers,
+        }, state=STATE_QUEUED)
+    
+    session_data = new_session_data(job_id, progress="실행 대기 중...")
+    job_sessions[job_id] = session_data
+    try:
+        position, started = scheduler.submit(job_id, owner, {
+            "keywords": keywords,
+            "owner": owner,
+            "max_count": max_count,
+            "search_pages": search_pages,
+            "workers": workers,
+        }, priority)
+    except QuotaExceeded as e:
+        finish_cancelled_job(job_id, str(e))
+        raise
+    if not started:
+        session_data["status"]["progress"] = f"실행 대기 중... (앞에 {position}개 작업)" if position else "실행 대기 중... (실행 중인 작업이 끝나면 시작)"
+    return job_id, position, started
+
+
+def run_scheduled_job(job_id, payload):
+    """스케줄러 실행 스레드에서 호출"""
+    run_crawling(payload["keywords"], payload["owner"], payload["max_count"],
+                 payload["search_pages"], payload["workers"], job_id)
+
+
+def finish_cancelled_job(job_id, progress):
+    """실행 전에 취소된 작업 정리"""
+    job_store.update_job(job_id, state=STATE_STOPPED, progress=progress)
+    session_data = job_sessions.get(job_id)
+    if session_data is not None:
+        session_data["status"].update(running=False, completed=True, progress=progress)
+        notify_session(session_data)
+
+
+def cancel_crawl_job(job_id):
+    """작업 취소 (대기 중이면 대기열에서 빼고, 실행 중이면 정지 플래그 설정)
+    
+    반환값: 취소 전 스케줄러 상태 (스케줄러가 모르는 작업이면 None)
+    """
+    previous = scheduler.cancel(job_id)
+    if previous == JOB_QUEUED:
+        finish_cancelled_job(job_id, "취소됨 (실행 전)")
+    elif previous == JOB_RUNNING and job_id in job_sessions:
+        job_sessions[job_id]["stop_flag"] = True
+        notify_session(job_sessions[job_id])
+    return previous
+
+
+# 크롤링 작업 스케줄러 (동시에 실행하는 작업 수 제한 - 브라우저 수가 드라이버 풀 크기를 넘지 않도록)
+scheduler = JobScheduler(
+    run_scheduled_job,
+    max_running=SCHEDULER_MAX_RUNNING,
+    user_quota=SCHEDULER_USER_QUOTA,
+    max_queued=SCHEDULER_MAX_QUEUED,
+    on_forget=lambda job_id: job_sessions.pop(job_id, None),  # 목록에서 빠진 작업은 메모리에서도 정리 (필요하면 저장소에서 다시 불러옴)
+)
+
+# 드라이버 풀/스케줄러/캐시 상태는 /metrics 조회 시점에 계산
+register_gauge(
+    "crawler_driver_pool", "드라이버 풀 상태별 드라이버 수",
+    lambda: {(key,): value for key, value in driver_pool.stats().items()}, ("state",),
+)
+register_gauge(
+    "crawler_driver_rss_bytes", "드라이버(Chrome 프로세스 전체) 메모리 사용량 (마지막 측정값 합계)",
+    lambda: sum(driver_pool.memory()),
+)
+register_gauge(
+    "crawler_scheduler_jobs", "스케줄러 상태별 작업 수",
+    lambda: {(key,): value for key, value in scheduler.stats().items()}, ("state",),
+)
+register_gauge(
+    "crawler_cache_hit_ratio", "캐시 적중률 (시작 이후 누적)",
+    lambda: {(cache.namespace,): cache.stats()["hit_rate"]
+             for cache in (serp_cache, result_cache, redirect_cache, saramin_company_cache)},
+    ("cache",),
+)
+
+
+def resume_unfinished_jobs():
+    """재시작 전에 끝나지 않은 작업을 마지막 체크포인트부터 다시 실행 (스케줄러 대기열에 다시 넣음)"""
+    for job in job_store.unfinished_jobs():
+        params = job["params"]
+        print(f"[재개] 작업 {job['job_id']} (세션 {job['session_id']}, 상태 {job['state']})")
         try:
-            driver.quit()
-        except:
-            pass
-        user_sessions[session_id]["status"]["running"] = False
+            submit_crawl_job(job["session_id"], params["keywords"], params.get("max_count", 0),
+                             params.get("search_pages", 10), params.get("workers", 1), job_id=job["job_id"])
+        except QuotaExceeded as e:
+            print(f"[재개] 작업 {job['job_id']} 재개 실패: {e}")
 
 
 @app.route('/')
@@ -1881,6 +1633,11 @@ def crawl():
         keywords = data.get('keywords', [])
         max_count = data.get('maxCount', 0)  # 0이면 제한 없음
         search_pages = data.get('searchPages', 10)  # 기본 10페이지로 고정
+        try:
+            workers = int(data.get('workers', 1))  # 상세 페이지 병렬 작업자 수
+        except (TypeError, ValueError):
+            return jsonify({"error": "workers는 숫자여야 합니다."}), 400
+        workers = max(1, min(workers, MAX_WORKERS))
         
         # keywords가 리스트가 아닌 경우 처리
         if not isinstance(keywords, list):
@@ -1889,11 +1646,15 @@ def crawl():
         if not keywords or all(k.strip() == '' for k in keywords):
             return jsonify({"error": "검색어를 입력해주세요."}), 400
         
-        # 백그라운드에서 크롤링 실행
-        thread = threading.Thread(target=run_crawling, args=(keywords, session_id, max_count, search_pages))
-        thread.start()
+        # 스케줄러 대기열에 추가 (실행 중인 작업이 많으면 순서대로 실행)
+        try:
+            job_id, position, started = submit_crawl_job(session_id, keywords, max_count, search_pages, workers)
+        except QuotaExceeded as e:
+            return jsonify({"error": str(e)}), 429
+        user_sessions[session_id] = job_sessions[job_id]
         
-        return jsonify({"message": "크롤링을 시작합니다."})
+        message = "크롤링을 시작합니다." if started else f"크롤링 대기열에 추가했습니다. (앞에 {position}개 작업)"
+        return jsonify({"message": message, "workers": workers, "job_id": job_id, "position": position, "started": started})
     except Exception as e:
         import traceback
         error_msg = str(e)
@@ -1910,15 +1671,18 @@ def crawl():
 @app.route('/stop', methods=['POST'])
 def stop():
     session_id = session.get('session_id')
+    user_data = get_user_session(session_id)
     
-    if not session_id or session_id not in user_sessions:
+    if user_data is None:
         return jsonify({"error": "진행 중인 크롤링이 없습니다."}), 400
     
-    if not user_sessions[session_id]["status"]["running"]:
+    if not user_data["status"]["running"]:
         return jsonify({"error": "크롤링이 실행 중이 아닙니다."}), 400
     
-    # 정지 플래그 설정
-    user_sessions[session_id]["stop_flag"] = True
+    # 대기 중이면 대기열에서 빼고, 실행 중이면 정지 플래그 설정
+    if cancel_crawl_job(user_data["job_id"]) is None:
+        user_data["stop_flag"] = True
+        notify_session(user_data)
     
     return jsonify({"message": "크롤링을 정지합니다."})
 
@@ -1927,8 +1691,9 @@ def stop():
 def status():
     try:
         session_id = session.get('session_id')
+        user_data = get_user_session(session_id)
         
-        if not session_id or session_id not in user_sessions:
+        if user_data is None:
             return jsonify({
                 "running": False,
                 "progress": "",
@@ -1936,7 +1701,6 @@ def status():
                 "count": 0
             })
         
-        user_data = user_sessions[session_id]
         return jsonify({
             "running": user_data["status"]["running"],
             "progress": user_data["status"]["progress"],
@@ -1954,36 +1718,260 @@ def status():
 
 @app.route('/results')
 def results():
+    """수집 결과 조회
+    
+    ?since=N&limit=M을 주면 N번째 행부터 최대 M개와 다음 커서를 반환
+    ({job_id, rows, next, total, running}) - 반복 조회 시 next를 다음 since로 사용.
+    job_id가 바뀌면 새 작업이므로 since=0부터 다시 조회.
+    파라미터가 없으면 예전처럼 전체 목록을 반환.
+    """
     try:
         session_id = session.get('session_id')
+        user_data = get_user_session(session_id)
         
-        if not session_id or session_id not in user_sessions:
-            return jsonify([])
-        
-        return jsonify(user_sessions[session_id]["results"])
+        if 'since' not in request.args and 'limit' not in request.args:
+            return jsonify(list(user_data["results"]) if user_data else [])
+        return results_page(user_data)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
+def results_page(user_data):
+    """?since=N&limit=M 구간의 결과 응답 (/results, /jobs/<job_id>/results 공용)"""
+    try:
+        since = max(0, int(request.args.get('since', 0)))
+        limit = int(request.args.get('limit', RESULTS_PAGE_LIMIT))
+    except ValueError:
+        return jsonify({"error": "since, limit은 숫자여야 합니다."}), 400
+    limit = max(1, min(limit, RESULTS_MAX_LIMIT))
+    
+    if user_data is None:
+        return jsonify({"job_id": None, "rows": [], "next": 0, "total": 0, "running": False})
+    
+    rows, next_cursor = user_data["results"].since(since, limit)
+    return jsonify({
+        "job_id": user_data["job_id"],
+        "rows": rows,
+        "next": next_cursor,
+        "total": len(user_data["results"]),
+        "running": user_data["status"]["running"],
+    })
+
+
+def current_user():
+    """작업 소유자 (서버 세션 ID - X-User-Id 헤더는 공유 비밀키(X-Api-Key)가 맞을 때만 사용)"""
+    user_id = request.headers.get('X-User-Id', '').strip()
+    api_key = request.headers.get('X-Api-Key', '')
+    if user_id and API_SHARED_SECRET and hmac.compare_digest(api_key.encode(), API_SHARED_SECRET.encode()):
+        return user_id
+    if 'session_id' not in session:
+        session['session_id'] = str(uuid.uuid4())
+    return session['session_id']
+
+
+def job_summary(job):
+    """스케줄러 작업 정보 + 진행 상태"""
+    summary = dict(job)
+    session_data = job_sessions.get(job["job_id"])
+    if session_data is not None:
+        summary["progress"] = session_data["status"]["progress"]
+        summary["count"] = len(session_data["results"])
+        summary["email_count"] = session_data["results"].email_count
+    return summary
+
+
+@app.route('/jobs', methods=['POST'])
+def submit_jobs():
+    """여러 검색어 묶음을 한 번에 예약
+    
+    요청: {"keywordSets": [["키워드1", "키워드2"], ["키워드3"]], "maxCount": 0, "searchPages": 10,
+           "workers": 1, "priority": 0} - 검색어 묶음 하나가 작업 하나
+    우선순위(priority)가 높은 작업부터 실행. 사용자별 작업 수 제한을 넘으면 하나도 추가하지 않음 (429).
+    """
+    data = request.get_json(silent=True) or {}
+    keyword_sets = data.get('keywordSets')
+    if not isinstance(keyword_sets, list) or not keyword_sets:
+        return jsonify({"error": "keywordSets(검색어 목록의 목록)가 필요합니다."}), 400
+    
+    try:
+        max_count = int(data.get('maxCount', 0))
+        search_pages = int(data.get('searchPages', 10))
+        workers = max(1, min(int(data.get('workers', 1)), MAX_WORKERS))
+        priority = int(data.get('priority', 0))
+    except (TypeError, ValueError):
+        return jsonify({"error": "maxCount, searchPages, workers, priority는 숫자여야 합니다."}), 400
+    
+    batches = []
+    for keywords in keyword_sets:
+        if not isinstance(keywords, list):
+            keywords = [keywords]
+        keywords = [str(k).strip() for k in keywords if k and str(k).strip()]
+        if not keywords:
+            return jsonify({"error": "빈 검색어 묶음이 있습니다."}), 400
+        batches.append(keywords)
+    
+    owner = current_user()
+    try:
+        scheduler.check_quota(owner, len(batches))
+        jobs = []
+        for keywords in batches:
+            job_id, position, started = submit_crawl_job(owner, keywords, max_count, search_pages, workers, priority)
+            jobs.append({"job_id": job_id, "keywords": keywords, "position": position, "started": started})
+    except QuotaExceeded as e:
+        return jsonify({"error": str(e)}), 429
+    
+    return jsonify({"jobs": jobs})
+
+
+@app.route('/jobs')
+def list_jobs():
+    """내 작업 목록 (재시작 이후 예약한 작업)"""
+    jobs = [job_summary(job) for job in scheduler.list_jobs(current_user())]
+    return jsonify({"jobs": jobs, "scheduler": scheduler.stats()})
+
+
+@app.route('/jobs/<job_id>')
+def job_detail(job_id):
+    job = scheduler.get(job_id)
+    if job is None or job["owner"] != current_user():
+        return jsonify({"error": "작업을 찾을 수 없습니다."}), 404
+    return jsonify(job_summary(job))
+
+
+@app.route('/jobs/<job_id>/results')
+def job_results(job_id):
+    """작업 결과 조회 (?since=N&limit=M, 형식은 /results와 같음)"""
+    job = scheduler.get(job_id)
+    if job is None or job["owner"] != current_user():
+        return jsonify({"error": "작업을 찾을 수 없습니다."}), 404
+    return results_page(get_job_session(job_id))
+
+
+@app.route('/jobs/<job_id>/cancel', methods=['POST'])
+def cancel_job(job_id):
+    job = scheduler.get(job_id)
+    if job is None or job["owner"] != current_user():
+        return jsonify({"error": "작업을 찾을 수 없습니다."}), 404
+    previous = cancel_crawl_job(job_id)
+    if previous not in (JOB_QUEUED, JOB_RUNNING):
+        return jsonify({"error": "이미 끝난 작업입니다."}), 400
+    return jsonify({"message": "작업을 취소했습니다." if previous == JOB_QUEUED else "작업을 정지합니다."})
+
+
+def sse_event(event, data, event_id=None):
+    """Server-Sent Events 메시지 한 개"""
+    message = f"id: {event_id}\n" if event_id is not None else ""
+    return message + f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@app.route('/stream')
+def stream():
+    """진행 상태와 새로 추가된 결과만 Server-Sent Events로 전송 (/status, /results 반복 조회 대신 사용)
+    
+    - status: 진행 상태가 바뀔 때마다 {running, progress, completed, count}
+    - row: 새 결과 한 행 (id = 지금까지 보낸 결과 개수)
+    - reset: 다른 작업이 시작됨 (클라이언트는 표를 비우고 처음부터 다시 받음)
+    - done: 작업 종료 (클라이언트가 연결을 닫아야 자동 재연결하지 않음)
+    재연결 시 브라우저가 보내는 Last-Event-ID 헤더(또는 ?since=N)부터 이어서 보낸다.
+    """
+    session_id = session.get('session_id')
+    try:
+        cursor = max(0, int(request.headers.get('Last-Event-ID') or request.args.get('since') or 0))
+    except ValueError:
+        cursor = 0
+    
+    def generate():
+        nonlocal cursor
+        job_id = None
+        last_status = None
+        idle = 0.0
+        while True:
+            user_data = get_user_session(session_id)
+            if user_data is None:
+                yield sse_event("done", {"running": False, "progress": "", "completed": False, "count": 0})
+                return
+            
+            if user_data["job_id"] is not None:
+                if job_id is not None and user_data["job_id"] != job_id:
+                    cursor = 0
+                    last_status = None
+                    yield sse_event("reset", {"job_id": user_data["job_id"]})
+                job_id = user_data["job_id"]
+            
+            sent = False
+            rows = user_data["results"]
+            new_rows, count = rows.since(cursor)
+            cursor = min(cursor, count)
+            for row in new_rows:
+                cursor += 1
+                yield sse_event("row", row, event_id=cursor)
+                sent = True
+            
+            status = dict(user_data["status"], count=count)
+            if status != last_status:
+                last_status = status
+                yield sse_event("status", status)
+                sent = True
+            
+            if not status["running"] and cursor >= len(rows):
+                yield sse_event("done", status)
+                return
+            
+            idle = 0.0 if sent else idle + STREAM_WAIT
+            if idle >= STREAM_HEARTBEAT:
+                idle = 0.0
+                yield ": ping\n\n"
+            
+            with user_data["updated"]:
+                if len(user_data["results"]) == count and user_data["status"]["running"]:
+                    user_data["updated"].wait(STREAM_WAIT)
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
+
+
+@app.route('/metrics')
+def metrics():
+    """단계별 소요 시간, 페이지/이메일 처리량, 성공 비율 (Prometheus 텍스트 형식)"""
+    return Response(render_metrics(), mimetype='text/plain; version=0.0.4; charset=utf-8')
+
+
+@app.route('/cache/stats')
+def cache_stats():
+    """캐시 적중/실패 횟수 (검색 결과 페이지 캐시, 회사 정보 캐시, 사람인 회사 캐시)"""
+    return jsonify({
+        "serp": serp_cache.stats(),
+        "company_info": result_cache.stats(),
+        "saramin_company": saramin_company_cache.stats(),
+    })
+
+
 @app.route('/download')
 def download():
+    """결과 파일 다운로드 (?format=csv면 CSV를 행 단위로 스트리밍, 기본은 XLSX)"""
     session_id = session.get('session_id')
+    user_data = get_user_session(session_id)
     
-    if not session_id or session_id not in user_sessions:
+    if user_data is None:
         return "다운로드할 데이터가 없습니다.", 400
     
-    results_data = user_sessions[session_id]["results"]
+    results_data = user_data["results"]
     
     if not results_data:
         return "다운로드할 데이터가 없습니다.", 400
     
-    df = pd.DataFrame(results_data)
-    columns = ["회사명", "이메일", "대표자명", "회사주소", "URL"]
-    df = df[columns]
+    if request.args.get('format', 'xlsx').lower() == 'csv':
+        filename = quote('회사정보_리스트.csv')
+        return Response(
+            stream_with_context(iter_csv(results_data)),
+            mimetype='text/csv; charset=utf-8',
+            headers={'Content-Disposition': f"attachment; filename=company_list.csv; filename*=UTF-8''{filename}"},
+        )
     
-    output = io.BytesIO()
-    df.to_excel(output, index=False, engine='openpyxl')
-    output.seek(0)
+    output = write_xlsx(results_data)
     
     return send_file(
         output,
@@ -1996,6 +1984,10 @@ def download():
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
     debug = os.environ.get('RAILWAY_ENVIRONMENT') is None
+    # 첫 요청 전에 브라우저를 미리 띄워둠 (디버그 리로더의 부모 프로세스에서는 생략)
+    if not debug or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        driver_pool.prewarm()
+        resume_unfinished_jobs()
     app.run(host='0.0.0.0', port=port, debug=debug)
 
 
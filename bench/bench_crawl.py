@@ -0,0 +1,240 @@
+"""수집기/상세 페이지 추출 오프라인 벤치마크 (저장된 코퍼스 + 로컬 HTTP 서버 + 로컬 헤드리스 Chrome)
+
+bench/corpus 의 네이버 검색 결과, 사람인 검색/기업정보/회사 상세 페이지와
+bench/pages 의 회사 홈페이지(footer 포함)를 로컬 서버로 재생하고, 검색 URL 템플릿을
+로컬 서버 주소로 바꾼 뒤 실제 수집 함수(get_naver_links, get_saramin_company_links,
+collect_company_info)를 그대로 실행한다. 외부 사이트에는 접속하지 않는다.
+
+출력: 초당 처리 페이지 수, 단계별 지연 시간 백분위수(p50/p90/p99), 추출 수율(필드별 발견 개수).
+--baseline 파일이 있으면 그 결과와 비교한 변화량도 출력한다.
+
+    python bench/bench_crawl.py [--rounds 3] [--pages 2] [--browser-only] [--no-blocking]
+                                [--baseline bench/baseline.json] [--save-baseline]
+
+사람인 URL은 "saramin.co.kr"이 들어 있어야 사람인 경로로 처리되므로 www.saramin.co.kr 을
+Chrome의 --host-resolver-rules 로 로컬 서버에 연결한다 (Chrome/ChromeDriver 필요).
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+CORPUS_DIR = os.path.join(BENCH_DIR, "corpus")
+SITES_DIR = os.path.join(BENCH_DIR, "pages")
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline.json")
+
+SARAMIN_HOST = "www.saramin.co.kr"
+KEYWORD = "금형"
+YIELD_FIELDS = ("이메일", "회사명", "대표자명", "회사주소")
+
+
+class CorpusHandler(BaseHTTPRequestHandler):
+    """코퍼스 파일을 URL 경로에 맞춰 돌려줌 ({{BASE}}, {{SARAMIN}}은 실행 중인 서버 주소로 치환)"""
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+        path = self.route(parsed.path, query)
+        if path is None or not os.path.isfile(path):
+            self.send_error(404)
+            return
+        with open(path, encoding="utf-8") as f:
+            body = f.read()
+        body = body.replace("{{BASE}}", self.server.base_url).replace("{{SARAMIN}}", self.server.saramin_url)
+        data = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    @staticmethod
+    def route(path, query):
+        if path == "/naver/search":
+            page = os.path.join(CORPUS_DIR, "naver", f"serp_p{query.get('page', '1')}.html")
+            return page if os.path.isfile(page) else os.path.join(CORPUS_DIR, "naver", "serp_empty.html")
+        if path == "/zf_user/search":
+            page = os.path.join(CORPUS_DIR, "saramin", f"search_p{query.get('recruitPage', '1')}.html")
+            return page if os.path.isfile(page) else os.path.join(CORPUS_DIR, "saramin", "search_empty.html")
+        if path == "/zf_user/company-info/view":
+            return os.path.join(CORPUS_DIR, "saramin", f"company_info_{query.get('csn', '')}.html")
+        if path == "/zf_user/company/view":
+            return os.path.join(CORPUS_DIR, "saramin", f"company_{query.get('csn', '')}.html")
+        if path.startswith("/sites/"):
+            name = path[len("/sites/"):].strip("/").split("/")[0]
+            return os.path.join(SITES_DIR, f"{os.path.basename(name)}.html")
+        return None
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_corpus_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CorpusHandler)
+    port = server.server_address[1]
+    server.base_url = f"http://127.0.0.1:{port}"
+    server.saramin_url = f"http://{SARAMIN_HOST}:{port}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def configure_app_env(server, browser_only, no_blocking=False):
+    """app을 import하기 전에 검색 URL/저장소/Chrome 옵션을 벤치마크용으로 설정"""
+    data_dir = tempfile.mkdtemp(prefix="crawler-bench-")
+    os.environ["CRAWL_DB_PATH"] = os.path.join(data_dir, "crawler.db")
+    os.environ["CACHE_DB_PATH"] = os.path.join(data_dir, "cache.db")
+    os.environ["SERP_CACHE_TTL"] = "0"  # 검색 결과 페이지도 매 라운드 실제로 방문
+    os.environ["SARAMIN_COMPANY_CACHE_TTL"] = "0"  # 사람인 회사 상세 페이지도 매 라운드 실제로 방문
+    os.environ["NAVER_SEARCH_URL"] = server.base_url + "/naver/search?query={query}&page=1"
+    os.environ["NAVER_SEARCH_PAGE_URL"] = server.base_url + "/naver/search?query={query}&page={page}&start={start}"
+    os.environ["SARAMIN_SEARCH_URL"] = server.saramin_url + "/zf_user/search?searchword={query}&recruitPage={page}"
+    os.environ["CHROME_EXTRA_ARGS"] = " ".join([
+        os.environ.get("CHROME_EXTRA_ARGS", ""),
+        "--headless=new",
+        f"'--host-resolver-rules=MAP {SARAMIN_HOST} 127.0.0.1'",
+    ])
+    if browser_only:
+        os.environ["HTTP_FIRST"] = "0"
+    if no_blocking:
+        os.environ["BLOCK_RESOURCES"] = "0"
+
+
+def percentile(values, p):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(p / 100 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def run_round(app, driver, pages):
+    """검색 결과 수집 → 상세 페이지 추출 한 번. 반환값: (검색 페이지 링크 수, 상세 페이지 결과 목록)"""
+    naver_links = app.canonicalize_links(app.get_naver_links(driver, KEYWORD, pages=pages))
+    saramin_links = app.get_saramin_company_links(driver, KEYWORD, pages=1)
+    urls = sorted(set(naver_links)) + sorted(set(saramin_links))
+    infos = []
+    for url in urls:
+        started = time.perf_counter()
+        try:
+            info, _ = app.collect_company_info(driver, url)
+        except Exception:
+            info = app.empty_company_info(url)  # 실패한 페이지는 빈 결과로 집계
+        app.STAGE_SECONDS.observe(time.perf_counter() - started, stage="detail_total", source=app.detail_source(url))
+        infos.append(info)
+    return len(urls), infos
+
+
+def run_bench(rounds, pages, browser_only, no_blocking=False):
+    server = start_corpus_server()
+    configure_app_env(server, browser_only, no_blocking)
+    sys.path.insert(0, os.path.dirname(BENCH_DIR))
+    import app  # noqa: E402 (환경 변수 설정 후 import)
+
+    samples = {}
+
+    def collect(value, labels):
+        key = labels.get("stage", "") + (f"/{labels['source']}" if labels.get("source") else "")
+        samples.setdefault(key, []).append(value)
+
+    app.STAGE_SECONDS.listeners.append(collect)
+    driver = app.setup_driver()
+    try:
+        run_round(app, driver, pages)  # 워밍업 (드라이버 시작 시간 외에는 결과 제외)
+        for key in list(samples):
+            if key != "driver_init":
+                del samples[key]
+        started = time.perf_counter()
+        detail_pages = 0
+        infos = []
+        for _ in range(rounds):
+            count, round_infos = run_round(app, driver, pages)
+            detail_pages += count
+            infos = round_infos
+        elapsed = time.perf_counter() - started
+    finally:
+        driver.quit()
+        server.shutdown()
+
+    serp_pages = sum(len(v) for k, v in samples.items() if k.startswith("serp_page/"))
+    return {
+        "rounds": rounds,
+        "elapsed_seconds": round(elapsed, 3),
+        "pages_per_second": round((serp_pages + detail_pages) / elapsed, 3) if elapsed else 0.0,
+        "serp_pages": serp_pages,
+        "detail_pages": detail_pages,
+        "stages": {
+            key: {
+                "count": len(values),
+                "p50": round(percentile(values, 50), 4),
+                "p90": round(percentile(values, 90), 4),
+                "p99": round(percentile(values, 99), 4),
+            }
+            for key, values in sorted(samples.items())
+        },
+        "yield": {field: sum(1 for info in infos if info.get(field)) for field in YIELD_FIELDS},
+        "urls": len(infos),
+    }
+
+
+def delta(old, new):
+    if not old:
+        return ""
+    return f"{(new - old) / old * 100:+.1f}%"
+
+
+def print_report(result, baseline=None):
+    base_stages = (baseline or {}).get("stages", {})
+    print(f"\n라운드 {result['rounds']}회, {result['elapsed_seconds']}초 - "
+          f"검색 페이지 {result['serp_pages']}개, 상세 페이지 {result['detail_pages']}개")
+    line = f"초당 처리 페이지: {result['pages_per_second']:.2f}"
+    if baseline:
+        line += f"  (기준 {baseline['pages_per_second']:.2f}, {delta(baseline['pages_per_second'], result['pages_per_second'])})"
+    print(line)
+
+    print(f"\n{'단계':<32} {'횟수':>5} {'p50(ms)':>9} {'p90(ms)':>9} {'p99(ms)':>9} {'p50 변화':>10}")
+    for key, stats in result["stages"].items():
+        base = base_stages.get(key, {})
+        print(f"{key:<32} {stats['count']:>5} {stats['p50'] * 1000:>9.1f} {stats['p90'] * 1000:>9.1f} "
+              f"{stats['p99'] * 1000:>9.1f} {delta(base.get('p50'), stats['p50']):>10}")
+
+    print(f"\n추출 수율 (마지막 라운드, URL {result['urls']}개)")
+    base_yield = (baseline or {}).get("yield", {})
+    for field, count in result["yield"].items():
+        change = ""
+        if field in base_yield and base_yield[field] != count:
+            change = f"  (기준 {base_yield[field]}개, {count - base_yield[field]:+d})"
+        print(f"  {field}: {count}개{change}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=3, help="측정 라운드 수 (워밍업 1회 별도)")
+    parser.add_argument("--pages", type=int, default=2, help="네이버 기본 검색 페이지 수")
+    parser.add_argument("--browser-only", action="store_true", help="HTTP 우선 추출을 끄고 모든 페이지를 브라우저로 처리")
+    parser.add_argument("--no-blocking", action="store_true", help="이미지/폰트/추적 스크립트 차단을 끄고 측정 (차단 효과 비교용)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="비교할 기준 결과 파일")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준 결과 파일로 저장")
+    args = parser.parse_args()
+
+    result = run_bench(args.rounds, args.pages, args.browser_only, args.no_blocking)
+
+    baseline = None
+    if os.path.isfile(args.baseline) and not args.save_baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_report(result, baseline)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"\n기준 결과 저장: {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""회사 정보 추출 CPU 벤치마크 (extraction 엔진 vs 교체 전 코드)
+
+저장된 페이지(bench/pages/*.html)를 http_fetch.parse_html 로 텍스트로 바꾼 뒤
+페이지마다 두 구현을 여러 번 실행해서 페이지당 CPU 시간과 추출 결과 일치 여부를 출력한다.
+
+    python bench/bench_extraction.py [--rounds 200] [--pages 디렉터리]
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from extraction import extract_fields  # noqa: E402
+from http_fetch import parse_html  # noqa: E402
+from legacy_extraction import legacy_extract  # noqa: E402
+
+PORTAL_EMAIL_EXCLUDE = ("jobkorea", "saramin", "albamon")
+
+
+def new_extract(body_text, body_html=""):
+    return extract_fields(body_text, body_html, email_exclude=PORTAL_EMAIL_EXCLUDE)
+
+
+def cpu_per_call(func, args, rounds):
+    started = time.process_time()
+    for _ in range(rounds):
+        func(*args)
+    return (time.process_time() - started) / rounds
+
+
+def same_result(old, new):
+    """이메일은 순서 차이를 무시하고 비교
+
+    예전 코드는 set으로 합쳐서 순서가 매번 다르고, 중복 제거 전에 3개를 잘라서 개수가 더 적을 수 있음
+    """
+    old_emails = set(filter(None, old["이메일"].split(", ")))
+    new_emails = set(filter(None, new["이메일"].split(", ")))
+    emails_ok = old_emails <= new_emails and bool(old_emails) == bool(new_emails)
+    return emails_ok and all(old[k] == new[k] for k in ("회사명", "대표자명", "회사주소"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--pages", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "pages"))
+    args = parser.parse_args()
+
+    paths = sorted(glob.glob(os.path.join(args.pages, "*.html")))
+    if not paths:
+        print(f"페이지가 없습니다: {args.pages}")
+        return 1
+
+    print(f"{'페이지':<32} {'크기':>8} {'기존(us)':>10} {'엔진(us)':>10} {'배율':>6}  결과")
+    total_old = total_new = 0.0
+    mismatches = 0
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            html = f.read()
+        _, text, _ = parse_html(html)
+        old_time = cpu_per_call(legacy_extract, (text, html), args.rounds)
+        new_time = cpu_per_call(new_extract, (text, html), args.rounds)
+        total_old += old_time
+        total_new += new_time
+
+        old, new = legacy_extract(text, html), new_extract(text, html)
+        ok = same_result(old, new)
+        mismatches += not ok
+        name = os.path.basename(path)
+        print(f"{name:<32} {len(html):>8} {old_time * 1e6:>10.1f} {new_time * 1e6:>10.1f} {old_time / new_time:>5.1f}x  {'일치' if ok else '차이'}")
+        if not ok:
+            for key in old:
+                if old[key] != new[key]:
+                    print(f"    {key}: 기존={old[key]!r} 엔진={new[key]!r}")
+
+    count = len(paths)
+    print(f"\n페이지당 평균: 기존 {total_old / count * 1e6:.1f}us, 엔진 {total_new / count * 1e6:.1f}us "
+          f"({total_old / total_new:.1f}x), 결과 차이 {mismatches}/{count}개")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
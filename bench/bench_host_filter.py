@@ -0,0 +1,108 @@
+"""URL 제외 필터 마이크로벤치마크 (host_filter.HostFilter vs 교체 전 부분 문자열 검사)
+
+검색 결과 페이지에서 흔히 나오는 링크(포털 내부 링크, 블로그/카페/뉴스, 쇼핑몰, 회사 사이트)를 섞은
+URL 목록으로 app.py / footer_crawler.py 두 필터를 각각 실행해서 호출당 시간과 판정이 달라진 URL을 출력한다.
+--urls 파일을 주면 그 파일의 URL(한 줄에 하나)을 사용한다.
+--extra N 이면 외부 목록 파일로 도메인 N개를 더 등록한 경우도 비교한다 (기존 방식은 목록 길이에 비례해서 느려짐).
+
+    python bench/bench_host_filter.py [--rounds 200] [--urls 파일] [--extra 2000]
+"""
+import argparse
+import os
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from host_filter import HostFilter  # noqa: E402
+from legacy_host_filter import legacy_app_filter, legacy_footer_filter  # noqa: E402
+
+SAMPLE_URLS = [
+    "https://search.naver.com/search.naver?where=web&query=%EA%B8%88%ED%98%95&page=2",
+    "https://blog.naver.com/moldmaster/223456789012",
+    "https://cafe.naver.com/moldclub/1234",
+    "https://m.place.naver.com/place/1234567890/home",
+    "https://terms.naver.com/entry.naver?docId=123456",
+    "https://kin.naver.com/qna/detail.naver?d1id=11&dirId=1118&docId=456789",
+    "https://moldblog.tistory.com/entry/금형-종류",
+    "https://brunch.co.kr/@factory/12",
+    "https://www.youtube.com/watch?v=abcdefghijk",
+    "https://www.coupang.com/vp/products/123456",
+    "https://www.11st.co.kr/products/987654",
+    "https://ko.wikipedia.org/wiki/금형",
+    "https://namu.wiki/w/금형",
+    "https://www.gov.go.kr/portal/service",
+    "https://www.chosun.com/economy/2024/01/01/ABC/",
+    "https://news.example.com/news/2024/mold-industry",
+    "https://www.made-in-china.com/products-search/hot-china-products/Mold.html",
+    "https://www.alibaba.com/showroom/plastic-mold.html",
+    "https://www.saramin.co.kr/zf_user/company/view?csn=1001",
+    "https://www.hanilmold.co.kr/",
+    "http://www.daesung-precision.com/company/intro.php",
+    "https://www.lego.kr/about",
+    "https://www.seoulnewsmold.co.kr/",
+    "https://www.samsungmold.com/en/main",
+    "https://www.dongbangtech.kr/sub/contact.html",
+    "https://www.mold-plus.co.kr/?ref=naver.com",
+    "https://www.albaplastic.co.kr/",
+    "https://jinsung-mold.com/products/injection",
+    "https://www.kpmold.com/bbs/board.php?bo_table=notice",
+    "https://www.koreamold.or.kr/",
+]
+
+
+def time_per_call(func, urls, rounds):
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for url in urls:
+            func(url)
+    return (time.perf_counter() - started) / (rounds * len(urls))
+
+
+def compare(name, legacy, new, urls, rounds):
+    old_time = time_per_call(legacy, urls, rounds)
+    new_time = time_per_call(new, urls, rounds)
+    print(f"\n[{name}] URL {len(urls)}개 x {rounds}회")
+    print(f"  호출당: 기존 {old_time * 1e6:.2f}us, 새 필터 {new_time * 1e6:.2f}us ({old_time / new_time:.1f}x)")
+    changed = [(url, legacy(url), new(url)) for url in urls if legacy(url) != new(url)]
+    print(f"  판정이 달라진 URL {len(changed)}개")
+    for url, old, now in changed:
+        print(f"    {'허용' if old else '제외'} -> {'허용' if now else '제외'}  {url}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--urls", help="URL 목록 파일 (한 줄에 하나)")
+    parser.add_argument("--extra", type=int, default=2000, help="추가 제외 도메인 수 (0이면 생략)")
+    args = parser.parse_args()
+
+    urls = SAMPLE_URLS
+    if args.urls:
+        with open(args.urls, encoding="utf-8") as f:
+            urls = [line.strip() for line in f if line.strip()]
+
+    import app  # noqa: E402 (Flask/Selenium 등 앱 의존성 필요)
+    import footer_crawler  # noqa: E402
+
+    compare("app.py", legacy_app_filter, app.company_url_filter.is_allowed, urls, args.rounds)
+    compare("footer_crawler.py", legacy_footer_filter, footer_crawler.url_filter.is_allowed, urls, args.rounds)
+
+    if args.extra:
+        extra = [f"excluded-site-{n}.co.kr" for n in range(args.extra)]
+        legacy_domains = app.EXCLUDE_DOMAINS + extra
+
+        def legacy_extended(url):
+            url_lower = url.lower()
+            if any(domain in url_lower for domain in legacy_domains):
+                return False
+            return not any(path in url_lower for path in app.EXCLUDE_PATHS)
+
+        extended = HostFilter(app.EXCLUDE_DOMAINS + app.EXCLUDE_PATHS + extra)
+        compare(f"app.py + 추가 도메인 {args.extra}개", legacy_extended, extended.is_allowed, urls, max(1, args.rounds // 10))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
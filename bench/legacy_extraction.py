@@ -0,0 +1,49 @@
+import re
+
+
+def legacy_extract(body_text, body_html=""):
+    """교체 전 app.parse_company_fields 의 추출 로직 (벤치마크 비교 기준, 수정하지 말 것)"""
+    info = {"이메일": "", "회사명": "", "대표자명": "", "회사주소": ""}
+
+    email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+    found_emails = re.findall(email_pattern, body_text)
+    if not found_emails and body_html:
+        found_emails = re.findall(email_pattern, body_html)
+    real_emails = [e for e in found_emails if not e.lower().endswith(('.png', '.jpg', '.gif', '.svg', '.jpeg', '.webp'))]
+    real_emails = [e for e in real_emails if not any(x in e.lower() for x in ['noreply', 'no-reply', 'donotreply', 'jobkorea', 'saramin', 'albamon'])]
+    if real_emails:
+        info["이메일"] = ", ".join(set(real_emails[:3]))
+
+    company_patterns = [
+        r'(?:회사명|상호|법인명|업체명|기업명)\s*[:\s]\s*([^\n\r,|(]{2,30})',
+        r'\(주\)\s*([가-힣a-zA-Z0-9\s]{2,20})',
+        r'([가-힣]{2,15}(?:주식회사|㈜|\(주\)))',
+        r'((?:주식회사|㈜)\s*[가-힣a-zA-Z0-9]{2,15})',
+    ]
+    for pattern in company_patterns:
+        match = re.search(pattern, body_text)
+        if match:
+            info["회사명"] = match.group(1).strip()
+            break
+
+    ceo_patterns = [
+        r'(?:대표자?|대표이사|CEO|대표자명)\s*[:\s]\s*([가-힣]{2,5})',
+        r'대표이사\s*([가-힣]{2,5})',
+    ]
+    for pattern in ceo_patterns:
+        match = re.search(pattern, body_text, re.IGNORECASE)
+        if match:
+            info["대표자명"] = match.group(1).strip()
+            break
+
+    address_patterns = [
+        r'(?:주소|소재지|사업장\s*소재지|본사)\s*[:\s]\s*([^\n\r]{10,80})',
+        r'((?:서울|부산|대구|인천|광주|대전|울산|세종|경기|강원|충북|충남|전북|전남|경북|경남|제주)[^\n\r]{10,70})',
+    ]
+    for pattern in address_patterns:
+        match = re.search(pattern, body_text)
+        if match:
+            info["회사주소"] = match.group(1).strip()[:80]
+            break
+
+    return info
@@ -0,0 +1,101 @@
+"""교체 전 URL 제외 필터 (app.py, footer_crawler.py의 부분 문자열 검사 - 벤치마크 비교 기준, 수정하지 말 것)"""
+
+
+# app.py
+APP_EXCLUDE_DOMAINS = [
+    # 네이버/다음/카카오
+    "naver.com", "naver.me", "daum.net", "kakao.com",
+    
+    # 블로그/커뮤니티 (정확한 도메인)
+    "tistory.com", "blog.me", "brunch.co.kr", "medium.com", 
+    "velog.io", "notion.so", "notion.site",
+    "dcinside.com", "clien.net", "ruliweb.com", "fmkorea.com",
+    
+    # 채용사이트 (제외하지 않음 - 크롤링 대상)
+    # "saramin.co.kr", "jobkorea.co.kr", "incruit.com", 
+    # "wanted.co.kr", "jobplanet.co.kr", "catch.co.kr",
+    
+    # 쇼핑몰
+    "gmarket.co.kr", "11st.co.kr", "coupang.com", "auction.co.kr",
+    "aliexpress.com", "amazon.com", "ebay.com",
+    
+    # 해외 도매
+    "alibaba.com", "made-in-china.com", "globalsources.com",
+    
+    # 소셜미디어
+    "youtube.com", "facebook.com", "instagram.com", 
+    "twitter.com", "linkedin.com",
+    
+    # 위키/백과
+    "wikipedia.org", "namu.wiki", "terms.naver.com",
+    
+    # 정부/공공
+    "go.kr",
+]
+
+
+def legacy_app_filter(url):
+    """회사 웹사이트로 적합한 URL인지 확인 (더 정교한 필터링)"""
+    url_lower = url.lower()
+    
+    # 정확한 도메인 매칭
+    for domain in APP_EXCLUDE_DOMAINS:
+        # 도메인이 URL에 정확히 포함되어 있는지 확인
+        if domain in url_lower:
+            return False
+    
+    # 블로그 패턴 제외 (blog가 URL 경로에 있는 경우)
+    if "/blog/" in url_lower or "/cafe/" in url_lower:
+        return False
+    
+    # 뉴스 기사 패턴 제외 (article, news 경로)
+    if "/article/" in url_lower or "/news/" in url_lower:
+        return False
+    
+    return True
+
+
+# footer_crawler.py
+FOOTER_EXCLUDE_DOMAINS = [
+    # 네이버 관련
+    "naver.com", "naver.me",
+    
+    # 뉴스/미디어
+    "news", "snmnews", "chosun", "joongang", "hani", "donga", "hankyung",
+    "mk.co.kr", "mt.co.kr", "edaily", "newsis", "yonhap", "yna.co.kr",
+    
+    # 블로그/커뮤니티
+    "tistory", "blog", "brunch", "medium.com", "velog", "notion.so",
+    "cafe.daum", "dcinside", "clien", "ruliweb", "fmkorea",
+    
+    # 채용/구인구직
+    "saramin", "jobkorea", "job.gg.go.kr", "incruit", "wanted", "jobaba",
+    "alba", "work.go.kr", "catch.co.kr", "superookie",
+    
+    # 쇼핑몰/오픈마켓
+    "gmarket", "11st", "coupang", "auction", "interpark", "wemakeprice",
+    "tmon", "ssg.com", "lotte", "shinsegae", "hmall", "gsshop",
+    "alibaba", "aliexpress", "amazon", "ebay", "taobao",
+    
+    # 해외 사이트 전체 제외
+    "mfgrobots", "alibaba", "made-in-china", "globalsources",
+    "firstmold", "djmolding", "sanonchina", "yujebearing",
+    "custom-plastic-molds", "rjcmold", "formlabs",
+    "juliertech", ".cn", ".com.cn",
+    
+    # 지도/위키/기타
+    "wikipedia", "namu.wiki", "openstreetmap", "google.com", "youtube",
+    "facebook", "instagram", "twitter", "linkedin",
+    
+    # 광고
+    "ad.search", "searchad", "adsense",
+]
+
+
+def legacy_footer_filter(url):
+    """회사 웹사이트로 적합한 URL인지 확인"""
+    url_lower = url.lower()
+    for domain in FOOTER_EXCLUDE_DOMAINS:
+        if domain in url_lower:
+            return False
+    return True
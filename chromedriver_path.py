@@ -0,0 +1,131 @@
+"""ChromeDriver 실행 파일 경로를 한 번만 찾아서 재사용
+
+우선순위: CHROMEDRIVER_PATH 환경 변수 → 캐시 파일(경로 + 버전) → 시스템 PATH → ChromeDriverManager(네트워크)
+찾은 결과는 프로세스 안에서 기억하고 캐시 파일에도 저장하므로, 이후 드라이버 생성은 네트워크를 쓰지 않는다.
+캐시나 PATH의 드라이버 주 버전이 설치된 Chrome 주 버전과 다르면 건너뛴다.
+
+이미지 빌드 시 미리 받아두려면:
+    python chromedriver_path.py
+"""
+import json
+import os
+import re
+import shutil
+import subprocess
+import threading
+
+
+CHROMEDRIVER_PATH = os.environ.get('CHROMEDRIVER_PATH', '')  # 직접 지정한 경로 (있으면 그대로 사용)
+CHROMEDRIVER_CACHE = os.environ.get(
+    'CHROMEDRIVER_CACHE', os.path.join(os.path.expanduser('~'), '.cache', 'crawler', 'chromedriver.json'),
+)  # 찾은 경로/버전을 저장하는 파일
+
+VERSION_RE = re.compile(r'(\d+)\.(\d+)\.(\d+)\.(\d+)')
+
+_lock = threading.Lock()
+_resolved = None  # {"path", "version", "chrome_version", "source"}
+
+
+def _version_of(binary):
+    """'--version' 출력에서 버전 문자열 추출 (실행할 수 없으면 None)"""
+    if not binary:
+        return None
+    try:
+        output = subprocess.run([binary, '--version'], capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = VERSION_RE.search(output)
+    return match.group(0) if match else None
+
+
+def chrome_version(chrome_binary=None):
+    """설치된 Chrome 버전 (찾지 못하면 None - Windows는 --version을 지원하지 않음)"""
+    if os.name == 'nt':
+        return None
+    candidates = [chrome_binary] if chrome_binary else []
+    candidates += [shutil.which(name) for name in ('google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser')]
+    for binary in candidates:
+        version = _version_of(binary)
+        if version:
+            return version
+    return None
+
+
+def _matches(driver_version, installed):
+    """드라이버와 Chrome의 주 버전이 같은지 (어느 쪽이든 알 수 없으면 맞는 것으로 봄)"""
+    if not driver_version or not installed:
+        return True
+    return driver_version.split('.')[0] == installed.split('.')[0]
+
+
+def _is_executable(path):
+    return bool(path) and os.path.isfile(path) and os.access(path, os.X_OK)
+
+
+def _load_cache():
+    try:
+        with open(CHROMEDRIVER_CACHE, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_cache(entry):
+    try:
+        os.makedirs(os.path.dirname(CHROMEDRIVER_CACHE), exist_ok=True)
+        with open(CHROMEDRIVER_CACHE, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+    except OSError as e:
+        print(f"[ChromeDriver] 캐시 저장 실패: {e}")
+
+
+def _download():
+    """ChromeDriverManager로 설치된 Chrome에 맞는 드라이버를 받음 (네트워크 사용)"""
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
+
+def resolve_chromedriver(chrome_binary=None):
+    """ChromeDriver 경로와 버전 반환: {"path", "version", "chrome_version", "source"}
+
+    처음 호출할 때만 실제로 찾고, 이후에는 기억해 둔 결과를 그대로 반환한다.
+    """
+    global _resolved
+    with _lock:
+        if _resolved is not None and _is_executable(_resolved["path"]):
+            return _resolved
+
+        if CHROMEDRIVER_PATH:
+            if not _is_executable(CHROMEDRIVER_PATH):
+                raise FileNotFoundError(f"CHROMEDRIVER_PATH에 실행 파일이 없습니다: {CHROMEDRIVER_PATH}")
+            _resolved = {"path": CHROMEDRIVER_PATH, "version": _version_of(CHROMEDRIVER_PATH),
+                         "chrome_version": None, "source": "env"}
+            return _resolved
+
+        installed = chrome_version(chrome_binary)
+        cached = _load_cache()
+        if cached and _is_executable(cached.get("path")):
+            if _matches(cached.get("version"), installed):
+                _resolved = dict(cached, source="cache")
+                return _resolved
+            print(f"[ChromeDriver] Chrome 버전 변경 ({cached.get('chrome_version')} -> {installed}), 드라이버 다시 찾음")
+
+        path = shutil.which("chromedriver")
+        source = "path"
+        if path and not _matches(_version_of(path), installed):
+            print(f"[ChromeDriver] 시스템 PATH의 드라이버({path})가 Chrome {installed}와 맞지 않음")
+            path = None
+        if not path:
+            print("[ChromeDriver] 맞는 드라이버가 없어서 ChromeDriverManager로 다운로드")
+            path = _download()
+            source = "download"
+
+        _resolved = {"path": path, "version": _version_of(path), "chrome_version": installed, "source": source}
+        _save_cache({key: value for key, value in _resolved.items() if key != "source"})
+        print(f"[ChromeDriver] {path} (버전 {_resolved['version']}, Chrome {installed}, {source})")
+        return _resolved
+
+
+if __name__ == "__main__":
+    info = resolve_chromedriver()
+    print(json.dumps(info, ensure_ascii=False))
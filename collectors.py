@@ -0,0 +1,184 @@
+import threading
+import time
+from urllib.parse import quote_plus
+
+from dom_snapshot import collect_links
+from http_fetch import FetchError, fetch_html, parse_links
+from metrics import record_serp_page
+from pagination import PaginationController
+from page_wait import wait_for_page
+from resource_blocking import apply_profile
+
+
+class BrowserRequired(Exception):
+    """HTTP로 검색 결과를 읽지 못한 경우 (브라우저로 다시 수집해야 함)"""
+
+
+class Source:
+    """검색 결과 페이지에서 링크를 모으는 출처 정의 (수집 루프는 collect 하나를 공유)
+
+    - url_template: {query}(URL 인코딩한 검색어), {page}(1부터), {start}((page-1)*page_size+1) 자리 표시자
+    - first_page_url: 1페이지만 다른 주소를 쓰는 경우의 템플릿 (없으면 url_template)
+    - ready_selectors: 검색 결과가 나타났는지 확인하는 선택자
+    - link_selectors: 링크 후보 요소 선택자 (앞에 있는 선택자의 링크가 먼저)
+    - normalize(href, onclick): 수집할 URL(정규화된 절대 주소) 또는 None
+    - text_selectors: 텍스트/HTML 안의 URL까지 찾을 영역 (네이버 파워링크처럼 링크가 아닌 표시 URL)
+    - next_selector: 다음 페이지 버튼 (기본 몫의 페이지를 넘은 뒤 버튼이 없거나 비활성이면 중단)
+    - cache: 검색 결과 페이지 캐시 (TTLCache, 없으면 매번 방문)
+    - max_concurrency: 이 출처의 검색 페이지를 동시에 여는 최대 수 (모든 작업 합계, 0이면 제한 없음)
+    - http: 브라우저 없이 HTTP로 가져와도 되는 출처 (서버에서 렌더링되고 normalize만으로 링크를 거를 수 있는 페이지)
+      HTTP로 읽지 못한 작업(키워드)은 브라우저로 다시 수집
+    """
+
+    def __init__(self, name, label, url_template, ready_selectors, link_selectors, normalize,
+                 first_page_url=None, text_selectors=(), text_url_re=None, next_selector="",
+                 page_size=10, cache=None, max_concurrency=0, http=False):
+        self.name = name
+        self.label = label
+        self.url_template = url_template
+        self.first_page_url = first_page_url
+        self.ready_selectors = list(ready_selectors)
+        self.link_selectors = list(link_selectors)
+        self.normalize = normalize
+        self.text_selectors = list(text_selectors)
+        self.text_url_re = text_url_re
+        self.next_selector = next_selector
+        self.page_size = page_size
+        self.cache = cache
+        self._slots = threading.BoundedSemaphore(max_concurrency) if max_concurrency > 0 else None
+        self.http = http
+
+    def page_url(self, keyword, page):
+        template = self.first_page_url if page == 1 and self.first_page_url else self.url_template
+        return template.format(query=quote_plus(keyword), page=page, start=(page - 1) * self.page_size + 1)
+
+    def cache_key(self, keyword, page):
+        """검색 결과 캐시 키 (키워드의 대소문자/공백 차이는 같은 검색으로 취급)"""
+        return f"{self.name}:{' '.join(keyword.split()).lower()}:{page}"
+
+    def scrape(self, driver, url):
+        """검색 결과 한 페이지 방문. 반환값: (링크 목록(순서 유지, 중복 없음), 페이지 준비 여부, 다음 페이지 여부)"""
+        apply_profile(driver, self.name)
+        driver.get(url)
+        ready = wait_for_page(driver, self.ready_selectors)
+        found = collect_links(driver, self.link_selectors, self.text_selectors, self.next_selector)
+        next_button = found["next"]
+        has_next = not self.next_selector or (next_button is not None and not next_button["disabled"])
+        return self._normalize_all(found["anchors"], found["texts"]), ready, has_next
+
+    def scrape_http(self, url, page):
+        """검색 결과 한 페이지를 HTTP로 읽음 (선택자 대신 페이지의 모든 링크를 normalize로 거름)
+
+        반환값은 scrape와 같음 (다음 페이지 버튼은 확인하지 않음). 읽을 수 없으면 BrowserRequired.
+        """
+        try:
+            final_url, html = fetch_html(url)
+        except FetchError as e:
+            raise BrowserRequired(str(e)) from e
+        anchors = parse_links(html, final_url)
+        # 검색 결과가 없는 페이지에도 메뉴 링크는 있으므로, 링크가 아예 없으면 자바스크립트로 그리는 페이지로 봄
+        if not anchors:
+            raise BrowserRequired("링크 없는 페이지")
+        return self._normalize_all(anchors, [html] if self.text_url_re is not None else []), True, True
+
+    def _normalize_all(self, anchors, texts):
+        page_links = {}  # 순서를 유지하는 집합
+        for anchor in anchors:
+            href = self.normalize(anchor.get("href") or "", anchor.get("onclick") or "")
+            if href:
+                page_links[href] = None
+        if self.text_url_re is not None:
+            for text in texts:
+                for candidate in self.text_url_re.findall(text):
+                    href = self.normalize(candidate, "")
+                    if href:
+                        page_links[href] = None
+        return list(page_links)
+
+    def fetch(self, driver, keyword, page):
+        """캐시에 있으면 캐시, 없으면 브라우저로 방문 (driver가 None이면 HTTP)
+
+        반환값: (링크 목록, 다음 페이지 여부, 브라우저 사용 여부)
+        """
+        key = self.cache_key(keyword, page)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                print(f"[{self.label}] 페이지 {page} 캐시 사용 ({len(cached)}개 링크)")
+                return cached, True, False
+
+        url = self.page_url(keyword, page)
+        print(f"[{self.label}] 페이지 {page} 크롤링 중{'' if driver is not None else ' (HTTP)'}: {url}")
+        if self._slots is not None:
+            self._slots.acquire()
+        try:
+            started = time.perf_counter()
+            if driver is None:
+                try:
+                    page_links, ready, has_next = self.scrape_http(url, page)
+                except BrowserRequired as e:
+                    print(f"[{self.label}] HTTP로 읽지 못함 ({e}) - 이 검색은 브라우저로 수집")
+                    raise
+            else:
+                page_links, ready, has_next = self.scrape(driver, url)
+            record_serp_page(self.name, started, len(page_links), ready)
+        finally:
+            if self._slots is not None:
+                self._slots.release()
+        # 로딩이 끝나지 않았거나 링크가 없는 페이지는 캐시하지 않음 (일시적 실패가 고정되지 않도록)
+        if self.cache is not None and ready and page_links:
+            self.cache.set(key, page_links)
+        return page_links, has_next, driver is not None
+
+
+def collect(driver, source, keyword, pages=5, max_urls=0, on_links=None, should_stop=None, controller=None):
+    """source에서 keyword 검색 결과 링크 수집 (페이지 수는 controller가 수율을 보고 결정)
+
+    on_links: 페이지마다 새로 찾은 링크 목록을 바로 넘겨받는 콜백 - 정수를 반환하면 (다른 출처와 겹치지 않는)
+              실제로 새로운 링크 수로 보고 수율 계산에 사용
+    should_stop: 참을 반환하면 다음 페이지로 넘어가지 않고 중단
+    controller: 여러 출처가 예산을 나눠 쓰는 PaginationController (없으면 이 출처만의 예산 pages * 3,
+                수율이 떨어지면 그 전에 중단)
+    driver가 None이면 HTTP로 수집하고, 첫 페이지부터 HTTP로 읽지 못하면 BrowserRequired를 그대로 올린다
+    (브라우저로 처음부터 다시 수집하면 됨 - 그 페이지는 예산에서 돌려줌).
+    반환값: 찾은 링크 목록 (처음 찾은 순서)
+    """
+    if controller is None:
+        controller = PaginationController([source.name], budget=pages * 3, max_pages=pages * 3)
+    links = {}  # 순서를 유지하는 집합
+    page = 0
+
+    while controller.allow(source.name):
+        page += 1
+        try:
+            page_links, has_next, used_browser = source.fetch(driver, keyword, page)
+        except BrowserRequired:
+            if page == 1:
+                controller.refund(source.name)
+                raise
+            controller.finish(source.name, "HTTP 실패")
+            break
+        except Exception as e:
+            print(f"[{source.label}] 페이지 {page} 수집 오류: {e}")
+            controller.finish(source.name, "오류")
+            break
+
+        new_links = [href for href in page_links if href not in links]
+        if max_urls > 0:
+            new_links = new_links[:max(0, max_urls - len(links))]
+        links.update(dict.fromkeys(new_links))
+        print(f"[{source.label}] 페이지 {page}에서 {len(new_links)}개 링크 발견 (총 {len(links)}개)")
+
+        # 이 페이지에서 새로 찾은 링크는 바로 넘김 (상세 페이지 수집과 동시에 진행)
+        fresh = on_links(new_links) if on_links and new_links else None
+        controller.record(source.name, fresh if isinstance(fresh, int) else len(new_links), has_next, used_browser)
+        if should_stop and should_stop():
+            break
+
+        # 목표 개수에 도달했으면 중단
+        if max_urls > 0 and len(links) >= max_urls:
+            break
+
+    stats = controller.summary()[source.name]
+    print(f"[{source.label}] 총 {len(links)}개 링크 수집 완료 ({page}페이지, 종료 사유: {stats['reason'] or '중단'})")
+    return list(links)
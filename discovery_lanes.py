@@ -0,0 +1,128 @@
+import queue
+import threading
+from collections import namedtuple
+
+from collectors import BrowserRequired
+
+
+# 검색 작업 하나 (키워드 순번, 키워드, 출처)
+Task = namedtuple("Task", "index keyword source")
+
+
+class DiscoveryLanes:
+    """(키워드 x 출처) 검색 작업을 여러 레인에서 동시에 실행 (찾은 링크는 작업마다 바로 넘김)
+
+    - 브라우저 레인: 처음 받은 driver 하나 + 브라우저 작업이 밀려 있을 때 acquire()로 받은 드라이버
+      (최대 browser_lanes개, 받지 못하면 있는 레인만 사용)
+    - HTTP 레인: source.http인 작업을 브라우저 없이 처리 (http_lanes개), HTTP로 읽지 못한 작업은
+      브라우저 레인으로 넘긴다
+    run(driver, task)는 작업 하나를 실행하고 그 driver로 방문한 페이지 수를 반환한다 (HTTP 레인은 driver=None).
+    on_done(task)은 작업이 끝날 때마다 호출된다 (중단된 작업은 호출하지 않음).
+    """
+
+    def __init__(self, run, acquire=None, release=None, browser_lanes=1, http_lanes=0,
+                 should_stop=None, on_done=None):
+        self.run = run
+        self.acquire = acquire
+        self.release = release
+        self.browser_lanes = max(1, browser_lanes)
+        self.http_lanes = max(0, http_lanes)
+        self.should_stop = should_stop or (lambda: False)
+        self.on_done = on_done
+        self._lock = threading.Lock()
+        self._browser = queue.Queue()
+        self._http = queue.Queue()
+        self._remaining = 0
+
+    def execute(self, driver, tasks):
+        """모든 작업이 끝나거나 중단될 때까지 실행. 반환값: driver로 방문한 페이지 수"""
+        tasks = list(tasks)
+        self._remaining = len(tasks)
+        for task in tasks:
+            (self._http if task.source.http and self.http_lanes else self._browser).put(task)
+
+        threads = []
+        for lane_no in range(min(self.http_lanes, self._http.qsize())):
+            threads.append(threading.Thread(target=self._http_lane, daemon=True))
+        if self.acquire is not None:
+            for lane_no in range(1, self.browser_lanes):
+                threads.append(threading.Thread(target=self._extra_browser_lane, args=(lane_no,), daemon=True))
+        for thread in threads:
+            thread.start()
+        try:
+            return self._browser_lane(driver)
+        finally:
+            for thread in threads:
+                thread.join()
+
+    def _next(self, tasks):
+        """다음 작업 (남은 작업이 없거나 중단되면 None)"""
+        while not self.should_stop():
+            try:
+                return tasks.get(timeout=0.2)
+            except queue.Empty:
+                with self._lock:
+                    if self._remaining == 0:
+                        return None
+                # HTTP 레인이 모두 끝났으면 브라우저 큐로 넘어올 작업도 없음
+                if tasks is self._http:
+                    return None
+        return None
+
+    def _finish(self, task):
+        with self._lock:
+            self._remaining -= 1
+        if self.on_done is not None and not self.should_stop():
+            self.on_done(task)
+
+    def _execute(self, driver, task):
+        """작업 하나 실행. 반환값: driver로 방문한 페이지 수"""
+        try:
+            pages = self.run(driver, task)
+        except BrowserRequired:
+            self._browser.put(task)
+            return 0
+        except Exception as e:
+            print(f"[검색] '{task.keyword}' {task.source.label} 검색 중 오류: {e}")
+            pages = 0
+        self._finish(task)
+        return pages or 0
+
+    def _browser_lane(self, driver):
+        pages = 0
+        while True:
+            task = self._next(self._browser)
+            if task is None:
+                return pages
+            pages += self._execute(driver, task)
+
+    def _http_lane(self):
+        while True:
+            task = self._next(self._http)
+            if task is None:
+                return
+            self._execute(None, task)
+
+    def _extra_browser_lane(self, lane_no):
+        """브라우저 작업이 남아 있으면 드라이버를 하나 더 받아서 같이 처리 (받지 못하면 종료)"""
+        task = self._next(self._browser)
+        if task is None:
+            return
+        try:
+            driver = self.acquire()
+        except Exception as e:
+            print(f"[검색] 브라우저 레인 {lane_no} 드라이버를 받지 못함: {e}")
+            self._browser.put(task)
+            return
+        pages = 0
+        broken = False
+        try:
+            while task is not None:
+                pages += self._execute(driver, task)
+                task = self._next(self._browser)
+        except Exception:
+            broken = True
+            raise
+        finally:
+            if self.release is not None:
+                self.release(driver, pages=pages, broken=broken)
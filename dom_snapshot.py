@@ -0,0 +1,215 @@
+# 페이지 전체 정보를 execute_script 한 번으로 가져오기 위한 스크립트
+# (find_elements + get_attribute/.text 를 요소마다 호출하면 각각이 WebDriver HTTP 왕복)
+SNAPSHOT_JS = r"""
+var opts = arguments[0] || {};
+function text(el) { return el ? ((el.innerText || el.textContent || '') + '').trim() : ''; }
+function cut(s, n) { s = s || ''; return s.length > n ? s.slice(0, n) : s; }
+function attr(el, name) { return (el.getAttribute(name) || '') + ''; }
+
+var body = document.body;
+var snap = {
+    url: location.href,
+    title: document.title || '',
+    text: body ? (body.innerText || '') : '',
+    html: (opts.html && body) ? body.innerHTML : '',
+    anchors: [],
+    footer_text: '',
+    footer_html: '',
+    mailto: [],
+    email_contexts: [],
+    labelled: [],
+    fields: {}
+};
+
+// 1. 모든 링크 (href, 텍스트, onclick, 주변 텍스트, 회사정보 영역 포함 여부)
+var sectionSelector = opts.section || '';
+var links = document.querySelectorAll('a[href], a[onclick], button[onclick]');
+var maxAnchors = opts.max_anchors || 3000;
+for (var i = 0; i < links.length && i < maxAnchors; i++) {
+    var a = links[i];
+    var parent = a.parentElement;
+    var inSection = false;
+    if (sectionSelector) {
+        try { inSection = a.closest(sectionSelector) !== null; } catch (e) {}
+    }
+    snap.anchors.push({
+        href: a.href ? (a.href + '') : '',
+        text: cut((a.textContent || '').trim(), 200),
+        onclick: attr(a, 'onclick'),
+        cls: attr(a, 'class'),
+        title: attr(a, 'title'),
+        ctx: parent ? cut((parent.textContent || '').replace(/\s+/g, ' ').trim(), 300) : '',
+        section: inSection
+    });
+}
+
+// 2. footer 영역 (가장 바깥 요소만 사용해서 중복 제거)
+var footerSelector = opts.footer || 'footer';
+var footers = [];
+try { footers = Array.prototype.slice.call(document.querySelectorAll(footerSelector)); } catch (e) {}
+var outer = footers.filter(function (el) {
+    return !footers.some(function (other) { return other !== el && other.contains(el); });
+});
+var ft = [], fh = [];
+outer.forEach(function (el) { ft.push(text(el)); fh.push(el.innerHTML || ''); });
+snap.footer_text = ft.join('\n');
+snap.footer_html = fh.join('\n');
+
+// 3. mailto 링크
+var mails = document.querySelectorAll("a[href*='mailto']");
+for (var m = 0; m < mails.length; m++) {
+    var inFooter = outer.some(function (el) { return el.contains(mails[m]); });
+    snap.mailto.push({href: attr(mails[m], 'href'), footer: inFooter});
+}
+
+// 4. "E-Mail", "이메일" 라벨 주변 텍스트/HTML
+if (body) {
+    var labelPattern = /E-Mail|이메일|Email|e-mail|E-mail/;
+    var walker = document.createTreeWalker(body, NodeFilter.SHOW_TEXT, null);
+    var seen = [];
+    var node;
+    while ((node = walker.nextNode()) && snap.email_contexts.length < 20) {
+        if (!labelPattern.test(node.nodeValue)) continue;
+        var labelEl = node.parentElement;
+        var ctxEl = labelEl && labelEl.parentElement;
+        if (!ctxEl || seen.indexOf(ctxEl) >= 0) continue;
+        seen.push(ctxEl);
+        snap.email_contexts.push({text: cut(text(ctxEl), 2000), html: cut(ctxEl.innerHTML || '', 5000)});
+    }
+}
+
+// 5. 라벨-값 구조 (dt/dd, th/td)
+var labels = document.querySelectorAll('dt, th');
+for (var l = 0; l < labels.length && l < 300; l++) {
+    var label = labels[l];
+    var value = label.nextElementSibling;
+    while (value && value.tagName !== 'DD' && value.tagName !== 'TD') value = value.nextElementSibling;
+    if (!value) continue;
+    var link = value.querySelector("a[href^='http']");
+    snap.labelled.push({label: cut(text(label), 100), value: cut(text(value), 500), href: link ? (link.href + '') : ''});
+}
+
+// 6. 지정한 선택자 그룹의 텍스트 (선택자별로 일치하는 요소 최대 N개)
+var fields = opts.fields || {};
+var limit = opts.field_limit || 5;
+Object.keys(fields).forEach(function (name) {
+    snap.fields[name] = [];
+    fields[name].forEach(function (selector) {
+        var found = [];
+        try {
+            var els = document.querySelectorAll(selector);
+            for (var k = 0; k < els.length && found.length < limit; k++) found.push(text(els[k]));
+        } catch (e) {}
+        snap.fields[name].push([selector, found]);
+    });
+});
+
+return snap;
+"""
+
+FOOTER_SELECTOR = ", ".join([
+    "footer", "#footer", ".footer",
+    "div[class*='footer']", "div[id*='footer']",
+    "div[class*='Footer']", "div[id*='Footer']",
+    "section[class*='footer']", ".site-footer", "#site-footer",
+])
+
+EMPTY_SNAPSHOT = {
+    "url": "", "title": "", "text": "", "html": "", "anchors": [],
+    "footer_text": "", "footer_html": "", "mailto": [], "email_contexts": [],
+    "labelled": [], "fields": {},
+}
+
+
+def take_snapshot(driver, html=False, fields=None, section=None, footer=FOOTER_SELECTOR, max_anchors=3000):
+    """현재 페이지의 구조화된 스냅샷을 한 번의 execute_script로 가져온다
+
+    fields: {"이름": [선택자, ...]} - 선택자별로 일치하는 요소의 텍스트 목록을 함께 반환
+    section: 링크가 이 선택자 영역 안에 있는지 표시 (anchors[i]["section"])
+    """
+    options = {
+        "html": html,
+        "fields": fields or {},
+        "section": section or "",
+        "footer": footer,
+        "max_anchors": max_anchors,
+    }
+    try:
+        snapshot = driver.execute_script(SNAPSHOT_JS, options)
+    except Exception as e:
+        print(f"[스냅샷] 실패: {e}")
+        snapshot = None
+    result = dict(EMPTY_SNAPSHOT)
+    if snapshot:
+        result.update(snapshot)
+    return result
+
+
+def field_texts(snapshot, name):
+    """선택자 순서대로 (선택자, 텍스트) 목록 반환"""
+    for selector, texts in snapshot.get("fields", {}).get(name, []):
+        for text in texts:
+            yield selector, (text or "").strip()
+
+
+def first_field(snapshot, name):
+    """선택자별 첫 번째 요소의 텍스트만 (find_element 와 같은 의미)"""
+    for selector, texts in snapshot.get("fields", {}).get(name, []):
+        if texts:
+            yield selector, (texts[0] or "").strip()
+
+
+# 검색 결과 페이지의 링크를 한 번에 가져오는 스크립트 (선택자별 요소 → href/onclick, 같은 요소는 한 번만)
+LINKS_JS = r"""
+var opts = arguments[0] || {};
+var seen = new Set();
+var anchors = [];
+(opts.selectors || []).forEach(function (selector) {
+    var els = [];
+    try { els = document.querySelectorAll(selector); } catch (e) {}
+    for (var i = 0; i < els.length && anchors.length < (opts.max_anchors || 3000); i++) {
+        var el = els[i];
+        if (seen.has(el)) continue;
+        seen.add(el);
+        anchors.push({href: el.href ? (el.href + '') : '', onclick: (el.getAttribute('onclick') || '') + ''});
+    }
+});
+var texts = [];
+(opts.text_selectors || []).forEach(function (selector) {
+    var els = [];
+    try { els = document.querySelectorAll(selector); } catch (e) {}
+    for (var i = 0; i < els.length && texts.length < 50; i++) {
+        texts.push((els[i].innerText || '') + ' ' + (els[i].innerHTML || ''));
+    }
+});
+var next = null;
+if (opts.next) {
+    var button = null;
+    try { button = document.querySelector(opts.next); } catch (e) {}
+    if (button) {
+        var cls = (button.getAttribute('class') || '') + '';
+        next = {disabled: cls.indexOf('disabled') >= 0 || button.disabled === true};
+    }
+}
+return {anchors: anchors, texts: texts, next: next};
+"""
+
+
+def collect_links(driver, selectors, text_selectors=(), next_selector="", max_anchors=3000):
+    """선택자에 해당하는 링크의 href/onclick, 텍스트 영역, 다음 페이지 버튼 상태를 execute_script 한 번으로 가져온다
+
+    반환값: {"anchors": [{"href", "onclick"}, ...], "texts": [영역 텍스트 + HTML, ...],
+             "next": None(버튼 없음) 또는 {"disabled": bool}}
+    """
+    options = {
+        "selectors": list(selectors),
+        "text_selectors": list(text_selectors),
+        "next": next_selector,
+        "max_anchors": max_anchors,
+    }
+    try:
+        result = driver.execute_script(LINKS_JS, options)
+    except Exception as e:
+        print(f"[링크 수집] 실패: {e}")
+        result = None
+    return result or {"anchors": [], "texts": [], "next": None}
@@ -0,0 +1,298 @@
+import os
+import threading
+import time
+
+
+def process_tree_rss(pid):
+    """pid와 모든 하위 프로세스의 RSS 합계(바이트) - /proc이 없는 환경(Windows 등)이면 None"""
+    if not os.path.isdir("/proc"):
+        return None
+    children = {}
+    rss = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "rb") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # 프로세스 이름에 공백/괄호가 들어갈 수 있으므로 마지막 ')' 뒤부터 나눔 (ppid, rss 페이지 수)
+        fields = stat[stat.rfind(b")") + 2:].split()
+        child = int(entry)
+        children.setdefault(int(fields[1]), []).append(child)
+        rss[child] = int(fields[21])
+    if pid not in rss:
+        return None
+    total = 0
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        total += rss.get(current, 0)
+        stack.extend(children.get(current, ()))
+    return total * os.sysconf("SC_PAGE_SIZE")
+
+
+def driver_rss(driver):
+    """ChromeDriver + Chrome(브라우저, 렌더러, GPU 등 하위 프로세스 전체)의 RSS 합계(바이트)"""
+    try:
+        return process_tree_rss(driver.service.process.pid)
+    except Exception:
+        return None
+
+
+class DriverPool:
+    """크롤링 세션 간에 공유되는 WebDriver 풀
+
+    - 최대 max_size 개의 브라우저만 동시에 존재 (초과 요청은 반납될 때까지 대기)
+    - 체크아웃 시 헬스체크, 죽은 드라이버는 폐기 후 새로 생성
+    - max_pages 페이지 이상 사용했거나 max_age 초가 지난 드라이버는 반납 시 재생성
+    - 사용 중에는 checkpoint()로 메모리 감시: blank_every 페이지마다 about:blank로 비우고,
+      RSS가 max_rss 바이트를 넘은 드라이버는 교체 대상으로 표시 (반납 시 재생성)
+    - 드라이버 생성(Chrome 실행)은 백그라운드 스레드에서 수행하여 미리 데워둘 수 있음
+    """
+
+    def __init__(self, factory, max_size=2, max_pages=300, max_age=1800, min_idle=1,
+                 max_rss=0, rss_interval=10, blank_every=0, rss_of=driver_rss):
+        self.factory = factory
+        self.max_size = max(1, max_size)
+        self.max_pages = max_pages
+        self.max_age = max_age
+        self.min_idle = min(min_idle, self.max_size)
+        self.max_rss = max_rss            # 드라이버별 RSS 상한 (바이트, 0이면 감시 안 함)
+        self.rss_interval = rss_interval  # 같은 드라이버의 RSS를 다시 재기까지 최소 간격(초)
+        self.blank_every = blank_every    # N페이지마다 about:blank로 이동해서 이전 페이지 메모리 해제 (0이면 안 함)
+        self.rss_of = rss_of
+
+        self._cond = threading.Condition()
+        self._idle = []          # 반납되어 바로 사용 가능한 드라이버
+        self._records = {}       # id(driver) -> {"pages", "created", "since_blank", "rss", "rss_checked", "over_memory"}
+        self._size = 0           # 생성 완료 + 생성 중인 드라이버 수
+        self._creating = 0       # 생성 중인 드라이버 수
+        self._waiting = 0        # 체크아웃 대기 중인 요청 수
+        self._last_error = None
+        self._closed = False
+
+    # ------------------------------------------------------------------
+    # 공개 API
+    # ------------------------------------------------------------------
+    def prewarm(self, count=None):
+        """드라이버를 미리 생성해 둔다 (서버 시작 시 호출)"""
+        count = self.min_idle if count is None else count
+        with self._cond:
+            while self._size < min(count, self.max_size):
+                self._spawn()
+
+    def acquire(self, timeout=None):
+        """드라이버 체크아웃 (풀이 가득 차 있으면 반납될 때까지 대기)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            with self._cond:
+                driver = None
+                while driver is None:
+                    if self._closed:
+                        raise RuntimeError("드라이버 풀이 종료되었습니다.")
+
+                    if self._idle:
+                        driver = self._idle.pop()
+                        break
+
+                    # 생성 실패가 있었고 더 이상 기다릴 생성 작업이 없으면 에러 전달
+                    if self._last_error is not None and self._creating == 0:
+                        error = self._last_error
+                        self._last_error = None
+                        raise error
+
+                    # 대기자 수만큼만 새로 생성 (최대 크기 이내)
+                    if self._size < self.max_size and self._creating <= self._waiting:
+                        self._spawn()
+
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError(f"드라이버 체크아웃 타임아웃 ({timeout}초 초과)")
+
+                    self._waiting += 1
+                    try:
+                        self._cond.wait(remaining)
+                    finally:
+                        self._waiting -= 1
+
+            # 헬스체크는 락 밖에서 수행 (WebDriver 왕복 요청)
+            if self._is_usable(driver):
+                return driver
+            print("[드라이버 풀] 응답 없는 드라이버 폐기 후 재시도")
+            self._discard(driver)
+
+    def checkpoint(self, driver, pages=1):
+        """사용 중인 드라이버로 페이지를 처리한 뒤 호출 (메모리 감시)
+
+        반환값: 계속 사용해도 되면 True, RSS 상한을 넘어서 교체해야 하면 False
+        (False여도 드라이버는 그대로 동작하며, 반납하면 폐기되고 새 드라이버가 생성됨)
+        """
+        record = self._records.get(id(driver))
+        if record is None:
+            return True
+        record["since_blank"] += pages
+        if self.blank_every and record["since_blank"] >= self.blank_every:
+            record["since_blank"] = 0
+            try:
+                driver.get("about:blank")
+            except Exception:
+                pass
+        self._check_memory(driver, record)
+        return not record["over_memory"]
+
+    def release(self, driver, pages=0, broken=False):
+        """드라이버 반납 (pages: 이번 체크아웃 동안 방문한 페이지 수)"""
+        if driver is None:
+            return
+
+        record = self._records.get(id(driver))
+        if record is not None:
+            record["pages"] += pages
+            self._check_memory(driver, record, force=True)
+
+        if broken or record is None or self._is_expired(record):
+            if broken:
+                reason = "오류"
+            elif record is not None and record["over_memory"]:
+                reason = f"메모리 {record['rss'] // (1024 * 1024)}MB 사용"
+            else:
+                reason = f"{record['pages'] if record else '?'}페이지 사용"
+            print(f"[드라이버 풀] 드라이버 재생성 ({reason})")
+            self._discard(driver)
+            return
+
+        with self._cond:
+            if self._closed:
+                self._quit_later(driver)
+                self._records.pop(id(driver), None)
+                self._size -= 1
+                return
+            self._idle.append(driver)
+            self._cond.notify()
+
+    def stats(self):
+        with self._cond:
+            return {
+                "size": self._size,
+                "max_size": self.max_size,
+                "idle": len(self._idle),
+                "in_use": self._size - self._creating - len(self._idle),
+                "creating": self._creating,
+                "waiting": self._waiting,
+            }
+
+    def memory(self):
+        """드라이버별 마지막으로 잰 RSS(바이트) 목록"""
+        with self._cond:
+            return [record["rss"] for record in self._records.values() if record["rss"] is not None]
+
+    def shutdown(self):
+        """모든 드라이버 종료"""
+        with self._cond:
+            self._closed = True
+            idle = self._idle
+            self._idle = []
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for driver in idle:
+            self._records.pop(id(driver), None)
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+    # ------------------------------------------------------------------
+    # 내부 처리
+    # ------------------------------------------------------------------
+    def _spawn(self):
+        """백그라운드에서 드라이버 생성 시작 (락을 잡은 상태에서 호출)"""
+        self._size += 1
+        self._creating += 1
+        thread = threading.Thread(target=self._create, daemon=True)
+        thread.start()
+
+    def _create(self):
+        try:
+            driver = self.factory()
+        except Exception as e:
+            print(f"[드라이버 풀] 드라이버 생성 실패: {e}")
+            with self._cond:
+                self._size -= 1
+                self._creating -= 1
+                self._last_error = e
+                self._cond.notify_all()
+            return
+
+        with self._cond:
+            self._creating -= 1
+            if self._closed:
+                self._size -= 1
+                self._quit_later(driver)
+                return
+            self._records[id(driver)] = {
+                "pages": 0,
+                "created": time.monotonic(),
+                "since_blank": 0,
+                "rss": None,
+                "rss_checked": 0.0,
+                "over_memory": False,
+            }
+            self._idle.append(driver)
+            self._cond.notify()
+        print(f"[드라이버 풀] 드라이버 준비 완료 ({self.stats()})")
+
+    def _discard(self, driver):
+        """드라이버 폐기 후 필요하면 대체 드라이버 생성"""
+        self._records.pop(id(driver), None)
+        self._quit_later(driver)
+        with self._cond:
+            self._size -= 1
+            if not self._closed and (self._waiting > self._creating or self._size < self.min_idle):
+                self._spawn()
+            self._cond.notify_all()
+
+    def _check_memory(self, driver, record, force=False):
+        """RSS를 재서 상한을 넘었으면 교체 대상으로 표시 (rss_interval초에 한 번만 측정)"""
+        now = time.monotonic()
+        if not force and now - record["rss_checked"] < self.rss_interval:
+            return
+        record["rss_checked"] = now
+        rss = self.rss_of(driver) if self.rss_of else None
+        if rss is None:
+            return
+        record["rss"] = rss
+        if self.max_rss and rss > self.max_rss and not record["over_memory"]:
+            record["over_memory"] = True
+            print(f"[드라이버 풀] 메모리 상한 초과 ({rss // (1024 * 1024)}MB > {self.max_rss // (1024 * 1024)}MB) - 반납 시 재생성")
+
+    def _is_expired(self, record):
+        if record.get("over_memory"):
+            return True
+        if self.max_pages and record["pages"] >= self.max_pages:
+            return True
+        if self.max_age and time.monotonic() - record["created"] >= self.max_age:
+            return True
+        return False
+
+    def _is_usable(self, driver):
+        record = self._records.get(id(driver))
+        if record is None or self._is_expired(record):
+            return False
+        try:
+            driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _quit_later(driver):
+        """driver.quit()은 수 초가 걸릴 수 있으므로 별도 스레드에서 실행"""
+        def _quit():
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        threading.Thread(target=_quit, daemon=True).start()
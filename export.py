@@ -0,0 +1,59 @@
+import csv
+import io
+import tempfile
+
+from openpyxl import Workbook
+
+
+# 다운로드 파일 컬럼 (순서 유지)
+EXPORT_COLUMNS = ["회사명", "이메일", "대표자명", "회사주소", "URL"]
+
+CSV_FLUSH_ROWS = 200  # CSV를 이 행 수만큼 모아서 한 번에 전송
+XLSX_SPOOL_SIZE = 8 * 1024 * 1024  # 이 크기까지는 메모리, 넘으면 임시 파일에 기록 (바이트)
+
+
+def _row_values(row):
+    return [row.get(column) or "" for column in EXPORT_COLUMNS]
+
+
+def iter_csv(rows):
+    """결과 행을 CSV로 조금씩 만들어서 bytes로 내보냄 (엑셀에서 한글이 깨지지 않도록 BOM 포함)
+
+    rows는 한 번에 한 행씩만 읽으므로 행 수가 늘어도 메모리 사용량은 일정하다.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    yield "\ufeff".encode("utf-8")
+    pending = 0
+    for row in rows:
+        writer.writerow(_row_values(row))
+        pending += 1
+        if pending >= CSV_FLUSH_ROWS:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    yield buffer.getvalue().encode("utf-8")
+
+
+def write_xlsx(rows, spool_size=XLSX_SPOOL_SIZE):
+    """결과 행을 XLSX로 기록한 파일 객체 반환 (처음 위치로 되감은 상태)
+
+    openpyxl write-only 모드로 행을 바로 기록하고, 결과 파일은 spool_size를 넘으면
+    디스크 임시 파일로 넘어가므로 전체 통합 문서를 메모리에 올리지 않는다.
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Sheet1")
+    sheet.append(EXPORT_COLUMNS)
+    for row in rows:
+        sheet.append(_row_values(row))
+
+    output = tempfile.SpooledTemporaryFile(max_size=spool_size)
+    try:
+        workbook.save(output)
+    except Exception:
+        output.close()
+        raise
+    output.seek(0)
+    return output
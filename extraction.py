@@ -0,0 +1,142 @@
+import re
+from collections import namedtuple
+
+
+# 추출 후보 (field: email/company/ceo/address, score: 패턴 신뢰도, pos: 문서 내 위치, source: text/html)
+Candidate = namedtuple("Candidate", "field value score pos source")
+
+EMAIL_PATTERN = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+EMAIL_RE = re.compile(EMAIL_PATTERN)
+
+REGIONS = "서울|부산|대구|인천|광주|대전|울산|세종|경기|강원|충북|충남|전북|전남|경북|경남|제주"
+
+# 후보가 시작될 수 있는 표시 문자열 -> 종류
+# (그룹/플래그 없는 단순 alternation이어야 정규식 엔진의 빠른 경로를 탐. 종류는 dict로 구분)
+TRIGGER_KINDS = {"@": "email", "(주)": "company_paren", "주식회사": "company_corp", "㈜": "company_corp"}
+TRIGGER_KINDS.update(dict.fromkeys(["회사명", "상호", "법인명", "업체명", "기업명"], "company_label"))
+TRIGGER_KINDS.update(dict.fromkeys(["대표", "CEO", "Ceo", "ceo"], "ceo"))
+TRIGGER_KINDS.update(dict.fromkeys(["주소", "소재지", "사업장", "본사"], "address_label"))
+TRIGGER_KINDS.update(dict.fromkeys(REGIONS.split("|"), "region"))
+
+TRIGGER_RE = re.compile(
+    r'@|회사명|상\s*호|법인명|업체명|기업명|\(주\)|주식회사|㈜|대\s*표|CEO|Ceo|ceo|주\s*소|소재지|사업장|본사|' + REGIONS
+)
+_SPACES = re.compile(r'\s+')
+
+
+# 표시 문자열 위치에서 시도할 패턴 (필드, 점수, 패턴) - 값 부분만 캡처 그룹 하나
+# 같은 필드 안에서는 점수가 높은 패턴이 우선 (예전 코드의 패턴 목록 순서와 동일)
+RULES = {
+    "company_label": [
+        ("company", 1.0, re.compile(r'(?:회사명|상호|법인명|업체명|기업명)\s*[:\s]\s*([^\n\r,|(]{2,30})')),
+        ("company", 0.9, re.compile(r'상\s+호\s*[:\s]\s*([^\n\r,|(]{2,30})')),
+    ],
+    "company_paren": [
+        ("company", 0.8, re.compile(r'\(주\)\s*([가-힣a-zA-Z0-9\s]{2,20})')),
+    ],
+    "company_corp": [
+        ("company", 0.6, re.compile(r'((?:주식회사|㈜)\s*[가-힣a-zA-Z0-9]{2,15})')),
+    ],
+    "ceo": [
+        ("ceo", 1.0, re.compile(r'(?:대표자?|대표이사|CEO|대표자명)\s*[:\s]\s*([가-힣]{2,5})', re.IGNORECASE)),
+        ("ceo", 0.9, re.compile(r'대\s+표\s*[:\s]\s*([가-힣]{2,5})')),
+        ("ceo", 0.8, re.compile(r'대표이사\s*([가-힣]{2,5})')),
+    ],
+    "address_label": [
+        ("address", 1.0, re.compile(r'(?:주소|소재지|사업장\s*소재지|본사)\s*[:\s]\s*([^\n\r]{10,80})')),
+        ("address", 0.9, re.compile(r'주\s+소\s*[:\s]\s*([^\n\r]{10,80})')),
+    ],
+    "region": [
+        ("address", 0.6, re.compile(rf'((?:{REGIONS})[^\n\r]{{10,70}})')),
+    ],
+}
+
+# "OO주식회사", "OO㈜", "OO(주)" - 회사명이 표시 문자열 앞에 오는 경우 (앞쪽 최대 15자)
+COMPANY_SUFFIX_SCORE = 0.7
+_NAME_BEFORE_SUFFIX = re.compile(r'[가-힣]{2,15}$')
+
+IMAGE_SUFFIXES = ('.png', '.jpg', '.gif', '.svg', '.jpeg', '.webp', '.ico', '.css', '.js')
+JUNK_EMAIL_MARKERS = ('noreply', 'no-reply', 'donotreply')
+
+FIELD_KEYS = {"company": "회사명", "ceo": "대표자명", "address": "회사주소"}
+
+
+def is_junk_email(email, exclude=()):
+    """이미지 파일명, noreply 등 연락처가 아닌 이메일 (exclude: 추가로 제외할 문자열)"""
+    email_lower = email.lower()
+    if email_lower.endswith(IMAGE_SUFFIXES):
+        return True
+    return any(marker in email_lower for marker in JUNK_EMAIL_MARKERS) or any(x in email_lower for x in exclude)
+
+
+def find_emails(*texts):
+    """여러 텍스트에서 이메일 찾기 (처음 나온 순서대로, 중복 제거)"""
+    found = {}
+    for text in texts:
+        if text:
+            for email in EMAIL_RE.findall(text):
+                found.setdefault(email, None)
+    return list(found)
+
+
+def scan(text, html=""):
+    """문서를 한 번 훑어서 모든 필드의 후보를 점수와 함께 반환
+
+    표시 문자열(@, 상호, 대표, 주소, 지역명 등)이 나온 위치에서만 해당 필드의 패턴을 시도하므로
+    필드/패턴마다 문서 전체를 다시 검색하지 않는다.
+    이메일은 텍스트에서 찾고, 텍스트에 하나도 없을 때만 HTML(mailto 링크 등)에서 찾는다 (점수 낮음).
+    반환값: 점수 높은 순, 같은 점수면 앞에 나온 순으로 정렬된 Candidate 목록
+    """
+    candidates = []
+    email_end = 0  # 마지막으로 찾은 이메일의 끝 (그 안의 @는 다시 보지 않음)
+    for trigger in TRIGGER_RE.finditer(text):
+        token = trigger.group(0)
+        kind = TRIGGER_KINDS.get(token) or TRIGGER_KINDS[_SPACES.sub("", token)]  # "상 호", "대 표" 등
+        start = trigger.start()
+        if kind == "email":
+            if start < email_end:
+                continue
+            # @ 앞쪽(같은 줄, 최대 64자)부터 이메일을 찾아서 이 @를 포함하는지 확인
+            line_start = max(text.rfind("\n", 0, start) + 1, start - 64, email_end)
+            match = EMAIL_RE.search(text, line_start, start + 256)
+            if match and match.start() <= start < match.end():
+                candidates.append(Candidate("email", match.group(0), 1.0, match.start(), "text"))
+                email_end = match.end()
+            continue
+
+        for field, score, pattern in RULES[kind]:
+            match = pattern.match(text, start)
+            if match:
+                candidates.append(Candidate(field, match.group(1).strip(), score, start, "text"))
+        if kind in ("company_paren", "company_corp"):
+            name = _NAME_BEFORE_SUFFIX.search(text, max(0, start - 15), start)
+            if name:
+                value = name.group(0) + token
+                candidates.append(Candidate("company", value, COMPANY_SUFFIX_SCORE, name.start(), "text"))
+
+    if html and not any(c.field == "email" for c in candidates):
+        for match in EMAIL_RE.finditer(html):
+            candidates.append(Candidate("email", match.group(0), 0.8, match.start(), "html"))
+
+    candidates.sort(key=lambda c: (-c.score, c.pos))
+    return candidates
+
+
+def extract_fields(text, html="", email_exclude=(), email_limit=3):
+    """scan 결과에서 필드별 최선의 값 선택
+
+    반환값: {"이메일": "a@b.com, c@d.com", "회사명": ..., "대표자명": ..., "회사주소": ...} (못 찾은 필드는 "")
+    """
+    emails = []
+    fields = {"이메일": "", "회사명": "", "대표자명": "", "회사주소": ""}
+    for candidate in scan(text, html):
+        if candidate.field == "email":
+            if (len(emails) < email_limit and candidate.value not in emails
+                    and not is_junk_email(candidate.value, email_exclude)):
+                emails.append(candidate.value)
+            continue
+        key = FIELD_KEYS[candidate.field]
+        if not fields[key]:
+            fields[key] = candidate.value
+    fields["이메일"] = ", ".join(emails)
+    return fields
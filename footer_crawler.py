@@ -1,15 +1,19 @@
 import time
-import re
 import pandas as pd
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
 from urllib.parse import quote_plus
 
+from chromedriver_path import resolve_chromedriver
+from extraction import extract_fields
+from host_filter import HostFilter
+from resource_blocking import apply_profile, chrome_prefs
 
-# 제외할 사이트 목록 (회사 웹사이트와 관련 없는 사이트들)
+
+# 제외할 사이트 목록 (회사 웹사이트와 관련 없는 사이트들, 형식은 host_filter.parse_rules)
+# 점이 있으면 호스트 접미사, 점이 없으면 호스트 라벨 하나와 일치, /로 시작하면 URL 경로 조각
 EXCLUDE_DOMAINS = [
     # 네이버 관련
     "naver.com", "naver.me",
@@ -17,42 +21,42 @@ EXCLUDE_DOMAINS = [
     # 뉴스/미디어
     "news", "snmnews", "chosun", "joongang", "hani", "donga", "hankyung",
     "mk.co.kr", "mt.co.kr", "edaily", "newsis", "yonhap", "yna.co.kr",
+    "/news/", "/article/",
     
     # 블로그/커뮤니티
     "tistory", "blog", "brunch", "medium.com", "velog", "notion.so",
-    "cafe.daum", "dcinside", "clien", "ruliweb", "fmkorea",
+    "cafe.daum.net", "dcinside", "clien", "ruliweb", "fmkorea",
+    "/blog/", "/cafe/",
     
     # 채용/구인구직
     "saramin", "jobkorea", "job.gg.go.kr", "incruit", "wanted", "jobaba",
-    "alba", "work.go.kr", "catch.co.kr", "superookie",
+    "alba", "albamon", "work.go.kr", "catch.co.kr", "superookie",
     
     # 쇼핑몰/오픈마켓
     "gmarket", "11st", "coupang", "auction", "interpark", "wemakeprice",
-    "tmon", "ssg.com", "lotte", "shinsegae", "hmall", "gsshop",
+    "tmon", "ssg.com", "lotte", "lotteon", "shinsegae", "hmall", "gsshop",
     "alibaba", "aliexpress", "amazon", "ebay", "taobao",
     
     # 해외 사이트 전체 제외
-    "mfgrobots", "alibaba", "made-in-china", "globalsources",
+    "mfgrobots", "made-in-china", "globalsources",
     "firstmold", "djmolding", "sanonchina", "yujebearing",
     "custom-plastic-molds", "rjcmold", "formlabs",
-    "juliertech", ".cn", ".com.cn",
+    "juliertech", ".cn",
     
     # 지도/위키/기타
     "wikipedia", "namu.wiki", "openstreetmap", "google.com", "youtube",
     "facebook", "instagram", "twitter", "linkedin",
     
     # 광고
-    "ad.search", "searchad", "adsense",
+    "ad.search.naver.com", "searchad", "adsense",
 ]
 
+url_filter = HostFilter(EXCLUDE_DOMAINS)
+
 
 def is_valid_company_url(url):
     """회사 웹사이트로 적합한 URL인지 확인"""
-    url_lower = url.lower()
-    for domain in EXCLUDE_DOMAINS:
-        if domain in url_lower:
-            return False
-    return True
+    return url_filter.is_allowed(url)
 
 
 def setup_driver():
@@ -64,8 +68,9 @@ def setup_driver():
     chrome_options.add_argument("--disable-gpu")
     # 봇 탐지 회피용 User-Agent
     chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
+    chrome_options.add_experimental_option("prefs", chrome_prefs())  # 이미지 등 불필요한 리소스 차단
     
-    service = Service(ChromeDriverManager().install())
+    service = Service(resolve_chromedriver()["path"])
     driver = webdriver.Chrome(service=service, options=chrome_options)
     return driver
 
@@ -78,6 +83,7 @@ def get_naver_links(driver, keyword, pages=5):
     for page in range(1, pages + 1):
         # 네이버 웹 검색 URL (where=web으로 웹사이트만 검색)
         url = f"https://search.naver.com/search.naver?where=web&query={quote_plus(keyword)}&page={page}"
+        apply_profile(driver, "naver")
         driver.get(url)
         time.sleep(2)  # 로딩 대기
         
@@ -128,6 +134,7 @@ def extract_company_info(driver, url):
     try:
         print(f"   ㄴ 접속 중: {url}")
         driver.set_page_load_timeout(15)
+        apply_profile(driver, "web")
         driver.get(url)
         time.sleep(2)
         
@@ -137,53 +144,9 @@ def extract_company_info(driver, url):
         # 2. 페이지 전체 텍스트 가져오기
         body_text = driver.find_element(By.TAG_NAME, "body").text
         
-        # 3. 이메일 추출
-        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        found_emails = re.findall(email_pattern, body_text)
-        real_emails = [e for e in found_emails if not e.lower().endswith(('.png', '.jpg', '.gif', '.svg', '.jpeg', '.webp'))]
-        info["이메일"] = ", ".join(set(real_emails))
-        
-        # 4. 회사명 추출 (다양한 패턴)
-        company_patterns = [
-            r'(?:회사명|상호|법인명|업체명|기업명)\s*[:\s]\s*([^\n\r,|(]{2,30})',
-            r'(?:상\s*호)\s*[:\s]\s*([^\n\r,|(]{2,30})',
-            r'\(주\)\s*([가-힣a-zA-Z0-9\s]{2,20})',
-            r'([가-힣]{2,15}(?:주식회사|㈜|\(주\)))',
-            r'((?:주식회사|㈜)\s*[가-힣a-zA-Z0-9]{2,15})',
-        ]
-        for pattern in company_patterns:
-            match = re.search(pattern, body_text)
-            if match:
-                info["회사명"] = match.group(1).strip()
-                break
-        
-        # 5. 대표자명 추출
-        ceo_patterns = [
-            r'(?:대표자?|대표이사|CEO|대표자명)\s*[:\s]\s*([가-힣]{2,5})',
-            r'(?:대\s*표)\s*[:\s]\s*([가-힣]{2,5})',
-            r'대표이사\s*([가-힣]{2,5})',
-        ]
-        for pattern in ceo_patterns:
-            match = re.search(pattern, body_text, re.IGNORECASE)
-            if match:
-                info["대표자명"] = match.group(1).strip()
-                break
-        
-        # 6. 회사 주소 추출
-        address_patterns = [
-            r'(?:주소|소재지|사업장\s*소재지|본사)\s*[:\s]\s*([^\n\r]{10,80})',
-            r'(?:주\s*소)\s*[:\s]\s*([^\n\r]{10,80})',
-            r'((?:서울|부산|대구|인천|광주|대전|울산|세종|경기|강원|충북|충남|전북|전남|경북|경남|제주)[^\n\r]{10,70})',
-        ]
-        for pattern in address_patterns:
-            match = re.search(pattern, body_text)
-            if match:
-                addr = match.group(1).strip()
-                # 주소가 너무 길면 자르기
-                if len(addr) > 80:
-                    addr = addr[:80] + "..."
-                info["회사주소"] = addr
-                break
+        # 3~6. 이메일/회사명/대표자명/주소 추출 (미리 컴파일된 추출 엔진, 텍스트 한 번만 훑음)
+        fields = extract_fields(body_text, email_limit=10)
+        info.update(fields)
         
         return info
 
@@ -0,0 +1,173 @@
+import os
+import re
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+RELOAD_CHECK_INTERVAL = 5  # 외부 목록 파일이 바뀌었는지 확인하는 최소 간격(초)
+HOST_CACHE_SIZE = 50000  # 호스트별 판정 결과를 기억하는 개수 (넘으면 비움)
+
+_UNUSUAL_HOST = re.compile(r"[@:?#\[\]\\]")  # 사용자 정보/포트/IPv6 등이 섞인 주소는 urlsplit으로 처리
+
+
+def split_host_path(url):
+    """URL에서 (소문자 호스트, 호스트 뒤 나머지) 추출 - 흔한 형태는 문자열 검색만으로 처리"""
+    start = url.find("://")
+    if start < 0:
+        return "", ""
+    start += 3
+    end = url.find("/", start)
+    if end < 0:
+        host, path = url[start:], ""
+    else:
+        host, path = url[start:end], url[end:]
+    if _UNUSUAL_HOST.search(host) is None:
+        return host.lower(), path
+    parts = urlsplit(url)
+    return parts.hostname or "", parts.path
+
+
+def parse_rules(lines):
+    """제외 규칙 목록을 (도메인 접미사, 라벨, 경로 조각)으로 분류
+
+    - "/blog/" 처럼 /로 시작하면 URL 경로에 포함된 조각
+    - "naver.com", ".cn" 처럼 점이 있으면 호스트 접미사 (naver.com, www.naver.com은 일치 / lego.kr은 go.kr과 불일치)
+    - "chosun" 처럼 점이 없으면 호스트의 라벨 하나와 정확히 일치 (www.chosun.com, chosun.co.kr)
+    - 빈 줄과 # 뒤의 주석은 무시
+    """
+    suffixes, labels, paths = set(), set(), set()
+    for line in lines:
+        rule = line.split("#", 1)[0].strip().lower()
+        if not rule:
+            continue
+        if rule.startswith("/"):
+            paths.add(rule)
+        elif "." in rule:
+            suffixes.add(rule.strip("."))
+        else:
+            labels.add(rule)
+    return suffixes, labels, paths
+
+
+class _Rules:
+    """한 번 만든 뒤 바꾸지 않는 규칙 묶음 (다시 읽을 때는 통째로 교체)"""
+
+    __slots__ = ("suffixes", "labels", "path_re", "count", "host_cache", "prefix_cache")
+
+    def __init__(self, suffixes, labels, paths):
+        self.suffixes = frozenset(suffixes)
+        self.labels = frozenset(labels)
+        # 경로 조각은 정규식 하나로 합쳐서 한 번에 검사 (긴 조각 우선)
+        ordered = sorted(paths, key=len, reverse=True)
+        self.path_re = re.compile("|".join(map(re.escape, ordered)), re.IGNORECASE) if ordered else None
+        self.count = len(self.suffixes) + len(self.labels) + len(ordered)
+        self.host_cache = {}  # 호스트 -> 제외 여부 (검색 결과의 링크는 같은 호스트가 반복되는 경우가 많음)
+        self.prefix_cache = {}  # URL의 "scheme://host" 부분(원문 그대로) -> 제외 여부 (호스트 추출도 건너뜀)
+
+
+class HostFilter:
+    """호스트 접미사 집합 + 라벨 집합 + 경로 정규식으로 URL 제외 여부 판단
+
+    호스트는 오른쪽 라벨부터 접미사를 하나씩 늘려가며(kr → lego.kr → www.lego.kr) 집합에서 찾으므로
+    규칙 개수와 관계없이 호스트의 라벨 수만큼만 조회한다.
+    source_file이 있으면 그 파일의 규칙을 기본 규칙에 더하고, 파일이 바뀌면 다음 검사 때 다시 읽는다.
+    """
+
+    def __init__(self, rules=(), source_file=None):
+        self._base = parse_rules(rules)
+        self.source_file = source_file
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._checked = 0.0
+        self._rules = _Rules(*self._base)
+        if source_file:
+            self.reload()
+
+    def reload(self):
+        """외부 목록 파일을 다시 읽음 (파일이 없거나 읽을 수 없으면 기본 규칙만 사용). 반환값: 규칙 수"""
+        suffixes, labels, paths = (set(part) for part in self._base)
+        mtime = None
+        if self.source_file:
+            try:
+                mtime = os.path.getmtime(self.source_file)
+                with open(self.source_file, encoding="utf-8") as f:
+                    extra = parse_rules(f)
+            except OSError as e:
+                print(f"[URL 필터] 제외 목록을 읽지 못함 ({self.source_file}): {e}")
+            else:
+                for target, part in zip((suffixes, labels, paths), extra):
+                    target.update(part)
+        with self._lock:
+            self._rules = _Rules(suffixes, labels, paths)
+            self._mtime = mtime
+            self._checked = time.monotonic()
+        print(f"[URL 필터] 제외 규칙 {self._rules.count}개 적용")
+        return self._rules.count
+
+    def _reload_if_changed(self):
+        now = time.monotonic()
+        if now - self._checked < RELOAD_CHECK_INTERVAL:
+            return
+        self._checked = now
+        try:
+            mtime = os.path.getmtime(self.source_file)
+        except OSError:
+            mtime = None
+        if mtime != self._mtime:
+            self.reload()
+
+    def host_excluded(self, host):
+        """호스트(소문자)가 제외 도메인/라벨에 해당하는지"""
+        return self._host_excluded(self._rules, host)
+
+    @staticmethod
+    def _host_excluded(rules, host):
+        excluded = rules.host_cache.get(host)
+        if excluded is not None:
+            return excluded
+        name = host.rstrip(".")
+        excluded = bool(rules.labels) and not rules.labels.isdisjoint(name.split("."))
+        dot = len(name)
+        while not excluded and dot >= 0:
+            dot = name.rfind(".", 0, dot)
+            excluded = name[dot + 1:] in rules.suffixes
+        if len(rules.host_cache) >= HOST_CACHE_SIZE:
+            rules.host_cache.clear()
+        rules.host_cache[host] = excluded
+        return excluded
+
+    def is_allowed(self, url):
+        """제외 규칙에 걸리지 않는 URL이면 True (호스트나 경로 조각이 하나라도 걸리면 False)"""
+        if self.source_file:
+            self._reload_if_changed()
+        rules = self._rules
+        start = url.find("://")
+        if start < 0:
+            return True  # 호스트가 없는 주소는 판단하지 않음 (이전과 동일)
+        end = url.find("/", start + 3)
+        if end < 0:
+            end = len(url)
+        # 같은 사이트의 링크가 반복되므로 "scheme://host" 원문으로 먼저 찾음 (호스트 추출/소문자 변환 생략)
+        prefix = url[:end]
+        excluded = rules.prefix_cache.get(prefix)
+        if excluded is None:
+            try:
+                host, _ = split_host_path(url)
+            except ValueError:
+                return False
+            excluded = bool(host) and self._host_excluded(rules, host)
+            if len(rules.prefix_cache) >= HOST_CACHE_SIZE:
+                rules.prefix_cache.clear()
+            rules.prefix_cache[prefix] = excluded
+        if excluded:
+            return False
+        if rules.path_re is None or len(url) - end < 3:
+            return True
+        # 쿼리 문자열/fragment는 검사하지 않음 (?ref=/blog/ 등) - 잘라내지 않고 검색 범위만 제한
+        stop = len(url)
+        for mark in "?#":
+            found = url.find(mark, end, stop)
+            if found >= 0:
+                stop = found
+        return rules.path_re.search(url, end, stop) is None
@@ -0,0 +1,265 @@
+import re
+import time
+from html import unescape as html_unescape
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+import urllib3
+
+
+# 브라우저와 동일한 User-Agent 사용 (일부 사이트는 봇 UA를 차단함)
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+HTTP_TIMEOUT = 8            # 전체 다운로드 시간 제한(초)
+HTTP_MAX_BYTES = 2 * 1024 * 1024  # 최대 다운로드 크기 (2MB, 초과분은 버림)
+HTTP_CHUNK_SIZE = 64 * 1024
+
+# 프로세스 전체에서 공유하는 커넥션 풀 (같은 호스트 재방문 시 keep-alive 재사용)
+_pool = urllib3.PoolManager(
+    num_pools=100,
+    maxsize=8,
+    headers={
+        "User-Agent": USER_AGENT,
+        "Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
+        "Accept-Encoding": "gzip, deflate",
+    },
+    retries=urllib3.Retry(total=1, connect=1, read=0, redirect=5, raise_on_redirect=False),
+    timeout=urllib3.Timeout(connect=4, read=HTTP_TIMEOUT),
+)
+
+
+class FetchError(Exception):
+    """HTTP로 페이지를 가져오지 못한 경우 (브라우저로 재시도해야 함)"""
+
+
+_CHARSET_META = re.compile(rb'<meta[^>]+charset=["\']?\s*([a-zA-Z0-9_-]+)', re.IGNORECASE)
+
+
+def fetch_html(url, timeout=HTTP_TIMEOUT, max_bytes=HTTP_MAX_BYTES):
+    """URL의 HTML을 가져온다. 반환값: (최종 URL, HTML 문자열)"""
+    started = time.monotonic()
+    try:
+        response = _pool.request("GET", url, preload_content=False, decode_content=True)
+    except Exception as e:
+        raise FetchError(f"요청 실패: {e}") from e
+
+    try:
+        if response.status >= 400:
+            raise FetchError(f"HTTP {response.status}")
+
+        content_type = response.headers.get("Content-Type", "")
+        if content_type and "html" not in content_type.lower():
+            raise FetchError(f"HTML 아님: {content_type}")
+
+        chunks = []
+        size = 0
+        for chunk in response.stream(HTTP_CHUNK_SIZE, decode_content=True):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= max_bytes:
+                break
+            if time.monotonic() - started > timeout:
+                raise FetchError(f"다운로드 시간 초과 ({timeout}초)")
+        raw = b"".join(chunks)[:max_bytes]
+
+        final_url = response.url or url
+        return final_url, _decode(raw, content_type)
+    except FetchError:
+        raise
+    except Exception as e:
+        raise FetchError(f"응답 읽기 실패: {e}") from e
+    finally:
+        response.release_conn()
+
+
+def _decode(raw, content_type):
+    """응답 본문 디코딩 (헤더 → meta 태그 → utf-8 → cp949 순서로 시도)"""
+    candidates = []
+    match = re.search(r'charset=([a-zA-Z0-9_-]+)', content_type or "", re.IGNORECASE)
+    if match:
+        candidates.append(match.group(1))
+    match = _CHARSET_META.search(raw[:4096])
+    if match:
+        candidates.append(match.group(1).decode("ascii", "ignore"))
+    candidates.extend(["utf-8", "cp949"])
+
+    for charset in candidates:
+        charset = charset.lower()
+        if charset in ("euc-kr", "ks_c_5601-1987", "x-windows-949"):
+            charset = "cp949"  # euc-kr 상위 호환
+        try:
+            return raw.decode(charset)
+        except (LookupError, UnicodeDecodeError):
+            continue
+    return raw.decode("utf-8", "replace")
+
+
+class _TextExtractor(HTMLParser):
+    """HTML에서 보이는 텍스트만 추출 (Selenium의 body.text와 비슷하게 블록 단위 줄바꿈)"""
+
+    SKIP_TAGS = {"script", "style", "noscript", "template", "svg", "head"}
+    BLOCK_TAGS = {
+        "p", "div", "br", "li", "ul", "ol", "dl", "dt", "dd", "tr", "table",
+        "section", "article", "header", "footer", "nav", "aside", "address",
+        "h1", "h2", "h3", "h4", "h5", "h6", "form", "hr", "pre", "blockquote",
+    }
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self.title = ""
+        self.script_count = 0
+        self._skip_depth = 0
+        self._in_title = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "script":
+            self.script_count += 1
+        if tag == "title":
+            self._in_title = True
+        if tag in self.SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append("\n")
+        elif tag in ("td", "th"):
+            self.parts.append(" ")
+
+    def handle_endtag(self, tag):
+        if tag == "title":
+            self._in_title = False
+        if tag in self.SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_data(self, data):
+        if self._in_title:
+            self.title += data
+            return
+        if self._skip_depth == 0:
+            self.parts.append(data)
+
+
+def parse_html(html):
+    """HTML → (페이지 제목, 보이는 텍스트, script 태그 개수)"""
+    parser = _TextExtractor()
+    try:
+        parser.feed(html)
+        parser.close()
+    except Exception:
+        pass
+    text = "".join(parser.parts)
+    # 줄 단위 공백 정리 (정규식이 줄바꿈 기준으로 동작하므로 줄 구조는 유지)
+    lines = (re.sub(r'[ \t\r\f\v\xa0]+', ' ', line).strip() for line in text.split("\n"))
+    text = "\n".join(line for line in lines if line)
+    return parser.title.strip(), text, parser.script_count
+
+
+class _LinkExtractor(HTMLParser):
+    """a/button 태그의 href/onclick 수집 (브라우저 없이 검색 결과 링크를 모을 때 사용)"""
+
+    def __init__(self, base_url):
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.anchors = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag not in ("a", "button", "base"):
+            return
+        attrs = dict(attrs)
+        if tag == "base":
+            if attrs.get("href"):
+                self.base_url = urljoin(self.base_url, attrs["href"])
+            return
+        href = (attrs.get("href") or "").strip()
+        onclick = attrs.get("onclick") or ""
+        if href.lower().startswith(("javascript:", "mailto:", "tel:", "#")):
+            href = ""
+        if href or onclick:
+            self.anchors.append({"href": urljoin(self.base_url, href) if href else "", "onclick": onclick})
+
+
+def parse_links(html, base_url, max_anchors=3000):
+    """HTML의 링크 목록 [{"href"(절대 주소), "onclick"}, ...] (dom_snapshot.collect_links의 anchors와 같은 형식)"""
+    parser = _LinkExtractor(base_url)
+    try:
+        parser.feed(html)
+        parser.close()
+    except Exception:
+        pass
+    return parser.anchors[:max_anchors]
+
+
+_JS_SHELL_MARKERS = re.compile(
+    r'<div[^>]+id=["\'](?:root|app|__next|__nuxt)["\'][^>]*>\s*</div>'
+    r'|enable javascript|자바스크립트를 활성화|javascript를 활성화'
+    r'|location\.(?:href|replace)\s*[=(]',
+    re.IGNORECASE,
+)
+
+
+def looks_like_js_shell(html, text, script_count):
+    """브라우저 렌더링이 필요한 페이지인지 추정 (SPA 껍데기, 프레임셋, 자바스크립트 리다이렉트)"""
+    if len(text) < 100:
+        return True
+    if re.search(r'<frameset|<iframe[^>]+src=', html[:20000], re.IGNORECASE) and len(text) < 1000:
+        return True
+    if _JS_SHELL_MARKERS.search(html) and len(text) < 2000:
+        return True
+    # 스크립트는 많은데 텍스트가 거의 없는 경우
+    if script_count >= 15 and len(text) < 800:
+        return True
+    return False
+
+
+REDIRECT_MAX_HOPS = 5
+REDIRECT_PEEK_BYTES = 64 * 1024  # 자바스크립트/meta 리다이렉트를 찾기 위해 읽는 최대 크기
+
+_BODY_REDIRECT = re.compile(
+    r'<meta[^>]+http-equiv=["\']?refresh["\']?[^>]*content=["\'][^"\']*url=([^"\'>\s]+)'
+    r'|location\.(?:href\s*=|replace\s*\(|assign\s*\()\s*["\']([^"\']+)["\']',
+    re.IGNORECASE,
+)
+
+
+def resolve_redirect(url, max_hops=REDIRECT_MAX_HOPS, until=None):
+    """리다이렉트(3xx, meta refresh, location.href/replace)를 따라가서 최종 URL 반환
+
+    광고 클릭 추적 URL을 실제 랜딩 페이지 주소로 바꿀 때 사용한다.
+    until(URL)이 참이 되면 그 URL은 요청하지 않고 바로 반환한다 (랜딩 페이지까지 받을 필요 없음).
+    본문은 리다이렉트를 찾을 만큼만 읽는다. 실패하면 FetchError.
+    """
+    current = url
+    for _ in range(max_hops):
+        if current != url and until is not None and until(current):
+            return current
+        try:
+            response = _pool.request("GET", current, redirect=False, preload_content=False, decode_content=True)
+        except Exception as e:
+            raise FetchError(f"요청 실패: {e}") from e
+        try:
+            location = response.headers.get("Location")
+            if 300 <= response.status < 400 and location:
+                current = urljoin(current, location)
+                continue
+            if response.status >= 400:
+                raise FetchError(f"HTTP {response.status}")
+            raw = response.read(REDIRECT_PEEK_BYTES, decode_content=True) or b""
+        except FetchError:
+            raise
+        except Exception as e:
+            raise FetchError(f"응답 읽기 실패: {e}") from e
+        finally:
+            # 본문을 다 읽지 않았으므로 연결은 재사용하지 않음
+            response.close()
+            response.release_conn()
+
+        match = _BODY_REDIRECT.search(_decode(raw, response.headers.get("Content-Type", "")))
+        if not match:
+            return current
+        target = html_unescape(match.group(1) or match.group(2)).strip()
+        if not target or target.lower().startswith("javascript:"):
+            return current
+        current = urljoin(current, target)
+    return current
@@ -0,0 +1,190 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+# 크롤링 작업 상태
+STATE_QUEUED = "queued"             # 실행 대기 중 (스케줄러 대기열)
+STATE_DISCOVERING = "discovering"   # URL 수집 중
+STATE_EXTRACTING = "extracting"     # 상세 페이지 정보 수집 중
+STATE_COMPLETED = "completed"
+STATE_STOPPED = "stopped"
+STATE_FAILED = "failed"
+
+UNFINISHED_STATES = (STATE_QUEUED, STATE_DISCOVERING, STATE_EXTRACTING)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id      TEXT PRIMARY KEY,
+    session_id  TEXT NOT NULL,
+    params      TEXT NOT NULL,
+    state       TEXT NOT NULL,
+    progress    TEXT NOT NULL DEFAULT '',
+    discovered  INTEGER NOT NULL DEFAULT 0,
+    created_at  REAL NOT NULL,
+    updated_at  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_session ON jobs (session_id, created_at);
+CREATE INDEX IF NOT EXISTS jobs_state ON jobs (state);
+
+CREATE TABLE IF NOT EXISTS frontier (
+    job_id    TEXT NOT NULL,
+    position  INTEGER NOT NULL,
+    url       TEXT NOT NULL,
+    done      INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (job_id, position),
+    UNIQUE (job_id, url)
+);
+
+CREATE TABLE IF NOT EXISTS results (
+    job_id  TEXT NOT NULL,
+    seq     INTEGER NOT NULL,
+    data    TEXT NOT NULL,
+    PRIMARY KEY (job_id, seq)
+);
+"""
+
+
+class JobStore:
+    """크롤링 작업/URL 목록/결과를 SQLite(WAL 모드)에 저장 (컨테이너 재시작 후 이어서 진행하기 위함)"""
+
+    def __init__(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def _execute(self, sql, params=()):
+        with self._lock:
+            return self._conn.execute(sql, params)
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    # ------------------------------------------------------------------
+    # 작업
+    # ------------------------------------------------------------------
+    def create_job(self, job_id, session_id, params, state=STATE_DISCOVERING):
+        now = time.time()
+        self._execute(
+            "INSERT INTO jobs (job_id, session_id, params, state, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (job_id, session_id, json.dumps(params, ensure_ascii=False), state, now, now),
+        )
+
+    def update_job(self, job_id, state=None, progress=None, discovered=None):
+        sets, params = ["updated_at = ?"], [time.time()]
+        if state is not None:
+            sets.append("state = ?")
+            params.append(state)
+        if progress is not None:
+            sets.append("progress = ?")
+            params.append(progress)
+        if discovered is not None:
+            sets.append("discovered = ?")
+            params.append(discovered)
+        params.append(job_id)
+        self._execute(f"UPDATE jobs SET {', '.join(sets)} WHERE job_id = ?", params)
+
+    def get_job(self, job_id):
+        rows = self._query("SELECT * FROM jobs WHERE job_id = ?", (job_id,))
+        return self._job_row(rows[0]) if rows else None
+
+    def latest_job_for_session(self, session_id):
+        rows = self._query(
+            "SELECT * FROM jobs WHERE session_id = ? ORDER BY created_at DESC LIMIT 1", (session_id,)
+        )
+        return self._job_row(rows[0]) if rows else None
+
+    def unfinished_jobs(self):
+        placeholders = ", ".join("?" for _ in UNFINISHED_STATES)
+        rows = self._query(
+            f"SELECT * FROM jobs WHERE state IN ({placeholders}) ORDER BY created_at", UNFINISHED_STATES
+        )
+        return [self._job_row(row) for row in rows]
+
+    @staticmethod
+    def _job_row(row):
+        job_id, session_id, params, state, progress, discovered, created_at, updated_at = row
+        return {
+            "job_id": job_id,
+            "session_id": session_id,
+            "params": json.loads(params),
+            "state": state,
+            "progress": progress,
+            "discovered": discovered,
+            "created_at": created_at,
+            "updated_at": updated_at,
+        }
+
+    # ------------------------------------------------------------------
+    # URL 목록 (frontier)
+    # ------------------------------------------------------------------
+    def add_urls(self, job_id, urls):
+        """수집한 URL 추가 (이미 있는 URL은 무시, 순서 유지)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COALESCE(MAX(position), -1) FROM frontier WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            position = row[0] + 1
+            self._conn.execute("BEGIN")
+            try:
+                for url in urls:
+                    cursor = self._conn.execute(
+                        "INSERT OR IGNORE INTO frontier (job_id, position, url) VALUES (?, ?, ?)",
+                        (job_id, position, url),
+                    )
+                    position += cursor.rowcount
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def mark_done(self, job_id, url):
+        self._execute("UPDATE frontier SET done = 1 WHERE job_id = ? AND url = ?", (job_id, url))
+
+    def all_urls(self, job_id):
+        rows = self._query("SELECT url FROM frontier WHERE job_id = ? ORDER BY position", (job_id,))
+        return [row[0] for row in rows]
+
+    def pending_urls(self, job_id):
+        rows = self._query(
+            "SELECT url FROM frontier WHERE job_id = ? AND done = 0 ORDER BY position", (job_id,)
+        )
+        return [row[0] for row in rows]
+
+    # ------------------------------------------------------------------
+    # 결과
+    # ------------------------------------------------------------------
+    def add_result(self, job_id, seq, info, url=None):
+        """결과 저장 + URL 처리 완료 표시 (하나의 트랜잭션)"""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO results (job_id, seq, data) VALUES (?, ?, ?)",
+                    (job_id, seq, json.dumps(info, ensure_ascii=False)),
+                )
+                if url is not None:
+                    self._conn.execute(
+                        "UPDATE frontier SET done = 1 WHERE job_id = ? AND url = ?", (job_id, url)
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def load_results(self, job_id):
+        rows = self._query("SELECT data FROM results WHERE job_id = ? ORDER BY seq", (job_id,))
+        return [json.loads(row[0]) for row in rows]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
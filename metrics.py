@@ -0,0 +1,244 @@
+import bisect
+import functools
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+# 단계별 소요 시간 히스토그램 구간 (초)
+STAGE_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0)
+RATE_WINDOW = 60  # 처리 속도(페이지/초, 이메일/분)를 계산하는 최근 구간(초)
+
+
+def _format_labels(labelnames, values, extra=()):
+    pairs = list(zip(labelnames, values)) + list(extra)
+    if not pairs:
+        return ""
+    escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, v in pairs)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + "}"
+
+
+def _format_value(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """증가만 하는 값 (레이블 조합별)"""
+
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def inc(self, amount=1, **labels):
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def values(self):
+        with self._lock:
+            return dict(self._values)
+
+    def lines(self):
+        for key, value in sorted(self.values().items()):
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Histogram:
+    """관측값 분포 (레이블 조합별 구간 개수 + 합계 + 개수)"""
+
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=STAGE_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._values = {}  # key -> [구간별 개수..., 합계, 개수]
+        self.listeners = []  # 관측값을 그대로 받아볼 함수 (value, labels) - 벤치마크의 백분위수 계산용
+
+    def observe(self, value, **labels):
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [0] * (len(self.buckets) + 2)
+            if index < len(self.buckets):
+                entry[index] += 1
+            entry[-2] += value
+            entry[-1] += 1
+        for listener in self.listeners:
+            listener(value, labels)
+
+    @contextmanager
+    def time(self, **labels):
+        """with 블록 실행 시간 기록 (예외가 나도 기록)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def timed(self, **labels):
+        """함수 실행 시간을 기록하는 데코레이터"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.time(**labels):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def lines(self):
+        with self._lock:
+            items = sorted((key, list(entry)) for key, entry in self._values.items())
+        for key, entry in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, entry):
+                cumulative += count
+                yield f"{self.name}_bucket{_format_labels(self.labelnames, key, [('le', _format_value(bound))])} {cumulative}"
+            yield f"{self.name}_bucket{_format_labels(self.labelnames, key, [('le', '+Inf')])} {entry[-1]}"
+            yield f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(entry[-2])}"
+            yield f"{self.name}_count{_format_labels(self.labelnames, key)} {entry[-1]}"
+
+
+class Gauge:
+    """조회 시점에 계산하는 값 (callback은 {레이블 값 튜플: 값} 또는 숫자 하나를 반환)"""
+
+    kind = "gauge"
+
+    def __init__(self, name, documentation, labelnames=(), callback=None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.callback = callback
+
+    def lines(self):
+        values = self.callback() if self.callback else {}
+        if not isinstance(values, dict):
+            values = {(): values}
+        for key, value in sorted(values.items()):
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class RecentRate:
+    """최근 RATE_WINDOW초 동안의 발생 횟수 (처리 속도 계산용)"""
+
+    def __init__(self, window=RATE_WINDOW):
+        self.window = window
+        self._lock = threading.Lock()
+        self._events = deque()  # (시각, 개수)
+        self._total = 0
+
+    def mark(self, amount=1):
+        now = time.monotonic()
+        with self._lock:
+            self._events.append((now, amount))
+            self._total += amount
+            self._trim(now)
+
+    def count(self):
+        with self._lock:
+            self._trim(time.monotonic())
+            return self._total
+
+    def per_second(self):
+        return self.count() / self.window
+
+    def _trim(self, now):
+        while self._events and self._events[0][0] <= now - self.window:
+            self._total -= self._events.popleft()[1]
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self):
+        """Prometheus 텍스트 형식 (text/plain; version=0.0.4)"""
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.lines())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+# 단계: driver_init, serp_page, detail_http, detail_load, detail_render, saramin_company_hop,
+#       saramin_detail, homepage_load, footer_scroll, extraction
+STAGE_SECONDS = REGISTRY.register(Histogram(
+    "crawler_stage_seconds", "단계별 소요 시간(초)", ("stage", "source"),
+))
+# kind: serp(검색 결과 페이지, 성공 = 링크 발견) / detail(상세 페이지, 성공 = 이메일 발견)
+PAGES_TOTAL = REGISTRY.register(Counter(
+    "crawler_pages_total", "처리한 페이지 수", ("kind", "source", "result"),
+))
+EMAILS_TOTAL = REGISTRY.register(Counter(
+    "crawler_emails_found_total", "상세 페이지에서 찾은 이메일 수", ("source",),
+))
+
+_page_rate = RecentRate()
+_email_rate = RecentRate()
+
+
+def _success_ratio():
+    totals = {}
+    for (kind, source, result), value in PAGES_TOTAL.values().items():
+        ok, total = totals.get((kind, source), (0, 0))
+        totals[(kind, source)] = (ok + (value if result == "ok" else 0), total + value)
+    return {key: ok / total for key, (ok, total) in totals.items() if total}
+
+
+REGISTRY.register(Gauge(
+    "crawler_success_ratio", "종류/출처별 성공 비율 (시작 이후 누적)", ("kind", "source"), _success_ratio,
+))
+REGISTRY.register(Gauge(
+    "crawler_pages_per_second", f"최근 {RATE_WINDOW}초 동안의 초당 처리 페이지 수", (), _page_rate.per_second,
+))
+REGISTRY.register(Gauge(
+    "crawler_emails_per_minute", f"최근 {RATE_WINDOW}초 기준 분당 이메일 발견 수",
+    (), lambda: _email_rate.count() * 60 / RATE_WINDOW,
+))
+
+
+def stage_timer(stage, source=""):
+    """with stage_timer("homepage_load", "saramin"): ... 형태로 단계 시간 기록"""
+    return STAGE_SECONDS.time(stage=stage, source=source)
+
+
+def record_serp_page(source, started, link_count, ready=True):
+    """검색 결과 페이지 하나 처리 기록 (started: time.perf_counter() 시작 시각)"""
+    STAGE_SECONDS.observe(time.perf_counter() - started, stage="serp_page", source=source)
+    PAGES_TOTAL.inc(kind="serp", source=source, result="ok" if ready and link_count else "fail")
+    _page_rate.mark()
+
+
+def record_detail_page(source, email_count):
+    """상세 페이지(회사 하나) 처리 기록"""
+    PAGES_TOTAL.inc(kind="detail", source=source, result="ok" if email_count else "fail")
+    if email_count:
+        EMAILS_TOTAL.inc(email_count, source=source)
+        _email_rate.mark(email_count)
+    _page_rate.mark()
+
+
+def register_gauge(name, documentation, callback, labelnames=()):
+    """앱 상태(드라이버 풀, 스케줄러 등)를 /metrics에 노출"""
+    return REGISTRY.register(Gauge(name, documentation, labelnames, callback))
+
+
+def render():
+    return REGISTRY.render()
@@ -0,0 +1,144 @@
+import os
+import threading
+import time
+from urllib.parse import urlparse
+
+
+# 한 페이지에서 기다릴 수 있는 최대 시간(초) - 여러 번 대기하더라도 합계가 이 값을 넘지 않음
+MAX_WAIT_PER_PAGE = float(os.environ.get('MAX_WAIT_PER_PAGE', 8))
+MIN_WAIT = 0.5          # 도메인 통계가 있어도 최소한 보장하는 대기 시간
+DEFAULT_WAIT = 4.0      # 처음 보는 도메인의 대기 시간
+POLL_INTERVAL = 0.1
+
+
+class WaitBudget:
+    """페이지 하나에 대한 대기 시간 예산 (여러 대기 단계가 공유)"""
+
+    def __init__(self, seconds=None):
+        self.deadline = time.monotonic() + (MAX_WAIT_PER_PAGE if seconds is None else seconds)
+
+    def remaining(self):
+        return max(0.0, self.deadline - time.monotonic())
+
+
+class DomainWaitStats:
+    """도메인별 로딩 시간을 학습해서 적응형 타임아웃 계산 (지수이동평균 + 편차)"""
+
+    def __init__(self, alpha=0.3):
+        self.alpha = alpha
+        self._lock = threading.Lock()
+        self._stats = {}  # domain -> {"mean": float, "dev": float, "count": int}
+
+    def record(self, domain, elapsed):
+        if not domain:
+            return
+        with self._lock:
+            stat = self._stats.get(domain)
+            if stat is None:
+                self._stats[domain] = {"mean": elapsed, "dev": elapsed / 2, "count": 1}
+                return
+            diff = elapsed - stat["mean"]
+            stat["mean"] += self.alpha * diff
+            stat["dev"] += self.alpha * (abs(diff) - stat["dev"])
+            stat["count"] += 1
+
+    def timeout_for(self, domain):
+        """이 도메인에서 기다릴 시간 (평균 + 3*편차, 최소~최대 범위로 제한)"""
+        with self._lock:
+            stat = self._stats.get(domain)
+        if stat is None:
+            return min(DEFAULT_WAIT, MAX_WAIT_PER_PAGE)
+        timeout = stat["mean"] + 3 * stat["dev"] + 0.3
+        return max(MIN_WAIT, min(timeout, MAX_WAIT_PER_PAGE))
+
+    def snapshot(self):
+        with self._lock:
+            return {domain: dict(stat) for domain, stat in self._stats.items()}
+
+
+domain_stats = DomainWaitStats()
+
+
+def _domain_of(driver):
+    try:
+        return urlparse(driver.current_url).netloc.lower()
+    except Exception:
+        return ""
+
+
+def _poll(condition, timeout):
+    """condition()이 참이 될 때까지 대기. 성공 여부 반환 (예외는 실패로 취급)"""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if condition():
+                return True
+        except Exception:
+            pass
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(POLL_INTERVAL)
+
+
+def _document_ready(driver):
+    return driver.execute_script("return document.readyState") == "complete"
+
+
+def _any_present(driver, selectors):
+    return driver.execute_script(
+        "return arguments[0].some(function (s) {"
+        "  try { return document.querySelector(s) !== null; } catch (e) { return false; }"
+        "});",
+        list(selectors),
+    )
+
+
+def wait_for_page(driver, selectors=None, budget=None):
+    """페이지 준비 대기 (document.readyState == complete + 지정한 요소 중 하나 등장)
+
+    고정 sleep 대신 조건이 만족되는 즉시 반환한다.
+    대기 시간은 도메인별 학습 값과 페이지 예산(budget) 중 작은 값으로 제한된다.
+    반환값: 조건 만족 여부
+    """
+    if isinstance(selectors, str):
+        selectors = [selectors]
+    budget = budget or WaitBudget()
+    domain = _domain_of(driver)
+    timeout = min(domain_stats.timeout_for(domain), budget.remaining())
+
+    started = time.monotonic()
+    ready = _poll(lambda: _document_ready(driver), timeout)
+    if ready and selectors:
+        remaining = max(0.0, timeout - (time.monotonic() - started))
+        ready = _poll(lambda: _any_present(driver, selectors), remaining)
+
+    elapsed = time.monotonic() - started
+    if ready:
+        domain_stats.record(domain, elapsed)
+    else:
+        # 타임아웃도 학습에 반영 (다음 방문 시 조금 더 기다리도록)
+        domain_stats.record(domain, timeout)
+    return ready
+
+
+def wait_for_settle(driver, budget=None, max_wait=2.0, quiet=0.3):
+    """스크롤 후 지연 로딩되는 내용이 멈출 때까지 대기 (문서 높이와 텍스트 길이가 quiet초 동안 변하지 않으면 종료)"""
+    budget = budget or WaitBudget()
+    timeout = min(max_wait, budget.remaining())
+    deadline = time.monotonic() + timeout
+    last = None
+    stable_since = time.monotonic()
+    while time.monotonic() < deadline:
+        try:
+            current = driver.execute_script(
+                "return [document.documentElement.scrollHeight, (document.body && document.body.innerText || '').length];"
+            )
+        except Exception:
+            return False
+        if current != last:
+            last = current
+            stable_since = time.monotonic()
+        elif time.monotonic() - stable_since >= quiet:
+            return True
+        time.sleep(POLL_INTERVAL)
+    return False
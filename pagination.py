@@ -0,0 +1,115 @@
+import threading
+
+
+PAGINATION_MIN_YIELD = 1.0  # 페이지당 새 고유 링크(평활값)가 이보다 적으면 그 출처는 중단
+PAGINATION_SMOOTHING = 0.5  # 수율 평활 계수 (최근 페이지 비중)
+CONVERSION_PRIOR = 0.3  # 상세 페이지가 아직 적을 때 쓰는 이메일 발견 비율 추정값
+CONVERSION_PRIOR_WEIGHT = 10  # 추정값을 상세 페이지 몇 개 분량으로 취급할지
+COVERAGE_MARGIN = 1.2  # 남은 목표 x 이 배수만큼 이메일이 기대되면 검색 중단
+
+
+def expected_emails_cover(target, emails, processed, pending):
+    """대기 중인 URL만으로 남은 이메일 목표를 채울 수 있을 것으로 보이는지
+
+    target: 목표 이메일 수 (0이면 무제한 - 항상 False)
+    emails / processed: 지금까지 찾은 이메일 수 / 처리한 상세 페이지 수
+    pending: 아직 처리하지 않은 URL 수
+    """
+    if target <= 0:
+        return False
+    remaining = target - emails
+    if remaining <= 0:
+        return True
+    rate = (emails + CONVERSION_PRIOR * CONVERSION_PRIOR_WEIGHT) / (processed + CONVERSION_PRIOR_WEIGHT)
+    return pending * rate >= remaining * COVERAGE_MARGIN
+
+
+class PaginationController:
+    """여러 출처가 나눠 쓰는 검색 페이지 예산 (새 고유 링크 수율 기반)
+
+    - budget: 모든 출처 합계 페이지 수, 출처마다 budget / 출처 수 만큼은 다른 출처가 가져가지 못하게 남겨 둠
+    - 수율이 min_yield 아래로 떨어지거나 다음 페이지가 없는 출처는 중단되고, 쓰지 않은 몫은
+      아직 수율이 좋은 출처가 이어서 사용한다
+    - min_pages: 수율과 관계없이 출처마다 보는 최소 페이지 수 / max_pages: 출처별 최대 페이지 수
+    - covered(): 참이면 (대기 URL로 목표를 채울 수 있으면) 모든 출처 중단
+    여러 스레드(출처별 수집)에서 동시에 호출해도 된다.
+    """
+
+    def __init__(self, sources, budget, min_pages=1, max_pages=0, min_yield=PAGINATION_MIN_YIELD,
+                 smoothing=PAGINATION_SMOOTHING, covered=None):
+        self.budget = budget
+        self.min_pages = min_pages
+        self.max_pages = max_pages
+        self.min_yield = min_yield
+        self.smoothing = smoothing
+        self.covered = covered
+        self._lock = threading.Lock()
+        self._stats = {name: {"pages": 0, "browser_pages": 0, "links": 0, "yield": None, "done": False, "reason": ""}
+                       for name in sources}
+        self._share = budget / max(1, len(self._stats))
+
+    def allow(self, source):
+        """source의 다음 페이지를 방문해도 되는지 (허용하면 예산에서 한 페이지 차감)"""
+        if self.covered is not None and self.covered():
+            self.finish_all("목표 충족 예상")
+            return False
+        with self._lock:
+            stats = self._stats[source]
+            if stats["done"]:
+                return False
+            if stats["pages"] >= self.min_pages:
+                if self.max_pages and stats["pages"] >= self.max_pages:
+                    return self._finish(stats, "최대 페이지")
+                if stats["yield"] is not None and stats["yield"] < self.min_yield:
+                    return self._finish(stats, f"수율 {stats['yield']:.1f}")
+                used = sum(s["pages"] for s in self._stats.values())
+                reserved = sum(max(0.0, self._share - s["pages"])
+                               for name, s in self._stats.items() if name != source and not s["done"])
+                if used + 1 + reserved > self.budget:
+                    return self._finish(stats, "예산 소진")
+            stats["pages"] += 1
+            return True
+
+    def refund(self, source):
+        """allow로 받았지만 방문하지 못한 페이지를 예산에 돌려줌"""
+        with self._lock:
+            stats = self._stats[source]
+            stats["pages"] = max(0, stats["pages"] - 1)
+
+    def record(self, source, new_links, has_next=True, browser=False):
+        """방문한 페이지의 새 고유 링크 수 기록 (browser: 캐시/HTTP가 아니라 브라우저로 연 페이지인지)"""
+        with self._lock:
+            stats = self._stats[source]
+            stats["links"] += new_links
+            if browser:
+                stats["browser_pages"] += 1
+            previous = stats["yield"]
+            stats["yield"] = new_links if previous is None else self.smoothing * new_links + (1 - self.smoothing) * previous
+            # 다음 페이지 버튼은 선택자가 바뀌어도 기본 몫까지는 계속 보도록 몫을 넘은 뒤에만 확인
+            if not has_next and stats["pages"] >= self._share:
+                self._finish(stats, "마지막 페이지")
+
+    def finish(self, source, reason="중단"):
+        with self._lock:
+            self._finish(self._stats[source], reason)
+
+    def finish_all(self, reason):
+        with self._lock:
+            for stats in self._stats.values():
+                self._finish(stats, reason)
+
+    def pages_used(self):
+        with self._lock:
+            return sum(s["pages"] for s in self._stats.values())
+
+    def summary(self):
+        """출처별 {"pages", "browser_pages", "links", "yield", "done", "reason"}"""
+        with self._lock:
+            return {name: dict(stats) for name, stats in self._stats.items()}
+
+    @staticmethod
+    def _finish(stats, reason):
+        if not stats["done"]:
+            stats["done"] = True
+            stats["reason"] = reason
+        return False
@@ -0,0 +1,80 @@
+import os
+
+
+# 차단할 리소스 묶음 (CDP Network.setBlockedURLs 패턴, *는 임의 문자열)
+BLOCK_GROUPS = {
+    "images": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.bmp", "*.ico", "*.svg"],
+    "fonts": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    "media": ["*.mp4", "*.webm", "*.m3u8", "*.ts?*", "*.mp3", "*.m4a", "*.ogg", "*.wav", "*.mov", "*.avi"],
+    "stylesheets": ["*.css", "*.css?*"],
+    "trackers": [
+        "*google-analytics.com*", "*googletagmanager.com*", "*googlesyndication.com*",
+        "*doubleclick.net*", "*googleadservices.com*", "*adservice.google.*",
+        "*facebook.net*", "*connect.facebook.com*", "*analytics.tiktok.com*",
+        "*wcs.naver.net*", "*wcs.naver.com*", "*adcr.naver.com*", "*nstat.naver.com*",
+        "*t1.daumcdn.net/kas*", "*kakaopixel*", "*pixel.kakao*",
+        "*criteo.com*", "*criteo.net*", "*hotjar.com*", "*clarity.ms*",
+        "*mixpanel.com*", "*amplitude.com*", "*channel.io*", "*beusable.net*", "*acecounter.com*",
+    ],
+}
+
+# 출처별 기본 차단 묶음 (텍스트, 링크, footer HTML만 읽으므로 화면 표시용 리소스는 받지 않음)
+# 채용 사이트는 CSS가 없으면 레이아웃/지연 로딩이 달라질 수 있어서 스타일시트는 허용
+DEFAULT_PROFILES = {
+    "naver": ("images", "fonts", "media", "trackers"),
+    "daum": ("images", "fonts", "media", "trackers"),
+    "saramin": ("images", "fonts", "media", "trackers"),
+    "jobkorea": ("images", "fonts", "media", "trackers"),
+    "albamon": ("images", "fonts", "media", "trackers"),
+    "web": ("images", "fonts", "media", "trackers", "stylesheets"),  # 회사 홈페이지
+}
+
+# BLOCK_RESOURCES=0 이면 차단하지 않음
+# BLOCK_RESOURCES_<출처>=images,fonts 처럼 출처별로 차단 묶음을 바꿀 수 있음 (빈 값이면 그 출처는 차단 안 함)
+ENABLED = os.environ.get('BLOCK_RESOURCES', '1') != '0'
+
+
+def _load_profiles():
+    profiles = {}
+    for source, groups in DEFAULT_PROFILES.items():
+        override = os.environ.get(f'BLOCK_RESOURCES_{source.upper()}')
+        if override is not None:
+            groups = tuple(g.strip() for g in override.split(",") if g.strip() in BLOCK_GROUPS)
+        profiles[source] = groups if ENABLED else ()
+    return profiles
+
+
+PROFILES = _load_profiles()
+
+
+def blocked_patterns(source):
+    """출처별 차단 URL 패턴 목록 (알 수 없는 출처는 일반 홈페이지 기준)"""
+    groups = PROFILES.get(source, PROFILES["web"])
+    return [pattern for group in groups for pattern in BLOCK_GROUPS[group]]
+
+
+def chrome_prefs():
+    """모든 출처에서 차단하는 리소스는 브라우저 설정으로도 꺼둠 (요청 자체를 만들지 않음)"""
+    prefs = {"profile.default_content_setting_values.notifications": 2}
+    if all("images" in groups for groups in PROFILES.values()):
+        prefs["profile.managed_default_content_settings.images"] = 2
+    return prefs
+
+
+def apply_profile(driver, source):
+    """이 드라이버로 다음에 여는 페이지부터 source 출처의 차단 목록 적용
+
+    드라이버마다 마지막으로 적용한 출처를 기억해서 같으면 CDP 호출을 생략한다.
+    CDP를 지원하지 않는 드라이버에서는 아무 일도 하지 않는다.
+    """
+    if getattr(driver, "_resource_profile", None) == source:
+        return
+    try:
+        if not getattr(driver, "_network_enabled", False):
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver._network_enabled = True
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_patterns(source)})
+        driver._resource_profile = source
+    except Exception as e:
+        print(f"[리소스 차단] 적용 실패 ({source}): {e}")
+        driver._resource_profile = source  # 같은 드라이버에서 매번 실패 로그를 남기지 않음
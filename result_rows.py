@@ -0,0 +1,47 @@
+import threading
+
+
+class ResultRows:
+    """세션 결과 행 저장소 (뒤에 추가만 가능)
+
+    행 번호는 추가된 순서대로 고정되므로 since 커서로 새 행만 잘라서 줄 수 있다.
+    조회할 때 전체 목록을 복사하지 않고 요청한 구간만 꺼낸다.
+    """
+
+    def __init__(self, rows=None):
+        self._rows = []
+        self._lock = threading.Lock()
+        self.email_count = 0  # 이메일이 있는 행 수
+        for row in rows or ():
+            self.append(row)
+
+    def append(self, row):
+        """행 추가 후 전체 행 수 반환"""
+        with self._lock:
+            self._rows.append(row)
+            if row.get("이메일") and row["이메일"] != "-":
+                self.email_count += 1
+            return len(self._rows)
+
+    def since(self, cursor=0, limit=None):
+        """cursor번째 행부터 최대 limit개 (limit이 None이면 끝까지)
+
+        반환값: (행 목록, 다음 cursor)
+        """
+        with self._lock:
+            total = len(self._rows)
+        start = min(max(0, cursor), total)
+        end = total if limit is None else min(total, start + max(0, limit))
+        return self._rows[start:end], end
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __bool__(self):
+        return bool(self._rows)
+
+    def __iter__(self):
+        # 순회 시작 시점까지 추가된 행만 (순회 중 추가되는 행은 제외)
+        rows = self._rows
+        for i in range(len(rows)):
+            yield rows[i]
@@ -0,0 +1,167 @@
+import heapq
+import itertools
+import threading
+import time
+import traceback
+
+
+# 예약 작업 상태
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_FINISHED = "finished"
+JOB_CANCELLED = "cancelled"
+
+ACTIVE_STATES = (JOB_QUEUED, JOB_RUNNING)
+
+
+class QuotaExceeded(Exception):
+    """대기열이 가득 찼거나 사용자별 작업 수 제한을 넘음"""
+
+
+class JobScheduler:
+    """크롤링 작업 대기열 + 고정 개수의 실행 스레드
+
+    - max_running: 동시에 실행할 작업 수 (작업마다 브라우저가 최소 1개 필요하므로 드라이버 풀 크기 이하)
+    - user_quota: 사용자별로 대기/실행 중일 수 있는 작업 수
+    - max_queued: 전체 대기 작업 수 제한
+    우선순위(priority)가 높은 작업부터, 같으면 먼저 들어온 순서대로 실행한다.
+    run(job_id, payload)는 실행 스레드에서 호출되며 작업이 끝날 때까지 반환하지 않아야 한다.
+    on_forget(job_id)는 끝난 작업이 보관 개수(history)를 넘어 목록에서 빠질 때 호출된다 (작업별 메모리 정리용).
+    """
+
+    def __init__(self, run, max_running=1, user_quota=5, max_queued=100, history=500, on_forget=None):
+        self._run = run
+        self.max_running = max(1, max_running)
+        self.user_quota = user_quota
+        self.max_queued = max_queued
+        self.history = history  # 끝난 작업 정보를 보관할 개수
+        self.on_forget = on_forget
+        self._cond = threading.Condition()
+        self._heap = []  # (-priority, 순번, job_id)
+        self._seq = itertools.count()
+        self._jobs = {}  # job_id -> 작업 정보 (추가 순서 유지)
+        self._threads = []
+
+    def check_quota(self, owner, count=1):
+        """작업 count개를 더 넣을 수 있는지 확인 (넣을 수 없으면 QuotaExceeded)"""
+        with self._cond:
+            self._check_quota(owner, count)
+
+    def submit(self, job_id, owner, payload, priority=0):
+        """작업을 대기열에 추가 (제한 초과 시 QuotaExceeded)
+
+        반환값: (대기 순번(0부터), 바로 실행되는지) - 순번이 0이어도 실행 슬롯이 모두 차 있으면 대기한다
+        """
+        with self._cond:
+            self._check_quota(owner, 1)
+            self._jobs[job_id] = {
+                "job_id": job_id,
+                "owner": owner,
+                "priority": priority,
+                "state": JOB_QUEUED,
+                "payload": payload,
+                "submitted_at": time.time(),
+                "started_at": None,
+                "finished_at": None,
+            }
+            heapq.heappush(self._heap, (-priority, next(self._seq), job_id))
+            self._start_threads()
+            self._cond.notify()
+            position = self._position(job_id)
+            running = sum(1 for job in self._jobs.values() if job["state"] == JOB_RUNNING)
+            return position, running + position < self.max_running
+
+    def cancel(self, job_id):
+        """작업 취소 - 취소 전 상태 반환 (없는 작업이면 None)
+
+        대기 중인 작업은 대기열에서 빠지고, 실행 중인 작업은 호출한 쪽에서 정지시켜야 한다.
+        """
+        with self._cond:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            previous = job["state"]
+            if previous == JOB_QUEUED:
+                job["state"] = JOB_CANCELLED
+                job["finished_at"] = time.time()
+            return previous
+
+    def get(self, job_id):
+        with self._cond:
+            job = self._jobs.get(job_id)
+            return self._public(job) if job else None
+
+    def list_jobs(self, owner=None):
+        with self._cond:
+            return [self._public(job) for job in self._jobs.values() if owner is None or job["owner"] == owner]
+
+    def stats(self):
+        with self._cond:
+            states = [job["state"] for job in self._jobs.values()]
+            return {
+                "max_running": self.max_running,
+                "running": states.count(JOB_RUNNING),
+                "queued": states.count(JOB_QUEUED),
+            }
+
+    # ------------------------------------------------------------------
+    # 내부 처리
+    # ------------------------------------------------------------------
+    def _check_quota(self, owner, count):
+        queued = sum(1 for job in self._jobs.values() if job["state"] == JOB_QUEUED)
+        if queued + count > self.max_queued:
+            raise QuotaExceeded(f"대기 중인 작업이 너무 많습니다 (최대 {self.max_queued}개).")
+        active = sum(1 for job in self._jobs.values() if job["owner"] == owner and job["state"] in ACTIVE_STATES)
+        if self.user_quota and active + count > self.user_quota:
+            raise QuotaExceeded(f"사용자당 대기/실행 작업은 최대 {self.user_quota}개입니다 (현재 {active}개).")
+
+    def _start_threads(self):
+        while len(self._threads) < self.max_running:
+            thread = threading.Thread(target=self._worker, name=f"scheduler-{len(self._threads)}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                job = None
+                while job is None:
+                    while not self._heap:
+                        self._cond.wait()
+                    _, _, job_id = heapq.heappop(self._heap)
+                    candidate = self._jobs.get(job_id)
+                    if candidate is not None and candidate["state"] == JOB_QUEUED:
+                        job = candidate  # 취소된 작업은 건너뜀
+                job["state"] = JOB_RUNNING
+                job["started_at"] = time.time()
+
+            try:
+                self._run(job["job_id"], job["payload"])
+            except Exception:
+                print(f"[스케줄러] 작업 {job['job_id']} 실행 오류: {traceback.format_exc()}")
+            finally:
+                with self._cond:
+                    job["state"] = JOB_FINISHED
+                    job["finished_at"] = time.time()
+                    self._prune()
+
+    def _position(self, job_id):
+        """대기 중인 작업 중 앞에 있는 작업 수"""
+        waiting = sorted(entry for entry in self._heap
+                         if entry[2] in self._jobs and self._jobs[entry[2]]["state"] == JOB_QUEUED)
+        for position, entry in enumerate(waiting):
+            if entry[2] == job_id:
+                return position
+        return None
+
+    def _prune(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job["state"] not in ACTIVE_STATES]
+        for job_id in finished[:max(0, len(finished) - self.history)]:
+            del self._jobs[job_id]
+            if self.on_forget is not None:
+                self.on_forget(job_id)
+
+    def _public(self, job):
+        info = {key: value for key, value in job.items() if key != "payload"}
+        info["position"] = self._position(job["job_id"]) if job["state"] == JOB_QUEUED else None
+        return info
@@ -0,0 +1,141 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    namespace    TEXT NOT NULL,
+    key          TEXT NOT NULL,
+    value        TEXT NOT NULL,
+    expires_at   REAL NOT NULL,
+    accessed_at  REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS cache_entries_lru ON cache_entries (namespace, accessed_at);
+"""
+
+
+class TTLCache:
+    """TTL + LRU 캐시 (메모리 LRU 앞단 + SQLite 영구 저장, 세션/재시작 간 공유)
+
+    - ttl: 항목 유효 시간(초), set() 호출 시 항목별로 다르게 줄 수 있음
+    - max_entries: 메모리에 유지할 최대 항목 수 (초과 시 가장 오래 안 쓴 항목 제거)
+    - max_disk_entries: 디스크에 유지할 최대 항목 수 (0이면 제한 없음)
+    - path가 None이면 메모리 전용
+    """
+
+    def __init__(self, namespace, path=None, ttl=3600, max_entries=10000, max_disk_entries=0):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()  # key -> (expires_at, value)
+        self._conn = None
+        self._writes = 0
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None and self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT value, expires_at FROM cache_entries WHERE namespace = ? AND key = ?",
+                    (self.namespace, key),
+                ).fetchone()
+                if row is not None:
+                    entry = (row[1], json.loads(row[0]))
+                    self._remember(key, entry)
+
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    self._forget(key)
+                self.misses += 1
+                return None
+
+            self._memory.move_to_end(key)
+            if self._conn is not None:
+                self._conn.execute(
+                    "UPDATE cache_entries SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                    (now, self.namespace, key),
+                )
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value, ttl=None):
+        now = time.time()
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._remember(key, (expires_at, value))
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache_entries (namespace, key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                    (self.namespace, key, json.dumps(value, ensure_ascii=False), expires_at, now),
+                )
+                self._writes += 1
+                # 쓰기 100번마다 만료 항목 정리 + 디스크 크기 제한
+                if self._writes % 100 == 0:
+                    self._prune(now)
+
+    def delete(self, key):
+        with self._lock:
+            self._forget(key)
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            disk = None
+            if self._conn is not None:
+                disk = self._conn.execute(
+                    "SELECT COUNT(*) FROM cache_entries WHERE namespace = ?", (self.namespace,)
+                ).fetchone()[0]
+            return {
+                "namespace": self.namespace,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0,
+                "memory_entries": len(self._memory),
+                "disk_entries": disk,
+            }
+
+    # ------------------------------------------------------------------
+    # 내부 처리 (락을 잡은 상태에서 호출)
+    # ------------------------------------------------------------------
+    def _remember(self, key, entry):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _forget(self, key):
+        self._memory.pop(key, None)
+        if self._conn is not None:
+            self._conn.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND key = ?", (self.namespace, key)
+            )
+
+    def _prune(self, now):
+        self._conn.execute(
+            "DELETE FROM cache_entries WHERE namespace = ? AND expires_at <= ?", (self.namespace, now)
+        )
+        if self.max_disk_entries:
+            self._conn.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND key IN ("
+                "  SELECT key FROM cache_entries WHERE namespace = ?"
+                "  ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.namespace, self.namespace, self.max_disk_entries),
+            )
@@ -0,0 +1,121 @@
+import re
+from urllib.parse import parse_qsl, unquote, urlencode, urlparse, urlunparse
+
+
+# 두 단계 공개 접미사 (이 앞의 라벨까지 포함해야 회사 도메인이 됨)
+MULTI_LEVEL_SUFFIXES = {
+    "co.kr", "or.kr", "go.kr", "ac.kr", "ne.kr", "re.kr", "pe.kr", "ms.kr",
+    "hs.kr", "es.kr", "sc.kr", "kg.kr", "mil.kr",
+    "seoul.kr", "busan.kr", "daegu.kr", "incheon.kr", "gwangju.kr", "daejeon.kr",
+    "ulsan.kr", "gyeonggi.kr", "gangwon.kr", "chungbuk.kr", "chungnam.kr",
+    "jeonbuk.kr", "jeonnam.kr", "gyeongbuk.kr", "gyeongnam.kr", "jeju.kr",
+    "co.jp", "ne.jp", "or.jp", "com.cn", "net.cn", "com.tw", "com.hk",
+    "co.uk", "org.uk", "com.au", "com.sg", "com.vn", "co.id", "com.my",
+}
+
+# 여러 회사가 하위 도메인으로 나눠 쓰는 호스팅 서비스 (하위 도메인 하나가 회사 하나)
+SHARED_HOSTING_SUFFIXES = {
+    "cafe24.com", "mycafe24.com", "imweb.me", "modoo.at", "sixshop.com",
+    "creatorlink.net", "wixsite.com", "blogspot.com", "github.io", "webflow.io",
+    "netlify.app", "vercel.app", "firebaseapp.com", "web.app", "godomall.com",
+}
+
+# 광고 클릭 추적 URL 호스트 (실제 랜딩 페이지로 풀어서 사용해야 함)
+AD_REDIRECT_HOSTS = ("adcr.naver.com", "ader.naver.com")
+
+# 리다이렉트 래퍼의 목적지가 들어 있는 쿼리 파라미터
+REDIRECT_PARAMS = ("u", "url", "target", "to", "dest", "redirect", "redirect_url", "link")
+REDIRECT_PATH = re.compile(r'/(?:redirect|link|out|click|go|bridge)(?:\.\w+)?/?$', re.IGNORECASE)
+
+# 방문할 때 의미 없는 추적용 쿼리 파라미터 (네이버 파워링크, 구글/메타 광고, utm_*)
+TRACKING_PARAMS = {
+    "n_media", "n_query", "n_rank", "n_ad_group", "n_ad", "n_keyword_id", "n_keyword",
+    "n_campaign_type", "n_contract", "n_ad_group_type", "napm",
+    "gclid", "fbclid", "dclid", "yclid", "msclkid", "igshid", "_ga", "mc_cid", "mc_eid",
+}
+TRACKING_PREFIXES = ("utm_",)
+
+# 회사 식별 정보가 경로/쿼리에 들어 있는 사이트 (도메인 단위로 합치면 안 됨)
+PORTAL_DOMAINS = ("saramin.co.kr", "jobkorea.co.kr", "albamon.com")
+
+
+def _host(parsed):
+    return (parsed.hostname or "").lower().rstrip(".")
+
+
+def registrable_domain(host):
+    """호스트의 등록 도메인 (www.shop.example.co.kr -> example.co.kr, abc.cafe24.com -> abc.cafe24.com)"""
+    host = host.lower().rstrip(".")
+    if host.startswith("www."):
+        host = host[4:]
+    if not host or re.fullmatch(r'[\d.]+|\[[0-9a-f:]+\]', host):
+        return host
+    labels = host.split(".")
+    for suffixes in (SHARED_HOSTING_SUFFIXES, MULTI_LEVEL_SUFFIXES):
+        for size in (3, 2):
+            if len(labels) > size and ".".join(labels[-size:]) in suffixes:
+                return ".".join(labels[-(size + 1):])
+    return ".".join(labels[-2:])
+
+
+def is_tracking_param(name):
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def canonical_url(url):
+    """방문용 정규화 URL (호스트 소문자, 기본 포트/fragment/추적 파라미터 제거, 끝 슬래시 정리)"""
+    parsed = urlparse(url.strip())
+    host = _host(parsed)
+    if not host:
+        return url.strip()
+    try:
+        port = parsed.port
+    except ValueError:
+        port = None
+    netloc = f"{host}:{port}" if port and port not in (80, 443) else host
+    query = urlencode([(k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True) if not is_tracking_param(k)])
+    path = parsed.path or "/"
+    if path != "/":
+        path = path.rstrip("/") or "/"
+    return urlunparse((parsed.scheme.lower() or "http", netloc, path, "", query, ""))
+
+
+def dedup_key(url):
+    """같은 회사로 취급할 URL 묶음의 키
+
+    일반 회사 사이트는 등록 도메인 단위 (http/https, www, 하위 페이지, 추적 파라미터 차이 무시),
+    채용 사이트는 회사 식별 정보가 있는 경로+쿼리 단위 (사람인은 csn 기준).
+    """
+    parsed = urlparse(canonical_url(url))
+    domain = registrable_domain(_host(parsed))
+    if domain == "saramin.co.kr":
+        csn = dict(parse_qsl(parsed.query)).get("csn")
+        if csn:
+            return f"saramin:{csn}"
+    if domain in PORTAL_DOMAINS:
+        query = urlencode(sorted(parse_qsl(parsed.query)))
+        return f"{domain}{parsed.path.lower()}?{query}"
+    return domain
+
+
+def is_redirect_wrapper(url):
+    """광고/리다이렉트 래퍼 URL인지 (목적지로 풀어야 실제 회사 사이트가 나옴)"""
+    parsed = urlparse(url)
+    host = _host(parsed)
+    if any(host == h or host.endswith("." + h) for h in AD_REDIRECT_HOSTS):
+        return True
+    return bool(REDIRECT_PATH.search(parsed.path)) and unwrap_redirect_param(url) is not None
+
+
+def unwrap_redirect_param(url):
+    """쿼리 파라미터에 목적지 URL이 그대로 들어 있으면 꺼냄 (없으면 None)"""
+    for name, value in parse_qsl(urlparse(url).query):
+        if name.lower() not in REDIRECT_PARAMS:
+            continue
+        value = value.strip()
+        if "://" not in value:
+            value = unquote(value)  # 이중 인코딩
+        if value.lower().startswith(("http://", "https://")):
+            return value
+    return None